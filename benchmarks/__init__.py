@@ -0,0 +1,6 @@
+"""
+DBF2SQL Benchmarks
+
+Synthetic DBF generator and reproducible throughput benchmarks. Run with
+``python -m benchmarks --help`` from the repository root.
+"""
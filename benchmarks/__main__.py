@@ -0,0 +1,182 @@
+"""
+Benchmark command line interface.
+
+Usage:
+    python -m benchmarks generate --rows 1000000 --output-dir data
+    python -m benchmarks run --rows 200000 --save-baseline main
+    python -m benchmarks compare main
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from .dbfgen import DEFAULT_FIELDS, generate
+from .suite import (
+    BENCHMARKS,
+    baseline_path,
+    compare,
+    format_results,
+    load_results,
+    run_suite,
+    save_results,
+)
+
+
+def main() -> None:
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the DBF to SQL converter"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_data_options(command: argparse.ArgumentParser, rows: int) -> None:
+        command.add_argument(
+            "--rows", type=int, default=rows, help=f"Records per file (default: {rows})"
+        )
+        command.add_argument(
+            "--fields",
+            default=DEFAULT_FIELDS,
+            help="Field mix of type letters with optional widths, e.g. C:30,N:12.2,D,L,M "
+            f"(types C N F D L M I T Y; default: {DEFAULT_FIELDS})",
+        )
+        command.add_argument(
+            "--codepage", default="cp1252", help="Codepage of text fields (default: cp1252)"
+        )
+        command.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+
+    generate_command = commands.add_parser("generate", help="Write a synthetic DBF file")
+    add_data_options(generate_command, 1_000_000)
+    generate_command.add_argument(
+        "--deleted",
+        type=float,
+        default=0.0,
+        help="Fraction of records flagged as deleted (default: 0)",
+    )
+    generate_command.add_argument(
+        "--output-dir", default=".", help="Directory to write into (default: .)"
+    )
+    generate_command.add_argument("--name", help="File name without extension")
+
+    def add_run_options(command: argparse.ArgumentParser) -> None:
+        add_data_options(command, 200_000)
+        command.add_argument(
+            "--repeat", type=int, default=3, help="Timed rounds per benchmark (default: 3)"
+        )
+        command.add_argument(
+            "--batch-size", type=int, default=1000, help="Converter batch size (default: 1000)"
+        )
+        command.add_argument(
+            "--engine", default="python", help="Engine of the convert benchmark (default: python)"
+        )
+        command.add_argument("--dialect", default="generic", help="SQL dialect (default: generic)")
+        add_selection_options(command)
+
+    def add_selection_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument(
+            "--only",
+            type=lambda value: value.split(","),
+            help=f"Comma-separated benchmarks to run (default: all of {', '.join(BENCHMARKS)})",
+        )
+        command.add_argument("--workdir", help="Directory for temporary files")
+
+    run_command = commands.add_parser("run", help="Run the benchmarks")
+    add_run_options(run_command)
+    run_command.add_argument("--output", help="Write the results to this JSON file")
+    run_command.add_argument(
+        "--save-baseline",
+        metavar="NAME",
+        help="Store the results as benchmarks/baselines/NAME.json",
+    )
+
+    compare_command = commands.add_parser(
+        "compare", help="Compare results with a baseline; exit 1 on a regression"
+    )
+    compare_command.add_argument("baseline", help="Baseline name or results file")
+    compare_command.add_argument(
+        "current", nargs="?", help="Results file to check (default: run the benchmarks now)"
+    )
+    compare_command.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed drop in rows/s, as a fraction (default: 0.10)",
+    )
+    add_selection_options(compare_command)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        try:
+            dbf_path = generate(
+                args.output_dir,
+                args.rows,
+                args.fields,
+                args.codepage,
+                args.deleted,
+                args.seed,
+                args.name,
+            )
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Wrote {dbf_path} ({Path(dbf_path).stat().st_size:,} bytes)")
+        return
+
+    baseline = None
+    if args.command == "compare":
+        path = baseline_path(args.baseline)
+        if not path.exists():
+            print(f"Error: baseline not found: {path}")
+            sys.exit(1)
+        baseline = load_results(path)
+
+    if args.command == "compare" and args.current:
+        current = load_results(Path(args.current))
+    else:
+        if baseline is not None:
+            # Rerun with the parameters the baseline was measured with
+            meta = baseline["meta"]
+            for key in ("rows", "fields", "codepage", "seed", "repeat", "batch_size", "engine"):
+                setattr(args, key, meta[key])
+            args.dialect = meta["dialect"]
+            args.only = args.only or list(baseline["results"])
+        try:
+            current = run_suite(
+                rows=args.rows,
+                fields=args.fields,
+                codepage=args.codepage,
+                seed=args.seed,
+                repeat=args.repeat,
+                batch_size=args.batch_size,
+                engine=args.engine,
+                dialect=args.dialect,
+                only=args.only,
+                workdir=args.workdir,
+            )
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print("\n".join(format_results(current)))
+
+    if args.command == "run":
+        if args.output:
+            save_results(current, Path(args.output))
+        if args.save_baseline:
+            path = baseline_path(args.save_baseline)
+            save_results(current, path)
+            print(f"Saved baseline {path}")
+        return
+
+    assert baseline is not None
+    lines, regressions = compare(baseline, current, args.tolerance)
+    print("\n" + "\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: ", end="")
+        print(", ".join(regressions))
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
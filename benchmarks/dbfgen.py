@@ -0,0 +1,301 @@
+"""
+Synthetic DBF Generator
+
+Writes reproducible DBF files of any size for benchmarking: the field mix,
+widths, codepage, share of deleted records and random seed are configurable,
+and the same arguments always produce the same bytes.
+"""
+
+import datetime
+import random
+import struct
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+DEFAULT_FIELDS = "C:30,N:10,N:12.2,F:16.4,D,L,I,T,Y"
+
+# Default length and decimal count of each supported field type
+FIELD_DEFAULTS = {
+    "C": (20, 0),
+    "N": (10, 0),
+    "F": (16, 4),
+    "D": (8, 0),
+    "L": (1, 0),
+    "M": (4, 0),
+    "I": (4, 0),
+    "T": (8, 0),
+    "Y": (8, 4),
+}
+
+# Field types that only exist in Visual FoxPro tables
+VFP_TYPES = set("MITY")
+
+# Language driver IDs stored at header offset 29
+LANGUAGE_DRIVERS = {
+    "cp437": 0x01,
+    "cp850": 0x02,
+    "cp1252": 0x03,
+    "cp852": 0x64,
+    "cp866": 0x65,
+    "cp1250": 0xC8,
+    "cp1251": 0xC9,
+    "cp1254": 0xCA,
+    "cp1253": 0xCB,
+}
+
+# Distinct values generated per field; records pick from these pools
+POOL_SIZE = 1009
+
+MEMO_BLOCK_SIZE = 64
+
+# Fixed header date so identical arguments give identical files
+HEADER_DATE = (124, 1, 1)
+
+JULIAN_DAY_OFFSET = 1721425
+
+
+class FieldSpec(NamedTuple):
+    """Definition of one generated field."""
+
+    name: str
+    type: str
+    length: int
+    decimal: int
+
+
+def parse_fields(spec: str) -> List[FieldSpec]:
+    """
+    Parse a field mix such as "C:30,N:12.2,D,L,M".
+
+    Each entry is a type letter, optionally followed by ":length" or
+    ":length.decimals". Fields are named after their type and position,
+    e.g. C01, N02.
+
+    Args:
+        spec: Comma-separated field entries
+
+    Returns:
+        List of field definitions
+
+    Raises:
+        ValueError: For unknown types or invalid widths
+    """
+    fields: List[FieldSpec] = []
+    for index, entry in enumerate(part.strip() for part in spec.split(",") if part.strip()):
+        field_type, _, width = entry.partition(":")
+        field_type = field_type.upper()
+        if field_type not in FIELD_DEFAULTS:
+            raise ValueError(
+                f"Unknown field type: {field_type!r} (expected one of {''.join(FIELD_DEFAULTS)})"
+            )
+
+        length, decimal = FIELD_DEFAULTS[field_type]
+        if width and field_type in "CNF":
+            length_text, _, decimal_text = width.partition(".")
+            length = int(length_text)
+            decimal = int(decimal_text) if decimal_text else 0
+        if not 0 < length <= (65535 if field_type == "C" else 255):
+            raise ValueError(f"Invalid length for field type {field_type}: {length}")
+        if field_type in "NF" and decimal and decimal > length - 2:
+            raise ValueError(f"Too many decimals for a {field_type} field of length {length}")
+
+        fields.append(FieldSpec(f"{field_type}{index + 1:02d}", field_type, length, decimal))
+    return fields
+
+
+def write_dbf(
+    path: str,
+    rows: int,
+    fields: Sequence[FieldSpec] = (),
+    codepage: str = "cp1252",
+    deleted: float = 0.0,
+    seed: int = 0,
+) -> str:
+    """
+    Write a synthetic DBF file (plus an .fpt memo file for M fields).
+
+    Tables with M, I, T or Y fields are written as Visual FoxPro tables,
+    others as dBase III tables.
+
+    Args:
+        path: Path of the DBF file to create
+        rows: Number of records
+        fields: Field definitions (default: DEFAULT_FIELDS)
+        codepage: Encoding of C and M contents, recorded in the header
+        deleted: Fraction of records flagged as deleted
+        seed: Random seed
+
+    Returns:
+        The path of the DBF file
+    """
+    fields = list(fields) or parse_fields(DEFAULT_FIELDS)
+    rnd = random.Random(seed)
+    words = _words(codepage, rnd)
+    vfp = any(field.type in VFP_TYPES for field in fields)
+
+    memo_blocks: List[int] = []
+    if any(field.type == "M" for field in fields):
+        memo_blocks = _write_memo(Path(path).with_suffix(".fpt"), codepage, words, rnd)
+
+    pools = [_value_pool(field, codepage, words, memo_blocks, rnd) for field in fields]
+    record_length = 1 + sum(field.length for field in fields)
+    header_length = 32 + 32 * len(fields) + 1 + (263 if vfp else 0)
+
+    with open(path, "wb") as dbf_file:
+        reserved = bytearray(20)
+        reserved[17] = LANGUAGE_DRIVERS.get(codepage.lower(), 0)
+        dbf_file.write(
+            struct.pack(
+                "<BBBBLHH", 0x30 if vfp else 0x03, *HEADER_DATE, rows, header_length, record_length
+            )
+            + bytes(reserved)
+        )
+        for field in fields:
+            # Character fields longer than 255 bytes keep the high byte in the decimal count
+            length, decimal = field.length, field.decimal
+            if field.type == "C":
+                length, decimal = field.length & 0xFF, field.length >> 8
+            dbf_file.write(
+                struct.pack(
+                    "<11sc4xBB14x",
+                    field.name.encode("ascii"),
+                    field.type.encode("ascii"),
+                    length,
+                    decimal,
+                )
+            )
+        dbf_file.write(b"\r")
+        if vfp:
+            dbf_file.write(bytes(263))
+
+        chunk: List[bytes] = []
+        for _ in range(rows):
+            flag = b"*" if deleted and rnd.random() < deleted else b" "
+            chunk.append(flag + b"".join(pool[rnd.randrange(POOL_SIZE)] for pool in pools))
+            if len(chunk) == 4096:
+                dbf_file.write(b"".join(chunk))
+                chunk = []
+        dbf_file.write(b"".join(chunk))
+        dbf_file.write(b"\x1a")
+
+    return path
+
+
+def _words(codepage: str, rnd: random.Random) -> List[str]:
+    """Build a vocabulary of words using letters the codepage can encode."""
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    try:
+        extra = bytes(range(0x80, 0x100)).decode(codepage, errors="ignore")
+    except LookupError:
+        raise ValueError(f"Unknown codepage: {codepage!r}") from None
+    if codepage.lower().replace("-", "").replace("_", "") in ("utf8", "utf16", "utf32"):
+        extra = "äöüéñçøåßłżśąęžščřěğαβγδабвгд"
+    letters += "".join(char for char in extra if char.isalpha())
+
+    words = ["O'Brien", "back\\slash", "tab\there", "line\nbreak"]
+    while len(words) < 500:
+        words.append("".join(rnd.choice(letters) for _ in range(rnd.randint(2, 10))))
+    return words
+
+
+def _text(words: List[str], codepage: str, limit: int, rnd: random.Random) -> bytes:
+    """Random words encoded in the codepage, cut to at most limit bytes on a character boundary."""
+    text = " ".join(rnd.choice(words) for _ in range(rnd.randint(0, max(1, limit // 6))))
+    data = text.encode(codepage, errors="replace")
+    if len(data) > limit:
+        data = data[:limit].decode(codepage, errors="ignore").encode(codepage)
+    return data
+
+
+def _value_pool(
+    field: FieldSpec,
+    codepage: str,
+    words: List[str],
+    memo_blocks: List[int],
+    rnd: random.Random,
+) -> List[bytes]:
+    """Generate POOL_SIZE encoded values of a field."""
+    length, decimal = field.length, field.decimal
+    generators: Dict[str, Callable[[], bytes]] = {
+        "C": lambda: _text(words, codepage, length, rnd).ljust(length, b" "),
+        "N": lambda: _number(length, decimal, rnd),
+        "F": lambda: _number(length, decimal, rnd),
+        "D": lambda: (
+            b" " * 8
+            if rnd.random() < 0.05
+            else (datetime.date(1990, 1, 1) + datetime.timedelta(days=rnd.randrange(15000)))
+            .strftime("%Y%m%d")
+            .encode("ascii")
+        ),
+        "L": lambda: rnd.choice([b"T", b"F", b"Y", b"N", b"?"]),
+        "M": lambda: struct.pack("<L", rnd.choice(memo_blocks) if rnd.random() < 0.9 else 0),
+        "I": lambda: struct.pack("<i", rnd.randint(-(2**31), 2**31 - 1)),
+        "T": lambda: struct.pack(
+            "<LL",
+            datetime.date(1990, 1, 1).toordinal() + JULIAN_DAY_OFFSET + rnd.randrange(15000),
+            rnd.randrange(86400000),
+        ),
+        "Y": lambda: struct.pack("<q", rnd.randint(-(10**12), 10**12)),
+    }
+    generate = generators[field.type]
+    return [generate() for _ in range(POOL_SIZE)]
+
+
+def _number(length: int, decimal: int, rnd: random.Random) -> bytes:
+    """A right-aligned N/F literal that fits the field, or blanks."""
+    if rnd.random() < 0.05:
+        return b" " * length
+    digits = length - (decimal + 1 if decimal else 0) - 1
+    value = rnd.uniform(-(10 ** min(digits, 15)), 10 ** min(digits, 15)) / rnd.choice([1, 10, 1000])
+    text = f"{value:{length}.{decimal}f}" if decimal else f"{int(value):{length}d}"
+    return text.encode("ascii")[:length]
+
+
+def _write_memo(path: Path, codepage: str, words: List[str], rnd: random.Random) -> List[int]:
+    """Write a Visual FoxPro memo file of text blocks and return their block numbers."""
+    blocks: List[int] = []
+    with open(path, "wb") as memo_file:
+        memo_file.write(bytes(512))
+        next_block = 512 // MEMO_BLOCK_SIZE
+        for _ in range(POOL_SIZE // 8):
+            data = _text(words, codepage, rnd.choice([20, 200, 2000]), rnd)
+            block = struct.pack(">LL", 1, len(data)) + data
+            block += bytes(-len(block) % MEMO_BLOCK_SIZE)
+            memo_file.write(block)
+            blocks.append(next_block)
+            next_block += len(block) // MEMO_BLOCK_SIZE
+
+        memo_file.seek(0)
+        memo_file.write(
+            struct.pack(">L", next_block) + bytes(2) + struct.pack(">H", MEMO_BLOCK_SIZE)
+        )
+    return blocks
+
+
+def generate(
+    directory: str,
+    rows: int,
+    fields: str = DEFAULT_FIELDS,
+    codepage: str = "cp1252",
+    deleted: float = 0.0,
+    seed: int = 0,
+    name: Optional[str] = None,
+) -> str:
+    """
+    Write a synthetic DBF file into a directory, named after its parameters.
+
+    Args:
+        directory: Directory to write into
+        rows: Number of records
+        fields: Field mix (see parse_fields)
+        codepage: Encoding of C and M contents
+        deleted: Fraction of records flagged as deleted
+        seed: Random seed
+        name: File name without extension (default: "bench_<rows>")
+
+    Returns:
+        Path of the DBF file
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    path = str(Path(directory) / f"{name or f'bench_{rows}'}.dbf")
+    return write_dbf(path, rows, parse_fields(fields), codepage, deleted, seed)
@@ -0,0 +1,356 @@
+"""
+Benchmark Suite
+
+Times the stages of a conversion on a synthetic DBF file and reports rows/s,
+MB/s and peak RSS. Every benchmark runs in a fresh interpreter, so peak RSS is
+that of the benchmark alone and imports or caches of one do not leak into the
+next. Results are plain JSON, stored as named baselines and compared against
+them to catch throughput regressions.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Values rendered by the _escape_sql_value benchmark
+ESCAPE_SAMPLE_ROWS = 50_000
+
+# Times the header benchmark opens the file per round
+HEADER_ROUNDS = 10_000
+
+# (items processed, bytes processed) of one timed round
+Measurement = Tuple[int, int]
+
+
+def _converter(options: Dict[str, Any]) -> Any:
+    """Build the converter under test, without progress logging."""
+    from dbf2sql import DBFToSQLConverter
+
+    converter = DBFToSQLConverter(
+        batch_size=options["batch_size"],
+        encoding=options["encoding"],
+        engine=options["engine"],
+        dialect=options["dialect"],
+    )
+    converter.logger.setLevel(logging.ERROR)
+    return converter
+
+
+def _decoded_rows(converter: Any, dbf_path: str, limit: Optional[int]) -> List[Any]:
+    """Decode up to limit rows up front, outside the timed section."""
+    with converter._open_table(dbf_path) as table:
+        return list(islice(converter._iter_rows(table), limit))
+
+
+def _bench_header(dbf_path: str, options: Dict[str, Any]) -> Callable[[], Measurement]:
+    from dbf2sql.reader import DBF_HEADER
+
+    converter = _converter(options)
+    with open(dbf_path, "rb") as dbf_file:
+        header_size = DBF_HEADER.unpack(dbf_file.read(DBF_HEADER.size))[5]
+
+    def run() -> Measurement:
+        for _ in range(HEADER_ROUNDS):
+            with converter._open_table(dbf_path):
+                pass
+        return HEADER_ROUNDS, HEADER_ROUNDS * header_size
+
+    return run
+
+
+def _bench_decode(dbf_path: str, options: Dict[str, Any]) -> Callable[[], Measurement]:
+    converter = _converter(options)
+    size = os.path.getsize(dbf_path)
+
+    def run() -> Measurement:
+        rows = 0
+        with converter._open_table(dbf_path) as table:
+            for _ in converter._iter_rows(table):
+                rows += 1
+        return rows, size
+
+    return run
+
+
+def _bench_escape(dbf_path: str, options: Dict[str, Any]) -> Callable[[], Measurement]:
+    converter = _converter(options)
+    rows = _decoded_rows(converter, dbf_path, ESCAPE_SAMPLE_ROWS)
+    values = [value for row in rows for value in row]
+    escape = converter._escape_sql_value
+
+    def run() -> Measurement:
+        size = 0
+        for value in values:
+            size += len(escape(value))
+        return len(values), size
+
+    return run
+
+
+def _bench_batch(dbf_path: str, options: Dict[str, Any]) -> Callable[[], Measurement]:
+    converter = _converter(options)
+    batch_size = options["batch_size"]
+    rows = _decoded_rows(converter, dbf_path, None)
+    batches = [rows[start : start + batch_size] for start in range(0, len(rows), batch_size)]
+    with converter._open_table(dbf_path) as table:
+        field_names = [field["name"] for field in converter._describe_fields(table)]
+        encoders = converter._build_value_encoders([str(field.type) for field in table.fields])
+
+    def run() -> Measurement:
+        size = 0
+        for batch in batches:
+            size += len(converter._process_records_batch(batch, "bench", field_names, encoders))
+        return len(rows), size
+
+    return run
+
+
+def _bench_convert(dbf_path: str, options: Dict[str, Any]) -> Callable[[], Measurement]:
+    converter = _converter(options)
+    sql_path = str(Path(dbf_path).with_suffix(".sql"))
+    size = os.path.getsize(dbf_path)
+    with converter._open_table(dbf_path) as table:
+        rows = len(table)
+
+    def run() -> Measurement:
+        if not converter.convert_dbf_to_sql(dbf_path, sql_path):
+            raise RuntimeError(f"Conversion of {dbf_path} failed")
+        return rows, size
+
+    return run
+
+
+BENCHMARKS: Dict[str, Callable[[str, Dict[str, Any]], Callable[[], Measurement]]] = {
+    "header": _bench_header,
+    "decode": _bench_decode,
+    "escape_sql_value": _bench_escape,
+    "process_records_batch": _bench_batch,
+    "convert": _bench_convert,
+}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of the current process, None where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _run_one(name: str, dbf_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Set up and time one benchmark; runs in its own process."""
+    run = BENCHMARKS[name](dbf_path, options)
+
+    best = float("inf")
+    items = size = 0
+    for _ in range(options["repeat"]):
+        started = time.perf_counter()
+        items, size = run()
+        best = min(best, time.perf_counter() - started)
+
+    best = max(best, 1e-9)
+    return {
+        "seconds": round(best, 6),
+        "items": items,
+        "bytes": size,
+        "rows_per_s": round(items / best, 1),
+        "mb_per_s": round(size / best / 1e6, 3),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_suite(
+    rows: int = 200_000,
+    fields: Optional[str] = None,
+    codepage: str = "cp1252",
+    seed: int = 0,
+    repeat: int = 3,
+    batch_size: int = 1000,
+    engine: str = "python",
+    dialect: str = "generic",
+    only: Optional[List[str]] = None,
+    workdir: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Generate a DBF file and run the benchmarks on it.
+
+    Args:
+        rows: Number of records in the generated file
+        fields: Field mix (default: dbfgen.DEFAULT_FIELDS)
+        codepage: Codepage of the generated text
+        seed: Random seed of the generator
+        repeat: Timed rounds per benchmark; the fastest counts
+        batch_size: Converter batch size
+        engine: Converter engine for the convert benchmark
+        dialect: SQL dialect of the rendered output
+        only: Names of the benchmarks to run (default: all)
+        workdir: Directory for the generated files (default: a temporary one)
+
+    Returns:
+        Dictionary with "meta" (parameters and environment) and "results"
+        (per-benchmark measurements)
+    """
+    from .dbfgen import DEFAULT_FIELDS, generate
+
+    names = only or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    fields = fields or DEFAULT_FIELDS
+    options = {
+        "encoding": codepage,
+        "repeat": max(1, repeat),
+        "batch_size": batch_size,
+        "engine": engine,
+        "dialect": dialect,
+    }
+    meta = {
+        "rows": rows,
+        "fields": fields,
+        "codepage": codepage,
+        "seed": seed,
+        "repeat": options["repeat"],
+        "batch_size": batch_size,
+        "engine": engine,
+        "dialect": dialect,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(dir=workdir) as directory:
+        dbf_path = generate(directory, rows, fields, codepage, seed=seed)
+        meta["file_bytes"] = os.path.getsize(dbf_path)
+
+        context = multiprocessing.get_context("spawn")
+        for name in names:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results[name] = executor.submit(_run_one, name, dbf_path, options).result()
+
+    return {"meta": meta, "results": results}
+
+
+def baseline_path(name: str) -> Path:
+    """
+    Resolve a baseline name or path.
+
+    Args:
+        name: Path of a results file, or the name of a stored baseline
+
+    Returns:
+        Path of the JSON file
+    """
+    path = Path(name)
+    if path.suffix == ".json" or path.exists():
+        return path
+    return BASELINE_DIR / f"{name}.json"
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    """Write results as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2)
+        results_file.write("\n")
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read results written by save_results."""
+    with open(path, encoding="utf-8") as results_file:
+        data: Dict[str, Any] = json.load(results_file)
+    return data
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.10
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the run under test
+        tolerance: Allowed relative drop in rows/s before a benchmark counts
+            as a regression
+
+    Returns:
+        (report lines, names of regressed benchmarks)
+    """
+    lines: List[str] = []
+    regressions: List[str] = []
+
+    for key in ("rows", "fields", "codepage", "seed", "batch_size", "engine", "dialect"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            lines.append(
+                f"warning: {key} differs (baseline {baseline['meta'].get(key)!r}, "
+                f"current {current['meta'].get(key)!r})"
+            )
+    if baseline["meta"].get("machine") != current["meta"].get("machine"):
+        lines.append("warning: results come from different machines")
+
+    lines.append(
+        f"{'benchmark':<24}{'baseline rows/s':>18}{'current rows/s':>18}{'change':>9}"
+        f"{'MB/s':>10}{'peak RSS MB':>13}"
+    )
+    for name, reference in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None:
+            lines.append(f"{name:<24}{'(not run)':>18}")
+            continue
+
+        change = result["rows_per_s"] / reference["rows_per_s"] - 1
+        regressed = change < -tolerance
+        if regressed:
+            regressions.append(name)
+        rss = result.get("peak_rss_mb")
+        lines.append(
+            f"{name:<24}{reference['rows_per_s']:>18,.0f}{result['rows_per_s']:>18,.0f}"
+            f"{change:>+9.1%}{result['mb_per_s']:>10.2f}"
+            f"{(f'{rss:.1f}' if rss is not None else '-'):>13}"
+            + ("  REGRESSION" if regressed else "")
+        )
+
+    return lines, regressions
+
+
+def format_results(results: Dict[str, Any]) -> List[str]:
+    """
+    Render results as a table.
+
+    Args:
+        results: Results of run_suite
+
+    Returns:
+        Report lines
+    """
+    meta = results["meta"]
+    lines = [
+        f"{meta['rows']:,} rows, {meta['file_bytes'] / 1e6:.1f} MB, fields {meta['fields']}, "
+        f"codepage {meta['codepage']}, best of {meta['repeat']}",
+        f"{'benchmark':<24}{'rows/s':>16}{'MB/s':>10}{'seconds':>10}{'peak RSS MB':>13}",
+    ]
+    for name, result in results["results"].items():
+        rss = result.get("peak_rss_mb")
+        lines.append(
+            f"{name:<24}{result['rows_per_s']:>16,.0f}{result['mb_per_s']:>10.2f}"
+            f"{result['seconds']:>10.3f}{(f'{rss:.1f}' if rss is not None else '-'):>13}"
+        )
+    return lines
@@ -4,11 +4,24 @@ DBF to SQL Converter
 A memory-efficient Python package to convert DBF (dBase) files to SQL INSERT statements.
 """
 
+from .aio import AsyncDBFToSQLConverter
 from .cli import main
 from .converter import DBFToSQLConverter
+from .progress import Progress, ProgressUpdate
+from .reader import DBFReader, UnsupportedDBFError
+from .stats import ConversionStats
 
 __version__ = "1.0.0"
 __author__ = "DBF2SQL Team"
 __email__ = "contact@dbf2sql.com"
 
-__all__ = ["DBFToSQLConverter", "main"]
+__all__ = [
+    "AsyncDBFToSQLConverter",
+    "ConversionStats",
+    "DBFToSQLConverter",
+    "DBFReader",
+    "Progress",
+    "ProgressUpdate",
+    "UnsupportedDBFError",
+    "main",
+]
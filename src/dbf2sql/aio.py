@@ -0,0 +1,212 @@
+"""
+Asyncio API Module
+
+Async counterparts of the converter entry points. Reading, formatting and
+writing run in an executor one chunk at a time, so the event loop never
+blocks, a slow consumer holds back the conversion, and cancelling the task
+stops it at the next chunk.
+"""
+
+import asyncio
+import copy
+import os
+import threading
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .compression import codec_for_path, open_output
+from .converter import DBFToSQLConverter
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class AsyncDBFToSQLConverter:
+    """
+    Asyncio front end for a DBFToSQLConverter.
+
+    Output is produced through the converter's iter_sql() generator, one
+    batch per executor call, so the converter's options apply except jobs,
+    pipeline_workers and output sharding, which need the blocking API. Each
+    conversion runs on its own shallow copy of the converter, so files
+    converted concurrently keep separate statistics and progress; statistics
+    are published to the converter's stats and file_stats like the blocking
+    API does.
+    """
+
+    def __init__(
+        self,
+        converter: Optional[DBFToSQLConverter] = None,
+        executor: Optional[Executor] = None,
+        **options: Any,
+    ):
+        """
+        Initialize the async converter.
+
+        Args:
+            converter: Converter to use (default: a new one built from options)
+            executor: Executor for blocking work (default: the event loop's
+                default thread pool)
+            **options: DBFToSQLConverter arguments, when no converter is given
+        """
+        self.converter = converter or DBFToSQLConverter(**options)
+        self.executor = executor
+        self.logger = self.converter.logger
+
+    async def iter_sql(
+        self, dbf_file_path: str, table_name: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate the SQL of a DBF file as an async iterator of chunks.
+
+        The next chunk is rendered while the consumer handles the current
+        one, and no further chunk is rendered until it asks for it.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table (default: sanitized file stem)
+
+        Yields:
+            Chunks of SQL text; their concatenation is the .sql file
+        """
+        converter = self._task_converter()
+        chunks = converter.iter_sql(dbf_file_path, table_name)
+        async with _Stepper(chunks, self.executor) as step:
+            pending = step(next, chunks, _END)
+            while True:
+                chunk = await pending
+                if chunk is _END:
+                    self.converter.stats = converter.stats
+                    return
+                pending = step(next, chunks, _END)
+                yield chunk
+
+    async def convert_dbf_to_sql(
+        self,
+        dbf_file_path: str,
+        sql_file_path: Optional[str] = None,
+        output_dir: Optional[str] = None,
+    ) -> bool:
+        """
+        Convert a DBF file to a SQL file without blocking the event loop.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            sql_file_path: Path to the output SQL file (optional)
+            output_dir: Output directory for SQL files (optional)
+
+        Returns:
+            True if conversion was successful, False otherwise
+
+        Raises:
+            asyncio.CancelledError: If the task is cancelled; the partial
+                output file is left in place
+        """
+        converter = self._task_converter()
+        if not Path(dbf_file_path).exists():
+            self.logger.error(f"DBF file not found: {dbf_file_path}")
+            return False
+
+        if sql_file_path is None:
+            if output_dir is not None:
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+            sql_file_path = converter._default_sql_path(dbf_file_path, output_dir)
+        codec = converter.compress or codec_for_path(sql_file_path)
+
+        self.logger.info(f"Converting {dbf_file_path} to {sql_file_path}")
+        try:
+            chunks = converter.iter_sql(dbf_file_path)
+            async with _Stepper(chunks, self.executor) as step:
+                sql_file = await step(open_output, sql_file_path, codec)
+                try:
+                    while await step(_write_next, chunks, sql_file):
+                        pass
+                finally:
+                    await step(sql_file.close)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error converting {dbf_file_path}: {str(e)}")
+            return False
+
+        converter.stats.output = sql_file_path
+        converter.stats.output_bytes = os.path.getsize(sql_file_path)
+        self.converter.stats = converter.stats
+        self.converter.file_stats[dbf_file_path] = converter.stats
+        self.logger.info(f"Successfully converted {dbf_file_path} to {sql_file_path}")
+        return True
+
+    async def convert_multiple_files(
+        self, dbf_files: List[str], output_dir: Optional[str] = None, concurrency: int = 4
+    ) -> Dict[str, bool]:
+        """
+        Convert several DBF files concurrently.
+
+        Args:
+            dbf_files: List of DBF file paths
+            output_dir: Output directory for SQL files (optional)
+            concurrency: Maximum number of files converted at the same time
+
+        Returns:
+            Dictionary mapping file paths to conversion success status, in input order;
+            the statistics of each converted file are kept in the converter's file_stats
+        """
+        self.converter.file_stats = {}
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def convert(dbf_file: str) -> bool:
+            async with limit:
+                return await self.convert_dbf_to_sql(dbf_file, output_dir=output_dir)
+
+        outcomes = await asyncio.gather(*(convert(dbf_file) for dbf_file in dbf_files))
+        return dict(zip(dbf_files, outcomes))
+
+    def _task_converter(self) -> DBFToSQLConverter:
+        """Return a copy of the converter whose per-file state is private to one task."""
+        converter = copy.copy(self.converter)
+        converter.file_stats = {}
+        converter.progress = copy.copy(self.converter.progress)
+        return converter
+
+
+class _Stepper:
+    """
+    Runs blocking calls on an executor one at a time for a chunk generator.
+
+    Calls hold a lock while they run. On exit, including cancellation, the
+    generator is closed on the executor under the same lock, so it is never
+    resumed from two threads and its table is always closed.
+    """
+
+    def __init__(self, chunks: Iterator[Any], executor: Optional[Executor]):
+        self.chunks = chunks
+        self.executor = executor
+        self.loop = asyncio.get_running_loop()
+        self.lock = threading.Lock()
+
+    def __call__(self, function: Callable[..., T], *args: Any) -> "asyncio.Future[T]":
+        return self.loop.run_in_executor(self.executor, self._locked, function, *args)
+
+    def _locked(self, function: Callable[..., T], *args: Any) -> T:
+        with self.lock:
+            return function(*args)
+
+    async def __aenter__(self) -> "_Stepper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        close = getattr(self.chunks, "close", None)
+        if close is not None:
+            # A cancelled call may still be running in its thread; the lock waits for it
+            await asyncio.shield(self(close))
+
+
+def _write_next(chunks: Iterator[str], sql_file: Any) -> bool:
+    """Render the next chunk and write it; return False at the end."""
+    chunk = next(chunks, None)
+    if chunk is None:
+        return False
+    sql_file.write(chunk)
+    return True
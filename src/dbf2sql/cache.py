@@ -0,0 +1,229 @@
+"""
+Conversion Cache Module
+
+Remembers which DBF files were converted from which source state and with
+which settings, so repeated runs over a folder can skip files whose output is
+still current, and how far append-only files have been converted in tail mode.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .reader import DBF_HEADER, header_date
+
+CACHE_FILE = ".dbf2sql-cache.json"
+CACHE_VERSION = 1
+
+# Bytes hashed from the start of the file and at each sample position
+FINGERPRINT_HEAD = 64 * 1024
+FINGERPRINT_SAMPLE = 64 * 1024
+FINGERPRINT_SAMPLES = 16
+
+MEMO_SUFFIXES = (".fpt", ".dbt")
+
+
+def source_state(dbf_file_path: str) -> Dict[str, Any]:
+    """
+    Describe a DBF file cheaply: size, mtime, header date and record count.
+
+    Args:
+        dbf_file_path: Path to the DBF file
+
+    Returns:
+        Dictionary of the file's state, including that of its memo file
+    """
+    stat = os.stat(dbf_file_path)
+    state: Dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    with open(dbf_file_path, "rb") as infile:
+        header = infile.read(DBF_HEADER.size)
+    if len(header) == DBF_HEADER.size:
+        _, year, month, day, record_count, _, _ = DBF_HEADER.unpack(header)
+        date = header_date(year, month, day)
+        state["header_date"] = date.isoformat() if date is not None else None
+        state["record_count"] = record_count
+
+    memo = _memo_path(dbf_file_path)
+    if memo is not None:
+        memo_stat = os.stat(memo)
+        state["memo"] = {"size": memo_stat.st_size, "mtime_ns": memo_stat.st_mtime_ns}
+
+    return state
+
+
+def fingerprint(dbf_file_path: str) -> str:
+    """
+    Hash the header and evenly spaced samples of a DBF file (and its memo file).
+
+    Sampling keeps the cost independent of the file size; it catches
+    rewritten files whose size and header happen to match, not every
+    single-byte edit.
+
+    Args:
+        dbf_file_path: Path to the DBF file
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    paths = [dbf_file_path]
+    memo = _memo_path(dbf_file_path)
+    if memo is not None:
+        paths.append(memo)
+
+    for path in paths:
+        with open(path, "rb") as infile:
+            size = os.fstat(infile.fileno()).st_size
+            digest.update(size.to_bytes(8, "little"))
+            digest.update(infile.read(FINGERPRINT_HEAD))
+            if size > FINGERPRINT_HEAD:
+                step = (size - FINGERPRINT_HEAD) // FINGERPRINT_SAMPLES
+                for index in range(1, FINGERPRINT_SAMPLES + 1):
+                    infile.seek(max(FINGERPRINT_HEAD, size - FINGERPRINT_SAMPLE - index * step))
+                    digest.update(infile.read(FINGERPRINT_SAMPLE))
+
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """
+    JSON manifest of converted files.
+
+    A file is current when its output still exists with the recorded size,
+    the settings are unchanged and the source state matches. When only the
+    modification time differs (e.g. a file copied over with the same
+    contents), the content fingerprint decides.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load a cache file; a missing or unreadable cache is empty.
+
+        Args:
+            path: Path of the cache file, e.g. CACHE_FILE in an output directory
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.tails: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data.get("files", {})
+                self.tails = data.get("tails", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def is_current(self, dbf_file_path: str, output_path: str, settings: str) -> bool:
+        """
+        Check whether a previous conversion of a file is still valid.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            output_path: Output file the conversion would write
+            settings: Signature of the converter settings affecting the output
+
+        Returns:
+            True if the file can be skipped
+        """
+        entry = self.entries.get(_key(dbf_file_path))
+        if entry is None or entry.get("settings") != settings:
+            return False
+        if entry.get("output") != os.path.abspath(output_path):
+            return False
+
+        try:
+            if os.path.getsize(output_path) != entry.get("output_size"):
+                return False
+            state = source_state(dbf_file_path)
+            if state == entry.get("source"):
+                return True
+
+            recorded = dict(entry.get("source", {}), mtime_ns=None)
+            if dict(state, mtime_ns=None, memo=None) != dict(recorded, memo=None):
+                return False
+            current = fingerprint(dbf_file_path) == entry.get("fingerprint")
+        except OSError:
+            return False
+
+        if current:
+            # Same contents under a new mtime; remember it to skip the hash next time
+            entry["source"] = state
+        return current
+
+    def record(self, dbf_file_path: str, output_path: str, settings: str) -> None:
+        """
+        Remember a successful conversion.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            output_path: Output file that was written
+            settings: Signature of the converter settings affecting the output
+        """
+        self.entries[_key(dbf_file_path)] = {
+            "source": source_state(dbf_file_path),
+            "fingerprint": fingerprint(dbf_file_path),
+            "settings": settings,
+            "output": os.path.abspath(output_path),
+            "output_size": os.path.getsize(output_path),
+        }
+
+    def tail(self, dbf_file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the tail-mode state of a file.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+
+        Returns:
+            The state passed to record_tail, or None if there is none
+        """
+        return self.tails.get(_key(dbf_file_path))
+
+    def record_tail(self, dbf_file_path: str, state: Dict[str, Any]) -> None:
+        """
+        Remember how far a file has been converted in tail mode.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            state: Number of converted records and the layout they were read with
+        """
+        self.tails[_key(dbf_file_path)] = state
+
+    def save(self) -> None:
+        """
+        Write the cache atomically.
+
+        Raises:
+            OSError: If the cache file cannot be written
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        data = {"version": CACHE_VERSION, "files": self.entries, "tails": self.tails}
+        try:
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file, indent=2)
+                cache_file.write("\n")
+            os.replace(temp_path, self.path)
+        except OSError:
+            with suppress(OSError):
+                temp_path.unlink()
+            raise
+
+
+def _key(dbf_file_path: str) -> str:
+    return os.path.abspath(dbf_file_path)
+
+
+def _memo_path(dbf_file_path: str) -> Optional[str]:
+    """Find the memo file next to a DBF file, if any."""
+    path = Path(dbf_file_path)
+    for suffix in MEMO_SUFFIXES:
+        for candidate in (path.with_suffix(suffix), path.with_suffix(suffix.upper())):
+            if candidate.exists():
+                return str(candidate)
+    return None
@@ -0,0 +1,126 @@
+"""
+Checkpoint Module
+
+Records how far a long conversion got, in a sidecar next to its output, so an
+interrupted conversion can be resumed instead of started over.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import source_state
+
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+# Active records between checkpoints when none is configured
+DEFAULT_CHECKPOINT_INTERVAL = 1_000_000
+
+
+def synced_offset(output_file: Any) -> int:
+    """
+    Flush an output file to disk and return its size.
+
+    Args:
+        output_file: Open text file or CompressedWriter
+
+    Returns:
+        Number of bytes durably written to the underlying file
+    """
+    output_file.flush()
+    fd = output_file.fileno()
+    os.fsync(fd)
+    return os.lseek(fd, 0, os.SEEK_CUR)
+
+
+class Checkpoint:
+    """
+    Sidecar file holding the resume point of one conversion.
+
+    A checkpoint names the index of the next record to convert, the number
+    of records written so far, the byte size of each output file at that
+    point and the batch size in use, together with the source state and
+    settings it is valid for.
+    """
+
+    def __init__(self, sql_file_path: str):
+        """
+        Initialize the checkpoint of an output file.
+
+        Args:
+            sql_file_path: Path of the SQL file being written
+        """
+        self.path = Path(sql_file_path + CHECKPOINT_SUFFIX)
+
+    def load(self, dbf_file_path: str, settings: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the checkpoint if it still applies.
+
+        Args:
+            dbf_file_path: Path to the DBF file being converted
+            settings: Signature of the converter settings affecting the output
+
+        Returns:
+            The saved state, or None if there is no usable checkpoint
+        """
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                state: Dict[str, Any] = json.load(checkpoint_file)
+            if not {"next_record", "records", "offsets"} <= state.keys():
+                return None
+            if state.get("settings") != settings:
+                return None
+            if state.get("source") != source_state(dbf_file_path):
+                return None
+            for output_path, offset in state.get("offsets", {}).items():
+                if os.path.getsize(output_path) < offset:
+                    return None
+        except (OSError, ValueError, AttributeError):
+            return None
+        return state
+
+    def save(
+        self,
+        dbf_file_path: str,
+        settings: str,
+        next_record: int,
+        records: int,
+        offsets: Dict[str, int],
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Write the checkpoint atomically; output files must be synced first.
+
+        Args:
+            dbf_file_path: Path to the DBF file being converted
+            settings: Signature of the converter settings affecting the output
+            next_record: Index of the first record not yet converted
+            records: Number of records written so far
+            offsets: Size of each output file, by path, once those records are written
+            batch_size: Batch size the records were converted with, which a resumed
+                conversion continues with
+        """
+        state = {
+            "source": source_state(dbf_file_path),
+            "settings": settings,
+            "next_record": next_record,
+            "records": records,
+            "offsets": offsets,
+        }
+        if batch_size is not None:
+            state["batch_size"] = batch_size
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(state, checkpoint_file, indent=2)
+            checkpoint_file.write("\n")
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint after the conversion completed."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
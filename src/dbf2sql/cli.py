@@ -3,12 +3,20 @@ Command Line Interface for DBF to SQL Converter
 """
 
 import argparse
+import io
+import json
 import logging
+import os
+import sqlite3
 import sys
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
-from .converter import DBFToSQLConverter
+from .compression import CODECS
+from .converter import ENGINES, OUTPUT_FORMATS, READERS, DBFToSQLConverter
+from .dialects import DIALECTS
+from .progress import PROGRESS_MODES
 
 
 def find_dbf_files_in_folder(folder_path: str) -> List[str]:
@@ -41,6 +49,98 @@ def find_dbf_files_in_folder(folder_path: str) -> List[str]:
     return sorted(dbf_files)
 
 
+def parse_column_list(value: str) -> List[str]:
+    """
+    Parse a comma-separated list of column names.
+
+    Args:
+        value: Command line value such as "ID,NAME,PRICE"
+
+    Returns:
+        List of column names
+    """
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a byte size with an optional K, M, G or T suffix.
+
+    Args:
+        value: Command line value such as "500M" or "1048576"
+
+    Returns:
+        Size in bytes
+    """
+    text = value.strip().upper().rstrip("B")
+    unit = text[-1:] if text[-1:] in SIZE_UNITS else ""
+    try:
+        return int(float(text[: len(text) - len(unit)]) * SIZE_UNITS[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}") from None
+
+
+def write_to_stdout(converter: DBFToSQLConverter, dbf_files: List[str]) -> Dict[str, bool]:
+    """
+    Convert DBF files one after another, writing their SQL to standard output.
+
+    Args:
+        converter: Configured converter
+        dbf_files: List of DBF file paths
+
+    Returns:
+        Dictionary mapping file paths to conversion success status
+    """
+    results: Dict[str, bool] = {}
+    stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n")
+
+    try:
+        for dbf_file in dbf_files:
+            try:
+                count = converter.write_sql(dbf_file, stdout)
+                converter.logger.info(f"Successfully converted {count} records from {dbf_file}")
+                converter.file_stats[dbf_file] = converter.stats
+                results[dbf_file] = True
+            except BrokenPipeError:
+                # The reading end went away (e.g. piped into head); stop quietly
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                converter.logger.error(f"Output closed while converting {dbf_file}")
+                results[dbf_file] = False
+                break
+            except Exception as e:
+                converter.logger.error(f"Error converting {dbf_file}: {str(e)}")
+                results[dbf_file] = False
+        else:
+            stdout.flush()
+    finally:
+        stdout.detach()
+
+    # Files not reached after the output was closed count as failed
+    return {dbf_file: results.get(dbf_file, False) for dbf_file in dbf_files}
+
+
+def write_stats_json(converter: DBFToSQLConverter, path: str) -> None:
+    """
+    Write the statistics of the converted files as JSON.
+
+    Args:
+        converter: Converter that ran the conversions
+        path: Path of the JSON file
+    """
+    stats = {
+        "files": {
+            dbf_file: file_stats.as_dict() for dbf_file, file_stats in converter.file_stats.items()
+        },
+        "total": converter.total_stats().as_dict(),
+    }
+    with open(path, "w", encoding="utf-8") as stats_file:
+        json.dump(stats, stats_file, indent=2)
+        stats_file.write("\n")
+
+
 def main() -> None:
     """Main function to handle command line arguments."""
     parser = argparse.ArgumentParser(
@@ -54,6 +154,20 @@ Examples:
   dbf2sql -o output_folder file1.dbf file2.dbf
   dbf2sql --folder /path/to/dbf/folder
   dbf2sql --folder /path/to/dbf/folder --output-dir /path/to/output
+  dbf2sql --columns ID,NAME,PRICE data/items.dbf
+  dbf2sql --where "STATUS IN ('A', 'B') AND DATE >= 20240101" data/orders.dbf
+  dbf2sql --dialect postgresql --format bulk data/*.dbf
+  dbf2sql --database data.db --commit-interval 50000 data/*.dbf
+  dbf2sql -o - data/items.dbf | mysql mydb
+  dbf2sql --compress gzip --jobs 4 data/large.dbf
+  dbf2sql --max-output-size 2G --output-dir shards data/large.dbf
+  dbf2sql --folder /path/to/dbf/folder --output-dir /path/to/output --force
+  dbf2sql --tail --output-dir /path/to/output logs/*.dbf
+  dbf2sql --resume data/huge.dbf
+  dbf2sql --stats-json stats.json --folder data
+  dbf2sql --progress bar --folder data
+  dbf2sql --max-memory 1500M --batch-size 10000 data/wide_memos.dbf
+  dbf2sql --progress json --folder data 2> progress.jsonl
   dbf2sql --help
         """,
     )
@@ -82,7 +196,220 @@ Examples:
         "--output-dir",
         "-o",
         type=str,
-        help="Output directory for SQL files (default: same directory as DBF files)",
+        help="Output directory for SQL files, or - to write the SQL to standard output "
+        "(default: same directory as DBF files)",
+    )
+
+    parser.add_argument(
+        "--reader",
+        choices=READERS,
+        default="auto",
+        help="Record reader: memory-mapped native reader, dbfread, or auto "
+        "(native with dbfread fallback for unsupported variants) (default: auto)",
+    )
+
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Value rendering engine; numpy decodes whole batches column-wise "
+        "(requires NumPy) (default: python)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes used to convert each file by splitting its record range "
+        "(default: 1)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes used to convert multiple files at once, largest first "
+        "(default: 1)",
+    )
+
+    parser.add_argument(
+        "--pipeline",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Convert with a reader / N formatter workers / ordered writer pipeline "
+        "(default: 0, single-threaded)",
+    )
+
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=4,
+        help="Capacity in batches of each queue between pipeline stages (default: 4)",
+    )
+
+    parser.add_argument(
+        "--passthrough",
+        action="store_true",
+        help="Copy numeric field bytes into the SQL as stored instead of parsing them "
+        "(native reader only)",
+    )
+
+    parser.add_argument(
+        "--max-statement-bytes",
+        type=int,
+        default=0,
+        help="Split INSERT statements so none exceeds this many bytes, e.g. below MySQL's "
+        "max_allowed_packet; --batch-size stays the row cap (default: 0, no limit)",
+    )
+
+    parser.add_argument(
+        "--columns",
+        type=parse_column_list,
+        help="Comma-separated DBF fields to convert (default: all); other fields are not decoded",
+    )
+
+    parser.add_argument(
+        "--exclude-columns",
+        type=parse_column_list,
+        help="Comma-separated DBF fields to leave out of the conversion",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="insert",
+        help="Output format: multi-row INSERT statements, the dialect's bulk-load form "
+        "(postgresql: COPY ... FROM stdin, mysql: LOAD DATA with a .tsv data file, "
+        "sqlite/sqlserver: INSERTs in one transaction), or copy, short for "
+        "--dialect postgresql --format bulk (default: insert)",
+    )
+
+    parser.add_argument(
+        "--dialect",
+        choices=list(DIALECTS),
+        default="generic",
+        help="SQL dialect of the generated types, quoting and literals; generic keeps "
+        "the original MySQL-style output (default: generic)",
+    )
+
+    parser.add_argument(
+        "--where",
+        help="Only convert rows matching a filter, e.g. \"STATUS = 'A' AND DATE >= 20240101\"; "
+        "supports comparisons, [NOT] IN lists, IS [NOT] NULL, AND, OR and NOT",
+    )
+
+    parser.add_argument(
+        "--compress",
+        choices=CODECS,
+        help="Write compressed .sql.gz/.sql.xz/.sql.bz2 files, compressing blocks on a thread "
+        "pool while converting",
+    )
+
+    parser.add_argument(
+        "--max-output-size",
+        type=parse_size,
+        default=0,
+        help="Split each table's output into numbered, self-contained shard files of at most "
+        "this size (e.g. 2G), DDL in shard 0, listed in a .manifest.json (default: 0, one file)",
+    )
+
+    parser.add_argument(
+        "--rows-per-file",
+        type=int,
+        default=0,
+        help="Split each table's output into shard files of at most N rows, rounded down to "
+        "whole batches (default: 0, one file)",
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reconvert every file, even those whose output is up to date according to the "
+        "conversion cache",
+    )
+
+    parser.add_argument(
+        "--cache-file",
+        help="Conversion cache recording which files are up to date (default: "
+        ".dbf2sql-cache.json in --output-dir; without --output-dir no cache is kept)",
+    )
+
+    parser.add_argument(
+        "--tail",
+        action="store_true",
+        help="Convert only the records appended since the previous run of each file into a "
+        "delta file (table.delta-N.sql, no DDL); the first run converts everything",
+    )
+
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=0,
+        help="Sync the output and save a resume point (.checkpoint.json next to it) every N "
+        "records (default: 0, none; 1000000 with --resume)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue interrupted conversions from their checkpoints, truncating the output "
+        "to the checkpointed size; files without one start over with checkpoints",
+    )
+
+    parser.add_argument(
+        "--max-memory",
+        type=parse_size,
+        default=0,
+        help="Memory budget (e.g. 1500M): batches and compression buffers are sized from the "
+        "measured bytes per row to stay within it, and each file's high-water mark is "
+        "reported (default: 0, batch-size rows per batch)",
+    )
+
+    parser.add_argument(
+        "--progress",
+        choices=PROGRESS_MODES,
+        default="log",
+        help="Progress reporting with percentage, rows/s and ETA: log messages, a bar or "
+        "JSON lines on stderr, or none (default: log)",
+    )
+
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        metavar="SECONDS",
+        help="Minimum seconds between progress updates (default: 5 for log, 0.2 for bar, "
+        "1 for json)",
+    )
+
+    parser.add_argument(
+        "--stats-json",
+        metavar="PATH",
+        help="Write per-file and total statistics (rows, bytes, batches, largest batch and "
+        "the time spent opening, reading, formatting and writing) to this JSON file",
+    )
+
+    parser.add_argument(
+        "--database",
+        help="Load the rows straight into this SQLite database file with executemany "
+        "instead of writing .sql files",
+    )
+
+    parser.add_argument(
+        "--commit-interval",
+        type=int,
+        default=0,
+        help="With --database, commit every N rows (default: 0, one transaction per file)",
+    )
+
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1,
+        help="With --database, load record ranges over N parallel connections "
+        "(native reader only) (default: 1)",
     )
 
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
@@ -91,6 +418,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # With -o - the SQL goes to stdout; messages and logs go to stderr instead
+    to_stdout = args.output_dir == "-"
+    messages = sys.stderr if to_stdout else sys.stdout
+
     # Validate arguments
     if not args.dbf_files and not args.folder:
         parser.error("You must specify either DBF files or use --folder option")
@@ -98,6 +429,14 @@ Examples:
     if args.dbf_files and args.folder:
         parser.error("Cannot specify both DBF files and --folder option. Use one or the other.")
 
+    if args.tail and (to_stdout or (args.output_dir is None and args.cache_file is None)):
+        parser.error(
+            "--tail keeps its position in the conversion cache; use --output-dir or --cache-file"
+        )
+
+    if args.stats_json and args.database:
+        parser.error("--stats-json cannot be combined with --database")
+
     # Set up logging level
     if args.verbose:
         logging.getLogger("dbf2sql").setLevel(logging.DEBUG)
@@ -107,35 +446,89 @@ Examples:
         try:
             dbf_files = find_dbf_files_in_folder(args.folder)
             if not dbf_files:
-                print(f"No DBF files found in folder: {args.folder}")
+                print(f"No DBF files found in folder: {args.folder}", file=messages)
                 sys.exit(1)
-            print(f"Found {len(dbf_files)} DBF file(s) in folder: {args.folder}")
+            print(f"Found {len(dbf_files)} DBF file(s) in folder: {args.folder}", file=messages)
         except (FileNotFoundError, NotADirectoryError) as e:
-            print(f"Error: {e}")
+            print(f"Error: {e}", file=messages)
             sys.exit(1)
     else:
         dbf_files = args.dbf_files
 
     # Create converter
-    converter = DBFToSQLConverter(batch_size=args.batch_size, encoding=args.encoding)
+    try:
+        converter = DBFToSQLConverter(
+            batch_size=args.batch_size,
+            encoding=args.encoding,
+            reader=args.reader,
+            engine=args.engine,
+            jobs=args.jobs,
+            workers=args.workers,
+            pipeline_workers=args.pipeline,
+            queue_depth=args.queue_depth,
+            passthrough=args.passthrough,
+            max_statement_bytes=args.max_statement_bytes,
+            columns=args.columns,
+            exclude_columns=args.exclude_columns,
+            where=args.where,
+            output_format=args.format,
+            dialect=args.dialect,
+            compress=args.compress,
+            max_output_size=args.max_output_size,
+            rows_per_file=args.rows_per_file,
+            force=args.force,
+            cache_file=args.cache_file,
+            tail=args.tail,
+            checkpoint_interval=args.checkpoint_interval,
+            resume=args.resume,
+            progress=args.progress,
+            progress_interval=args.progress_interval,
+            max_memory=args.max_memory,
+        )
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=messages)
+        sys.exit(1)
+
+    if to_stdout:
+        for handler in converter.logger.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(sys.stderr)
 
     # Convert files
-    results = converter.convert_multiple_files(dbf_files, output_dir=args.output_dir)
+    if args.database:
+        # Concurrent writers wait for SQLite's write lock instead of failing
+        connect = partial(sqlite3.connect, args.database, timeout=60)
+        results = {
+            dbf_file: converter.convert_dbf_to_database(
+                dbf_file,
+                connect,
+                commit_interval=args.commit_interval,
+                connections=args.connections,
+            )
+            for dbf_file in dbf_files
+        }
+    elif to_stdout:
+        results = write_to_stdout(converter, dbf_files)
+    else:
+        results = converter.convert_multiple_files(dbf_files, output_dir=args.output_dir)
+
+    if args.stats_json:
+        write_stats_json(converter, args.stats_json)
 
     # Print summary
     successful = sum(1 for success in results.values() if success)
     total = len(results)
 
-    print("\nConversion Summary:")
-    print(f"  Total files: {total}")
-    print(f"  Successful: {successful}")
-    print(f"  Failed: {total - successful}")
+    print("\nConversion Summary:", file=messages)
+    print(f"  Total files: {total}", file=messages)
+    print(f"  Successful: {successful}", file=messages)
+    print(f"  Failed: {total - successful}", file=messages)
 
     if successful < total:
-        print("\nFailed files:")
+        print("\nFailed files:", file=messages)
         for file_path, success in results.items():
             if not success:
-                print(f"  - {file_path}")
+                print(f"  - {file_path}", file=messages)
 
     # Exit with appropriate code
     sys.exit(0 if successful == total else 1)
@@ -0,0 +1,168 @@
+"""
+Compressed Output Module
+
+Writes SQL output straight to .gz, .xz or .bz2 files. Text is cut into blocks
+that are compressed independently on a thread pool (the codecs release the
+GIL) and written as consecutive members/streams, which gzip, xz and bzip2
+decompress as one file.
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+CODECS = ("gzip", "xz", "bz2")
+
+EXTENSIONS = {"gzip": ".gz", "xz": ".xz", "bz2": ".bz2"}
+
+# Uncompressed characters per independently compressed block
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    # mtime=0 keeps the output reproducible
+    "gzip": lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+    "xz": lambda data: lzma.compress(data, preset=6),
+    "bz2": lambda data: bz2.compress(data, compresslevel=9),
+}
+
+
+def codec_for_path(path: str) -> Optional[str]:
+    """
+    Pick the codec matching an output file name.
+
+    Args:
+        path: Output file path, e.g. "table.sql.gz"
+
+    Returns:
+        Codec name, or None for uncompressed output
+    """
+    lowered = path.lower()
+    for codec, extension in EXTENSIONS.items():
+        if lowered.endswith(extension):
+            return codec
+    return None
+
+
+class CompressedWriter:
+    """
+    Text file replacement that compresses what is written to it.
+
+    Blocks are compressed in the background while the caller keeps
+    formatting; write() only waits when more than max_pending blocks are
+    still being compressed. Compressed blocks are written in order.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        codec: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        threads: Optional[int] = None,
+        append: bool = False,
+    ):
+        """
+        Open the output file.
+
+        Args:
+            path: Path of the compressed file to create
+            codec: One of CODECS
+            block_size: Uncompressed characters per block
+            threads: Number of compression threads (default: CPU count)
+            append: Add new members after the existing contents of the file
+                instead of replacing it
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec!r} (expected one of {', '.join(CODECS)})")
+
+        self.name = path
+        self.codec = codec
+        self.block_size = max(1, block_size)
+        threads = threads or os.cpu_count() or 1
+        self.max_pending = 2 * threads
+
+        self._compress = COMPRESSORS[codec]
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._pending: Deque["Future[bytes]"] = deque()
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._raw = open(path, "ab" if append else "wb")
+
+    def write(self, text: str) -> int:
+        """
+        Buffer text, handing full blocks to the compression threads.
+
+        Args:
+            text: Text to write
+
+        Returns:
+            Number of characters written
+        """
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.block_size:
+            self._submit()
+        return len(text)
+
+    def flush(self) -> None:
+        """Compress and write everything written so far."""
+        if self._buffer:
+            self._submit()
+        while self._pending:
+            self._raw.write(self._pending.popleft().result())
+        self._raw.flush()
+
+    def fileno(self) -> int:
+        """Return the descriptor of the compressed file (call flush() first)."""
+        return self._raw.fileno()
+
+    def close(self) -> None:
+        """Flush the remaining text and close the file."""
+        if self._raw.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+            self._raw.close()
+
+    def __enter__(self) -> "CompressedWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _submit(self) -> None:
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer = []
+        self._buffered = 0
+
+        self._pending.append(self._executor.submit(self._compress, data))
+        while len(self._pending) > self.max_pending:
+            self._raw.write(self._pending.popleft().result())
+
+
+def open_output(
+    path: str,
+    codec: Optional[str] = None,
+    append: bool = False,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Any:
+    """
+    Open an output file for text, compressed if a codec is given.
+
+    Args:
+        path: Path of the file to create
+        codec: One of CODECS, or None for a plain UTF-8 text file
+        append: Write after the existing contents of the file
+        block_size: Uncompressed characters per compressed block
+
+    Returns:
+        Writable text file object
+    """
+    if codec is None:
+        return open(path, "a" if append else "w", encoding="utf-8")
+    return CompressedWriter(path, codec, block_size, append=append)
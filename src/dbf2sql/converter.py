@@ -4,10 +4,20 @@ DBF to SQL Converter Core Module
 Contains the main converter class and functionality.
 """
 
+import hashlib
+import json
 import logging
+import os
+import re
+import shutil
 import sys
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 try:
     from dbfread import DBF  # type: ignore
@@ -15,21 +25,255 @@ except ImportError:
     print("Error: dbfread library not found. Please install it with: pip install dbfread")
     sys.exit(1)
 
+from .cache import CACHE_FILE, ConversionCache
+from .checkpoint import DEFAULT_CHECKPOINT_INTERVAL, Checkpoint, synced_offset
+from .compression import CODECS, DEFAULT_BLOCK_SIZE, EXTENSIONS, codec_for_path, open_output
+from .dialects import Dialect, get_dialect
+from .filters import WhereClause
+from .memory import MEMORY_SAMPLE_ROWS, MemoryMonitor, format_bytes, plan_budget, rows_size
+from .parallel import append_file, iter_batch_ranges, partition_records
+from .pipeline import ConversionPipeline, PipelineStats
+from .progress import Progress, ProgressUpdate
+from .reader import (
+    DBFReader,
+    UnsupportedDBFError,
+    ascii_safe_encoding,
+    estimate_data_size,
+    select_fields,
+)
+from .sharding import MANIFEST_SUFFIX, ShardedWriter, shard_base
+from .sinks import DatabaseSink, connection_dialect
+from .stats import ConversionStats
+from .vectorized import NumpyBatchRenderer, numpy_available
+
+READERS = ("auto", "native", "dbfread")
+ENGINES = ("python", "numpy")
+OUTPUT_FORMATS = ("insert", "bulk", "copy")
+
+ValueEncoder = Callable[[Any], str]
+RawEncoder = Callable[[bytes], str]
+
+# Numeric field contents that are already valid SQL literals
+PLAIN_NUMBER = re.compile(rb"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)")
+
+
+def _values_tuple(items: List[Tuple[str, Any]]) -> Tuple[Any, ...]:
+    """dbfread record factory returning field values positionally."""
+    return tuple(value for _, value in items)
+
+
+class _DBFView:
+    """
+    dbfread table restricted to a subset of its fields and/or rows.
+
+    dbfread parses every field of every record; rows rejected by the filter
+    and values of fields outside the projection are dropped afterwards. Like
+    DBFReader, len() counts the active records before the filter.
+    """
+
+    def __init__(
+        self,
+        table: Any,
+        indexes: Optional[List[int]] = None,
+        row_filter: Optional[Callable[[Tuple[Any, ...]], bool]] = None,
+    ):
+        self._table = table
+        self._indexes = indexes
+        self._row_filter = row_filter
+        self.filename = table.filename
+        self.fields = table.fields if indexes is None else [table.fields[i] for i in indexes]
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        rows: Iterator[Tuple[Any, ...]] = iter(self._table)
+        if self._row_filter is not None:
+            rows = filter(self._row_filter, rows)
+        if self._indexes is None:
+            return rows
+        indexes = self._indexes
+        return (tuple([row[index] for index in indexes]) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __enter__(self) -> "_DBFView":
+        self._table.__enter__()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> Any:
+        return self._table.__exit__(*exc_info)
+
 
 class DBFToSQLConverter:
     """Memory-efficient DBF to SQL converter."""
 
-    def __init__(self, batch_size: int = 1000, encoding: str = "utf-8"):
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        encoding: str = "utf-8",
+        reader: str = "auto",
+        engine: str = "python",
+        jobs: int = 1,
+        workers: int = 1,
+        pipeline_workers: int = 0,
+        queue_depth: int = 4,
+        passthrough: bool = False,
+        max_statement_bytes: int = 0,
+        columns: Optional[List[str]] = None,
+        exclude_columns: Optional[List[str]] = None,
+        where: Optional[str] = None,
+        output_format: str = "insert",
+        dialect: str = "generic",
+        compress: Optional[str] = None,
+        max_output_size: int = 0,
+        rows_per_file: int = 0,
+        force: bool = False,
+        cache_file: Optional[str] = None,
+        tail: bool = False,
+        checkpoint_interval: int = 0,
+        resume: bool = False,
+        progress: Union[str, Callable[[ProgressUpdate], None]] = "log",
+        progress_interval: Optional[float] = None,
+        max_memory: int = 0,
+    ):
         """
         Initialize the converter.
 
         Args:
             batch_size: Number of records to process in each batch
             encoding: Character encoding for DBF files
+            reader: Record reader to use: "native" (memory-mapped), "dbfread",
+                or "auto" to use the native reader and fall back to dbfread
+                for variants it does not support
+            engine: Value rendering engine: "python" (row by row) or "numpy"
+                (column-wise over structured arrays, requires NumPy and the
+                native reader)
+            jobs: Number of worker processes used to convert a single file;
+                the record range is split into shards that are converted in
+                parallel and stitched together (native reader only)
+            workers: Number of worker processes used by convert_multiple_files;
+                files are scheduled largest first
+            pipeline_workers: Number of formatter workers for a pipelined
+                conversion (reader thread, formatter pool, ordered writer
+                thread); 0 converts on a single thread
+            queue_depth: Capacity, in batches, of each bounded queue between
+                pipeline stages
+            passthrough: Copy N and F field bytes straight into the output
+                instead of parsing them into numbers, and escape C fields on
+                the raw bytes where the encoding allows it (native reader
+                only); numeric literals keep their DBF formatting, e.g. 12.50
+            max_statement_bytes: Upper bound on the UTF-8 size of each INSERT
+                statement; a batch that would exceed it is split into several
+                statements, batch_size remaining the row cap (0 disables)
+            columns: DBF fields to convert, matched case-insensitively
+                (default: all fields); other fields are never decoded
+            exclude_columns: DBF fields to leave out of the conversion
+            where: Row filter such as "STATUS = 'A' AND DATE >= 20240101"
+                (see WhereClause); with the native reader it is evaluated on
+                the raw record bytes before anything is decoded
+            output_format: "insert" for multi-row INSERT statements, "bulk"
+                for the dialect's fastest bulk-load form (see Dialect), or
+                "copy", shorthand for the PostgreSQL dialect's COPY ... FROM
+                stdin block (the numpy engine renders INSERT values only, so
+                tab-separated output uses the python engine)
+            dialect: Target database, one of DIALECTS: "generic" (the original
+                output), "mysql", "postgresql", "sqlite" or "sqlserver"
+            compress: Compress the SQL output with "gzip", "xz" or "bz2"; the
+                codec is otherwise chosen from the output file extension
+                (.gz, .xz, .bz2). Blocks are compressed on a thread pool
+            max_output_size: Split the output into numbered shard files of at
+                most this many uncompressed bytes each, listed in a JSON
+                manifest (0 disables); see ShardedWriter
+            rows_per_file: Split the output into shard files of at most this
+                many rows each, rounded down to whole batches (0 disables)
+            force: Make convert_multiple_files reconvert every file, ignoring
+                the conversion cache (see ConversionCache)
+            cache_file: Path of the conversion cache file (default: CACHE_FILE
+                in the output directory; without an output directory and a
+                cache file no cache is kept, so nothing is written next to the
+                DBF files)
+            tail: Make convert_multiple_files convert only the records appended
+                since the previous run of each file (see convert_dbf_tail)
+            checkpoint_interval: Record a checkpoint next to the output file
+                every this many records (rounded down to whole batches), after
+                syncing the output to disk; 0 disables checkpoints unless
+                resume is set (native reader, sequential conversion only)
+            resume: Continue an interrupted conversion from its checkpoint:
+                the output is truncated to the checkpointed size and reading
+                starts at the next record. Without a usable checkpoint the
+                conversion starts over, writing checkpoints every
+                checkpoint_interval (default: DEFAULT_CHECKPOINT_INTERVAL) records
+            progress: How to report progress: "log" (info messages), "bar"
+                (a progress bar on stderr), "json" (JSON lines on stderr),
+                "none", or a callable receiving ProgressUpdate (see Progress)
+            progress_interval: Minimum seconds between two progress updates
+                (default: 5 for "log", 0.2 for "bar", 1 for "json", 0.5 for
+                a callable)
+            max_memory: Memory budget in bytes (0 disables). Batches and
+                compression blocks are sized from the measured memory of a
+                sample of rows to stay within it, shared by the jobs and
+                workers processes, and each file's memory high-water mark is
+                reported (see plan_budget and MemoryMonitor)
         """
+        if reader not in READERS:
+            raise ValueError(f"Unknown reader: {reader!r} (expected one of {', '.join(READERS)})")
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine!r} (expected one of {', '.join(ENGINES)})")
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format: {output_format!r} "
+                f"(expected one of {', '.join(OUTPUT_FORMATS)})"
+            )
+        if output_format == "copy":
+            if dialect not in ("generic", "postgresql"):
+                raise ValueError(f"COPY output requires the postgresql dialect, not {dialect!r}")
+            dialect, output_format = "postgresql", "bulk"
+        if compress is not None and compress not in CODECS:
+            raise ValueError(
+                f"Unknown compression: {compress!r} (expected one of {', '.join(CODECS)})"
+            )
+        if engine == "numpy" and not numpy_available():
+            raise ImportError(
+                "NumPy is required for the numpy engine. Please install it with: pip install numpy"
+            )
+
         self.batch_size = batch_size
         self.encoding = encoding
+        self.reader = reader
+        self.engine = engine
+        self.jobs = max(1, jobs)
+        self.workers = max(1, workers)
+        self.pipeline_workers = max(0, pipeline_workers)
+        self.queue_depth = max(1, queue_depth)
+        self.passthrough = passthrough
+        self.max_statement_bytes = max(0, max_statement_bytes)
+        self.columns = columns
+        self.exclude_columns = exclude_columns
+        self.where = WhereClause(where) if where else None
+        self.output_format = output_format
+        self.dialect: Dialect = get_dialect(dialect)
+        self.compress = compress
+        self.max_output_size = max(0, max_output_size)
+        self.rows_per_file = max(0, rows_per_file)
+        self.force = force
+        self.cache_file = cache_file
+        self.tail = tail
+        self.checkpoint_interval = max(0, checkpoint_interval)
+        self.resume = resume
+        self.max_memory = max(0, max_memory)
+        self.compress_block_size = DEFAULT_BLOCK_SIZE
+        # batch_size as configured while _memory_budget has replaced it with its plan
+        self._configured_batch_size: Optional[int] = None
+        self.bulk_format = self.dialect.bulk_format if output_format == "bulk" else "insert"
+        self._delimited = self.bulk_format in ("copy", "tsv")
+        self.pipeline_stats: Optional[PipelineStats] = None
+        self.stats = ConversionStats()
+        self.file_stats: Dict[str, ConversionStats] = {}
         self.logger = self._setup_logger()
+        self.progress = Progress(progress, progress_interval, self.logger)
+
+        if self.engine == "numpy" and self._delimited:
+            self.logger.info("numpy engine does not render tab-separated rows; using python engine")
+            self.engine = "python"
 
     def _setup_logger(self) -> logging.Logger:
         """Set up logging configuration."""
@@ -44,6 +288,88 @@ class DBFToSQLConverter:
 
         return logger
 
+    def _open_table(self, dbf_file_path: str) -> Union[DBFReader, Any]:
+        """
+        Open a DBF file with the configured reader.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+
+        Returns:
+            A DBFReader, or a dbfread DBF table when falling back
+        """
+        if self.reader != "dbfread":
+            try:
+                return self._open_native(dbf_file_path)
+            except UnsupportedDBFError as e:
+                if self.reader == "native":
+                    raise
+                self.logger.debug(f"Native reader unavailable for {dbf_file_path}: {e}")
+
+        table = DBF(
+            dbf_file_path,
+            encoding=self.encoding,
+            char_decode_errors="ignore",
+            recfactory=_values_tuple,
+        )
+        if self.columns is None and self.exclude_columns is None and self.where is None:
+            return table
+
+        names = [str(field.name) for field in table.fields]
+        indexes = None
+        if self.columns is not None or self.exclude_columns is not None:
+            indexes = select_fields(names, self.columns, self.exclude_columns)
+        row_filter = None
+        if self.where is not None:
+            row_filter = self.where.compile_values(
+                names, [str(field.type) for field in table.fields]
+            )
+        return _DBFView(table, indexes, row_filter)
+
+    def _open_native(self, dbf_file_path: str) -> DBFReader:
+        """
+        Open a DBF file with the native reader and the configured projection.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+
+        Returns:
+            An open DBFReader
+        """
+        reader = DBFReader(
+            dbf_file_path,
+            encoding=self.encoding,
+            char_decode_errors="ignore",
+            columns=self.columns,
+            exclude_columns=self.exclude_columns,
+        )
+        if self.where is not None:
+            try:
+                reader.set_filter(self.where.compile_raw(reader))
+            except Exception:
+                reader.close()
+                raise
+        return reader
+
+    def _iter_rows(
+        self, table: Union[DBFReader, Any], start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over table rows as tuples of values in field order.
+
+        Args:
+            table: Table returned by _open_table
+            start: Index of the first record to read (native reader only)
+            stop: Index after the last record to read (native reader only)
+
+        Yields:
+            Tuple of field values for each record
+        """
+        if isinstance(table, DBFReader):
+            yield from table.iter_rows(start, stop)
+        else:
+            yield from table
+
     def _sanitize_identifier(self, identifier: str) -> str:
         """
         Sanitize SQL identifiers (table names, field names) to be safe.
@@ -55,8 +381,6 @@ class DBFToSQLConverter:
             Sanitized identifier
         """
         # Replace problematic characters with underscores
-        import re
-
         sanitized = re.sub(r"[^\w]", "_", identifier)
 
         # Ensure it doesn't start with a number
@@ -69,6 +393,31 @@ class DBFToSQLConverter:
 
         return sanitized
 
+    def _describe_fields(self, table: Union[DBFReader, Any]) -> List[Dict[str, Any]]:
+        """
+        Describe the fields of an open table with sanitized names.
+
+        Args:
+            table: Table returned by _open_table
+
+        Returns:
+            List of field definitions with name, type, length and decimal
+        """
+        fields: List[Dict[str, Any]] = []
+        for field in table.fields:
+            field_any = cast(Any, field)
+            sanitized_name = self._sanitize_identifier(str(field_any.name))
+
+            field_info: Dict[str, Any] = {
+                "name": sanitized_name,
+                "type": str(field_any.type),
+                "length": int(field_any.length),
+                "decimal": int(field_any.decimal_count),
+            }
+            fields.append(field_info)
+
+        return fields
+
     def _get_sql_type(self, field_type: str, field_length: int, field_decimal: int) -> str:
         """
         Convert DBF field type to SQL type.
@@ -79,24 +428,21 @@ class DBFToSQLConverter:
             field_decimal: Decimal places
 
         Returns:
-            SQL type string
-        """
-        # Force all decimal (N and F) fields to DECIMAL(19,2)
-        if field_type == "N":
-            return "DECIMAL(19,2)"
-        if field_type == "F":
-            return "DECIMAL(19,2)"
-        type_mapping = {
-            "C": f"VARCHAR({field_length})",  # Character
-            "D": "DATE",  # Date
-            "L": "BOOLEAN",  # Logical
-            "M": "TEXT",  # Memo
-            "I": "INTEGER",  # Integer
-            "B": "DOUBLE",  # Double
-            "T": "DATETIME",  # DateTime
-            "Y": "DECIMAL(19,4)",  # Currency
-        }
-        return type_mapping.get(field_type, f"VARCHAR({field_length})")
+            SQL type string in the configured dialect
+        """
+        return self.dialect.sql_type(field_type, field_length, field_decimal)
+
+    def _quote_identifier(self, identifier: str) -> str:
+        """
+        Quote a sanitized identifier for the configured dialect.
+
+        Args:
+            identifier: Sanitized table or field name
+
+        Returns:
+            Quoted identifier
+        """
+        return self.dialect.quote_identifier(identifier)
 
     def _escape_sql_value(self, value: Any) -> str:
         """
@@ -108,28 +454,127 @@ class DBFToSQLConverter:
         Returns:
             Escaped SQL value string
         """
-        if value is None:
-            return "NULL"
-        elif isinstance(value, str):
-            # Escape single quotes by doubling them and handle newlines
-            escaped = value.replace("'", "''").replace("\n", "\\n").replace("\r", "\\r")
-            return f"'{escaped}'"
-        elif isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        elif isinstance(value, (int, float)):
-            # Handle potential infinity and NaN values
-            if isinstance(value, float):
-                if value != value:  # NaN check
-                    return "NULL"
-                elif value == float("inf"):
-                    return "NULL"  # or a large number depending on your needs
-                elif value == float("-inf"):
-                    return "NULL"  # or a small number depending on your needs
-            return str(value)
-        else:
-            # Convert to string and escape
-            escaped = str(value).replace("'", "''").replace("\n", "\\n").replace("\r", "\\r")
-            return f"'{escaped}'"
+        return self.dialect.escape_value(value)
+
+    def _escape_delimited_value(self, value: Any) -> str:
+        """
+        Escape a value for a tab-separated bulk-load row (COPY or LOAD DATA).
+
+        Args:
+            value: Value to escape
+
+        Returns:
+            Field text: \\N for NULL, backslash escapes for special characters
+        """
+        return self.dialect.escape_delimited_value(value)
+
+    def _build_value_encoders(self, field_types: List[str]) -> List[ValueEncoder]:
+        """
+        Build one value encoder per column from the DBF field types.
+
+        Each encoder produces exactly what _escape_sql_value (or, for
+        tab-separated bulk output, _escape_delimited_value) would for the
+        values that field type decodes to, without the generic type dispatch.
+
+        Args:
+            field_types: DBF field type of each column, in column order
+
+        Returns:
+            List of encoder callables, one per column
+        """
+        if self._delimited:
+            return self.dialect.delimited_encoders(field_types)
+        return self.dialect.value_encoders(field_types)
+
+    def _build_raw_encoders(
+        self, table: DBFReader, encoders: List[ValueEncoder]
+    ) -> List[Tuple[int, int, RawEncoder]]:
+        """
+        Build per-column encoders that render raw field bytes for passthrough mode.
+
+        N and F fields holding a plain "-123.45" literal are copied as is and
+        blank ones become NULL; anything else is decoded and encoded normally.
+        C fields are stripped and escaped on the raw bytes when the encoding is
+        ASCII-safe, then decoded once. Other field types are decoded and encoded.
+
+        Args:
+            table: Open native reader for the DBF file
+            encoders: Per-column value encoders from _build_value_encoders
+
+        Returns:
+            List of (start, end, raw encoder) entries in field order
+        """
+        encoding = table.encoding
+        errors = table.char_decode_errors
+        escape_raw = ascii_safe_encoding(encoding)
+        plain_number = PLAIN_NUMBER.fullmatch
+        delimited = self._delimited
+        null = "\\N" if delimited else "NULL"
+        escapes = self.dialect.delimited_escapes if delimited else self.dialect.text_escapes
+        raw_escapes = [(old.encode("ascii"), new.encode("ascii")) for old, new in escapes]
+        prefix = "" if delimited else self.dialect.text_prefix
+        suffix = "" if delimited else "'"
+
+        def passthrough_numeric(decode: Callable[[bytes], Any], encode: ValueEncoder) -> RawEncoder:
+            def render(data: bytes) -> str:
+                text = data.strip()
+                if not text:
+                    return null
+                if plain_number(text):
+                    return text.decode("ascii")
+                return encode(decode(data))
+
+            return render
+
+        def passthrough_char(decode: Callable[[bytes], Any], encode: ValueEncoder) -> RawEncoder:
+            if not escape_raw:
+                return lambda data: encode(decode(data))
+
+            def render(data: bytes) -> str:
+                data = data.rstrip(b"\0 ")
+                for old, new in raw_escapes:
+                    data = data.replace(old, new)
+                return prefix + data.decode(encoding, errors) + suffix
+
+            return render
+
+        def decode_and_encode(decode: Callable[[bytes], Any], encode: ValueEncoder) -> RawEncoder:
+            return lambda data: encode(decode(data))
+
+        raw_encoders: List[Tuple[int, int, RawEncoder]] = []
+        for field, (start, end, decode), encode in zip(table.fields, table.decoders, encoders):
+            if field.type in "NF":
+                factory = passthrough_numeric
+            elif field.type in "CV":
+                factory = passthrough_char
+            else:
+                factory = decode_and_encode
+            raw_encoders.append((start, end, factory(decode, encode)))
+
+        return raw_encoders
+
+    def _render_raw_records(
+        self, records: Iterable[bytes], raw_encoders: List[Tuple[int, int, RawEncoder]]
+    ) -> List[str]:
+        """
+        Render raw records to VALUES tuples (or COPY rows) with passthrough encoders.
+
+        Args:
+            records: Raw records including the deletion flag byte
+            raw_encoders: Entries from _build_raw_encoders
+
+        Returns:
+            List of rendered "(v1, v2, ...)" tuples or tab-separated COPY rows
+        """
+        if self._delimited:
+            return [
+                "\t".join([encode(record[start:end]) for start, end, encode in raw_encoders])
+                for record in records
+            ]
+        return [
+            f"({', '.join([encode(record[start:end]) for start, end, encode in raw_encoders])})"
+            for record in records
+        ]
 
     def _create_table_sql(self, table_name: str, fields: List[Dict[str, Any]]) -> str:
         """
@@ -143,55 +588,330 @@ class DBFToSQLConverter:
             CREATE TABLE SQL statement
         """
         field_definitions: List[str] = []
+        quote = self._quote_identifier
 
         for field in fields:
             field_name = field["name"]
             sql_type = self._get_sql_type(field["type"], field["length"], field["decimal"])
-            field_definitions.append(f"    `{field_name}` {sql_type}")
+            field_definitions.append(f"    {quote(field_name)} {sql_type}")
+
+        columns_sql = ",\n".join(field_definitions)
+        index_column = quote(fields[0]["name"] if fields else "id")
 
         return f"""-- Table: {table_name}
 -- Generated by DBF2SQL Converter
-DROP TABLE IF EXISTS `{table_name}`;
-CREATE TABLE `{table_name}` (
-{',\n'.join(field_definitions)}
+DROP TABLE IF EXISTS {quote(table_name)};
+CREATE TABLE {quote(table_name)} (
+{columns_sql}
 );
 
 -- Create index on first column for better performance (optional)
--- CREATE INDEX idx_{table_name}_1 ON `{table_name}` (`{fields[0]['name'] if fields else 'id'}`);
+-- CREATE INDEX idx_{table_name}_1 ON {quote(table_name)} ({index_column});
 """
 
     def _process_records_batch(
-        self, records: List[Dict[str, Any]], table_name: str, field_names: List[str]
+        self,
+        records: Iterable[Tuple[Any, ...]],
+        table_name: str,
+        field_names: List[str],
+        encoders: Optional[List[ValueEncoder]] = None,
     ) -> str:
         """
-        Process a batch of records into a single INSERT statement.
+        Process a batch of records into a single INSERT statement (or bulk-load rows).
 
         Args:
-            records: List of record dictionaries
+            records: Rows as tuples of values in the same order as field_names
             table_name: Name of the table
             field_names: List of field names
+            encoders: Per-column value encoders from _build_value_encoders,
+                applied positionally (default: _escape_sql_value for every value)
 
         Returns:
-            INSERT SQL statement
+            INSERT SQL statement, or tab-separated bulk-load rows
         """
-        if not records:
+        if self._delimited:
+            if encoders is None:
+                encoders = [self._escape_delimited_value] * len(field_names)
+            rows = [
+                "\t".join([encode(value) for encode, value in zip(encoders, row)])
+                for row in records
+            ]
+            return "\n".join(rows)
+
+        if encoders is None:
+            encoders = [self._escape_sql_value] * len(field_names)
+
+        values_list = [
+            f"({', '.join([encode(value) for encode, value in zip(encoders, row)])})"
+            for row in records
+        ]
+        if not values_list:
             return ""
 
-        # Build the INSERT statement
-        field_list = ", ".join(f"`{field}`" for field in field_names)
-        values_list: List[str] = []
+        return self._format_insert(table_name, field_names, values_list)
 
-        for record in records:
-            # Get values in the same order as field_names
-            values = [self._escape_sql_value(record.get(field)) for field in field_names]
-            values_list.append(f"({', '.join(values)})")
+    def _format_batch(self, table_name: str, field_names: List[str], values_list: List[str]) -> str:
+        """
+        Combine rendered rows into the output text of one batch.
 
-        # Combine all values into a single INSERT statement
-        values_str = ",\n    ".join(values_list)
+        Args:
+            table_name: Name of the table
+            field_names: List of field names
+            values_list: Rendered "(v1, v2, ...)" tuples, or tab-separated rows
 
-        return f"""INSERT INTO `{table_name}` ({field_list}) VALUES
-    {values_str};
-"""
+        Returns:
+            INSERT SQL statement(s), or newline-separated bulk-load rows
+        """
+        if self._delimited:
+            return "\n".join(values_list)
+        return self._format_insert(table_name, field_names, values_list)
+
+    def _format_insert(
+        self, table_name: str, field_names: List[str], values_list: List[str]
+    ) -> str:
+        """
+        Combine rendered value tuples into INSERT statements.
+
+        Normally a single statement is produced. With max_statement_bytes set,
+        or more tuples than the dialect allows in one statement, the tuples
+        are split across as many statements as needed, separated by blank lines.
+
+        Args:
+            table_name: Name of the table
+            field_names: List of field names
+            values_list: Rendered "(v1, v2, ...)" tuples
+
+        Returns:
+            INSERT SQL statement(s)
+        """
+        quote = self._quote_identifier
+        field_list = ", ".join(quote(field) for field in field_names)
+        prefix = f"INSERT INTO {quote(table_name)} ({field_list}) VALUES\n    "
+
+        max_rows = self.dialect.max_insert_rows
+        if self.max_statement_bytes or (max_rows and len(values_list) > max_rows):
+            chunks = self._split_values(len(prefix.encode("utf-8")), values_list)
+            if len(chunks) > 1:
+                return "\n".join(prefix + ",\n    ".join(chunk) + ";\n" for chunk in chunks)
+
+        return prefix + ",\n    ".join(values_list) + ";\n"
+
+    def _split_values(self, prefix_bytes: int, values_list: List[str]) -> List[List[str]]:
+        """
+        Split rendered value tuples into chunks that fit max_statement_bytes
+        and the dialect's max_insert_rows.
+
+        A tuple larger than the budget on its own still gets a statement.
+
+        Args:
+            prefix_bytes: UTF-8 size of the "INSERT INTO ... VALUES" prefix
+            values_list: Rendered "(v1, v2, ...)" tuples
+
+        Returns:
+            List of chunks of consecutive tuples, in order
+        """
+        # Separator ",\n    " between tuples and ";\n" after the last one
+        budget = self.max_statement_bytes - prefix_bytes - 2
+        if not self.max_statement_bytes:
+            budget = sys.maxsize
+        max_rows = self.dialect.max_insert_rows or len(values_list)
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        used = 0
+
+        for values in values_list:
+            size = len(values) if values.isascii() else len(values.encode("utf-8"))
+            if chunk and (used + 6 + size > budget or len(chunk) == max_rows):
+                chunks.append(chunk)
+                chunk = []
+                used = 0
+            used += size + 6 if chunk else size
+            chunk.append(values)
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _iter_insert_batches(
+        self,
+        table: Union[DBFReader, Any],
+        table_name: str,
+        field_names: List[str],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Generate INSERT statements for a table using the configured engine.
+
+        Args:
+            table: Table returned by _open_table
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            start: Index of the first record to read (native reader only)
+            stop: Index after the last record to read (native reader only)
+
+        Yields:
+            Tuples of (INSERT SQL statement, number of records in it)
+        """
+        stats = self.stats
+        encoders = self._build_value_encoders(
+            [str(cast(Any, field).type) for field in table.fields]
+        )
+
+        if self.engine == "numpy":
+            if isinstance(table, DBFReader):
+                renderer = NumpyBatchRenderer(table, encoders, self.passthrough, self.dialect)
+                batches = renderer.iter_batches(self.batch_size, start, stop)
+                while True:
+                    with stats.stage("format"):
+                        values_list = next(batches, None)
+                        if values_list is None:
+                            break
+                        insert_sql = self._format_batch(table_name, field_names, values_list)
+                    stats.add_batch(insert_sql, len(values_list))
+                    yield insert_sql, len(values_list)
+                return
+
+            self.logger.info("numpy engine requires the native reader; using python engine")
+
+        if self.passthrough:
+            if isinstance(table, DBFReader):
+                raw_encoders = self._build_raw_encoders(table, encoders)
+                records = map(bytes, table.iter_records(start, stop))
+                while True:
+                    with stats.stage("format"):
+                        values_list = self._render_raw_records(
+                            islice(records, self.batch_size), raw_encoders
+                        )
+                        if not values_list:
+                            break
+                        insert_sql = self._format_batch(table_name, field_names, values_list)
+                    stats.add_batch(insert_sql, len(values_list))
+                    yield insert_sql, len(values_list)
+                return
+
+            self.logger.info("passthrough requires the native reader; parsing values")
+
+        rows = self._iter_rows(table, start, stop)
+
+        while True:
+            with stats.stage("read"):
+                batch = list(islice(rows, self.batch_size))
+            if not batch:
+                break
+            with stats.stage("format"):
+                insert_sql = self._process_records_batch(batch, table_name, field_names, encoders)
+            stats.add_batch(insert_sql, len(batch))
+            yield insert_sql, len(batch)
+
+    def _write_record_range(
+        self,
+        dbf_file_path: str,
+        table_name: str,
+        field_names: List[str],
+        start: int,
+        stop: int,
+        shard_path: str,
+        codec: Optional[str] = None,
+    ) -> int:
+        """
+        Convert a range of records into a shard file of INSERT statements.
+
+        Runs in a worker process; the shard holds exactly the INSERT statements
+        a sequential conversion would write for the same records.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            start: Index of the first record to convert
+            stop: Index after the last record to convert
+            shard_path: Path of the shard file to write
+            codec: Compression codec of the shard; compressed shards are
+                concatenated into a valid multi-member file
+
+        Returns:
+            Number of records written to the shard
+        """
+        total_processed = 0
+
+        with self._open_native(dbf_file_path) as table:
+            with open_output(shard_path, codec, block_size=self.compress_block_size) as shard_file:
+                for insert_sql, count in self._iter_insert_batches(
+                    table, table_name, field_names, start, stop
+                ):
+                    shard_file.write(insert_sql)
+                    shard_file.write("\n")
+                    total_processed += count
+
+        return total_processed
+
+    def _write_inserts_parallel(
+        self,
+        dbf_file_path: str,
+        sql_file_path: str,
+        table_name: str,
+        field_names: List[str],
+        ranges: List[Tuple[int, int]],
+        sql_file: Any,
+        codec: Optional[str] = None,
+    ) -> int:
+        """
+        Convert record ranges in worker processes and append the shards in order.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            sql_file_path: Path to the output SQL file
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            ranges: Record index ranges from partition_records
+            sql_file: Open output file; shards are appended at its current end
+            codec: Compression codec of sql_file, used for the shards as well
+
+        Returns:
+            Total number of records converted
+        """
+        shard_dir = tempfile.mkdtemp(
+            prefix=f".{Path(sql_file_path).name}.", dir=str(Path(sql_file_path).parent)
+        )
+        total_processed = 0
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(ranges))) as executor:
+                suffix = ".sql" + (EXTENSIONS[codec] if codec else "")
+                shard_paths = [
+                    os.path.join(shard_dir, f"{index:05d}{suffix}") for index in range(len(ranges))
+                ]
+                futures = [
+                    executor.submit(
+                        self._write_record_range,
+                        dbf_file_path,
+                        table_name,
+                        field_names,
+                        start,
+                        stop,
+                        shard_path,
+                        codec,
+                    )
+                    for (start, stop), shard_path in zip(ranges, shard_paths)
+                ]
+
+                # Stitch shards in order while later ones are still being converted
+                sql_file.flush()
+                for future, shard_path in zip(futures, shard_paths):
+                    # Workers decode and format; waiting on them counts as formatting
+                    with self.stats.stage("format"):
+                        count = future.result()
+                    total_processed += count
+                    self.stats.batches += -(-count // self.batch_size)
+                    with self.stats.stage("write"):
+                        append_file(sql_file.fileno(), shard_path)
+                        os.remove(shard_path)
+                    self.progress.update(total_processed)
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
+
+        return total_processed
 
     def convert_dbf_to_sql(
         self,
@@ -219,108 +939,1068 @@ CREATE TABLE `{table_name}` (
             # Generate SQL file path if not provided
             if sql_file_path is None:
                 if output_dir is not None:
-                    # Use specified output directory
-                    output_path = Path(output_dir)
-                    output_path.mkdir(parents=True, exist_ok=True)
-                    sql_file_path = str(output_path / f"{dbf_path.stem}.sql")
-                else:
-                    # Use same directory as DBF file
-                    sql_file_path = str(dbf_path.with_suffix(".sql"))
+                    Path(output_dir).mkdir(parents=True, exist_ok=True)
+                sql_file_path = self._default_sql_path(dbf_file_path, output_dir)
+
+            codec = self.compress or codec_for_path(sql_file_path)
 
             self.logger.info(f"Converting {dbf_file_path} to {sql_file_path}")
 
+            stats = self.stats = ConversionStats(dbf_file_path, sql_file_path)
+            started = time.perf_counter()
+            stats.input_bytes = dbf_path.stat().st_size
+
             # Open DBF file
-            with DBF(dbf_file_path, encoding=self.encoding, char_decode_errors="ignore") as dbf:
+            with stats.stage("open"):
+                table = self._open_table(dbf_file_path)
+            with table as dbf:
                 # Get table name from filename (without extension) and sanitize it
                 table_name = self._sanitize_identifier(dbf_path.stem)
 
-                # Get field information and create mapping from original to sanitized names
-                fields: List[Dict[str, Any]] = []
-                original_to_sanitized: Dict[str, str] = {}
-                for field in dbf.fields:  # type: ignore
-                    field_any = cast(Any, field)
-                    original_name: str = str(field_any.name)
-                    sanitized_name = self._sanitize_identifier(original_name)
-                    original_to_sanitized[original_name] = sanitized_name
-
-                    field_info: Dict[str, Any] = {
-                        "name": sanitized_name,
-                        "type": str(field_any.type),
-                        "length": int(field_any.length),
-                        "decimal": int(field_any.decimal_count),
-                    }
-                    fields.append(field_info)
-
-                field_names: List[str] = [field["name"] for field in fields]
-
-                self.logger.info(f"Table: {table_name}, Fields: {len(fields)}, Records: {len(dbf)}")
-
-                # Write SQL file
-                with open(sql_file_path, "w", encoding="utf-8") as sql_file:
-                    # Write header comment
-                    sql_file.write(f"-- Generated from {dbf_file_path}\n")
-                    sql_file.write(f"-- Total records: {len(dbf)}\n")
-                    sql_file.write("-- Generated by DBF2SQL Converter\n\n")
-
-                    # Write CREATE TABLE statement
-                    create_table_sql = self._create_table_sql(table_name, fields)
-                    sql_file.write(create_table_sql)
-                    sql_file.write("\n")
-
-                    # Process records in batches
-                    batch: List[Dict[str, Any]] = []
-                    total_processed = 0
-
-                    for record in cast(Any, dbf):
-                        # Convert record to dict and map field names
-                        original_record: Dict[str, Any] = dict(record)
-                        mapped_record: Dict[str, Any] = {}
-
-                        # Map original field names to sanitized field names
-                        for original_name, sanitized_name in original_to_sanitized.items():
-                            mapped_record[sanitized_name] = original_record.get(original_name)
-
-                        batch.append(mapped_record)
-
-                        if len(batch) >= self.batch_size:
-                            # Process batch
-                            insert_sql = self._process_records_batch(batch, table_name, field_names)
-                            sql_file.write(insert_sql)
-                            sql_file.write("\n")
-
-                            total_processed += len(batch)
-                            batch = []
-
-                            if total_processed % (self.batch_size * 10) == 0:
-                                self.logger.info(f"Processed {total_processed} records...")
-
-                    # Process remaining records
-                    if batch:
-                        insert_sql = self._process_records_batch(batch, table_name, field_names)
-                        sql_file.write(insert_sql)
-                        sql_file.write("\n")
-                        total_processed += len(batch)
-
-                    # Write footer comment
-                    sql_file.write(
-                        f"-- Conversion completed: {total_processed} records processed\n"
-                    )
+                # Get field information with sanitized names
+                with stats.stage("open"):
+                    fields = self._describe_fields(dbf)
+                record_count = len(dbf)
+
+                self.logger.info(
+                    f"Table: {table_name}, Fields: {len(fields)}, Records: {record_count}"
+                )
+                self.progress.start_file(
+                    dbf_file_path, record_count, estimate_data_size(dbf_file_path)
+                )
+
+                with self._memory_budget(dbf, table_name, fields, codec):
+                    if self.max_output_size or self.rows_per_file:
+                        total_processed = self._write_sharded(
+                            dbf, dbf_file_path, sql_file_path, codec, table_name, fields
+                        )
+                        self.logger.info(
+                            f"Successfully converted {total_processed} records to shards of "
+                            f"{sql_file_path}"
+                        )
+                    else:
+                        total_processed = self._write_table(
+                            dbf, dbf_file_path, sql_file_path, codec, table_name, fields
+                        )
+                        self.logger.info(
+                            f"Successfully converted {total_processed} records to {sql_file_path}"
+                        )
+
+            stats.records = total_processed
+            stats.wall_time = time.perf_counter() - started
+            self.progress.finish_file(total_processed)
+            self.logger.debug(f"Stats: {stats}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error converting {dbf_file_path}: {str(e)}")
+            return False
+
+    @contextmanager
+    def _memory_budget(
+        self,
+        dbf: Union[DBFReader, Any],
+        table_name: str,
+        fields: List[Dict[str, Any]],
+        codec: Optional[str] = None,
+        in_flight: int = 1,
+    ) -> Iterator[None]:
+        """
+        Fit batches and buffers to max_memory while a table is converted.
+
+        Measures the memory of a sample of decoded and rendered rows, sets
+        batch_size and compress_block_size from plan_budget for the duration
+        of the block and reports the memory high-water mark afterwards, also
+        as stats.peak_memory_bytes. Does nothing without max_memory.
 
+        Args:
+            dbf: Table returned by _open_table
+            table_name: Name of the table
+            fields: List of field definitions
+            codec: Compression codec of the output
+            in_flight: Number of batches held at the same time without a pipeline
+        """
+        if not self.max_memory:
+            yield
+            return
+
+        monitor = MemoryMonitor()
+        row_bytes = self._measure_row_bytes(dbf, table_name, fields)
+        if self.pipeline_workers:
+            # Filled read and write queues, batches being formatted and the one being written
+            in_flight = 2 * self.queue_depth + self.pipeline_workers + 1
+        else:
+            # The next batch is read while the previous one is still referenced
+            in_flight *= 2
+        processes = (self.jobs + 1 if self.jobs > 1 else 1) * self.workers
+        plan = plan_budget(
+            self.max_memory,
+            monitor.baseline or 0,
+            row_bytes,
+            self.batch_size,
+            in_flight,
+            processes,
+            (os.cpu_count() or 1) if codec else 0,
+            DEFAULT_BLOCK_SIZE,
+        )
+        if plan.batch_bytes < row_bytes * plan.batch_size:
+            self.logger.warning(
+                f"Memory budget of {format_bytes(self.max_memory)} is too small for batches of "
+                f"{plan.batch_size} rows of {row_bytes:,.0f} bytes"
+            )
+        self.logger.info(
+            f"Memory budget {format_bytes(self.max_memory)}: {row_bytes:,.0f} bytes per row, "
+            f"batches of {plan.batch_size} rows"
+            + (f", compression blocks of {format_bytes(plan.block_size)}" if codec else "")
+        )
+
+        batch_size = self._configured_batch_size = self.batch_size
+        self.batch_size, self.compress_block_size = plan.batch_size, plan.block_size
+        monitor.start()
+        try:
+            yield
+        finally:
+            self.batch_size, self.compress_block_size = batch_size, DEFAULT_BLOCK_SIZE
+            self._configured_batch_size = None
+            peak = monitor.stop()
+            self.stats.peak_memory_bytes = peak
+            if peak is None:
+                self.logger.info("Memory high-water mark cannot be measured on this platform")
+            elif peak > self.max_memory:
+                self.logger.warning(
+                    f"Memory high-water mark {format_bytes(peak)} exceeded the budget of "
+                    f"{format_bytes(self.max_memory)}"
+                )
+            else:
                 self.logger.info(
-                    f"Successfully converted {total_processed} records to {sql_file_path}"
+                    f"Memory high-water mark: {format_bytes(peak)} "
+                    f"({peak / self.max_memory:.0%} of the budget)"
+                )
+
+    def _measure_row_bytes(
+        self, table: Union[DBFReader, Any], table_name: str, fields: List[Dict[str, Any]]
+    ) -> float:
+        """
+        Measure the memory one row takes while its batch is converted.
+
+        Args:
+            table: Table returned by _open_table
+            table_name: Name of the table
+            fields: List of field definitions
+
+        Returns:
+            Bytes per row of the decoded values plus their rendered SQL, from
+            the first MEMORY_SAMPLE_ROWS rows (0.0 for an empty table)
+        """
+        rows = list(islice(self._iter_rows(table), MEMORY_SAMPLE_ROWS))
+        if not rows:
+            return 0.0
+        encoders = self._build_value_encoders(
+            [str(cast(Any, field).type) for field in table.fields]
+        )
+        sql = self._process_records_batch(
+            rows, table_name, [field["name"] for field in fields], encoders
+        )
+        # The rendered values, the statement joined from them and its encoded copy
+        # written to the file exist at the same time
+        return (rows_size(rows) + 3 * sys.getsizeof(sql)) / len(rows)
+
+    def _write_table(
+        self,
+        dbf: Union[DBFReader, Any],
+        dbf_file_path: str,
+        sql_file_path: str,
+        codec: Optional[str],
+        table_name: str,
+        fields: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Write the output of a table to its SQL file (and TSV data file).
+
+        Args:
+            dbf: Table returned by _open_table
+            dbf_file_path: Path to the DBF file
+            sql_file_path: Path of the output SQL file
+            codec: Compression codec of the SQL file
+            table_name: Name of the table
+            fields: List of field definitions
+
+        Returns:
+            Number of records written
+        """
+        # The TSV bulk form keeps the rows in a data file next to the SQL file
+        data_file_path: Optional[str] = None
+        if self.bulk_format == "tsv":
+            sql_path = Path(sql_file_path)
+            if codec_for_path(sql_file_path) is not None:
+                sql_path = sql_path.with_suffix("")
+            data_file_path = str(sql_path.with_suffix(".tsv"))
+
+        if (self.checkpoint_interval or self.resume) and not isinstance(dbf, DBFReader):
+            self.logger.info("checkpoints require the native reader; converting without")
+
+        if (self.checkpoint_interval or self.resume) and isinstance(dbf, DBFReader):
+            total_processed = self._write_sql_checkpointed(
+                dbf, dbf_file_path, table_name, fields, sql_file_path, codec, data_file_path
+            )
+        else:
+            # Write SQL file
+            with ExitStack() as stack:
+                sql_file = stack.enter_context(
+                    open_output(sql_file_path, codec, block_size=self.compress_block_size)
+                )
+                data_file = sql_file
+                data_codec = codec
+                if data_file_path is not None:
+                    data_file = stack.enter_context(
+                        open(data_file_path, "w", encoding="utf-8", newline="\n")
+                    )
+                    data_codec = None
+
+                total_processed = self._write_sql(
+                    dbf,
+                    dbf_file_path,
+                    table_name,
+                    fields,
+                    sql_file,
+                    data_file,
+                    Path(data_file_path or sql_file_path).name,
+                    sql_file_path,
+                    data_codec,
+                )
+                with self.stats.stage("write"):
+                    stack.close()
+
+        self.stats.output_bytes = sum(
+            os.path.getsize(path) for path in (sql_file_path, data_file_path) if path is not None
+        )
+        return total_processed
+
+    def _default_sql_path(self, dbf_file_path: str, output_dir: Optional[str] = None) -> str:
+        """
+        Build the output path used when none is given.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            output_dir: Output directory for SQL files (default: the DBF file's directory)
+
+        Returns:
+            Path of the .sql file, with the compression extension if any
+        """
+        dbf_path = Path(dbf_file_path)
+        if output_dir is not None:
+            sql_file_path = str(Path(output_dir) / f"{dbf_path.stem}.sql")
+        else:
+            sql_file_path = str(dbf_path.with_suffix(".sql"))
+        if self.compress is not None:
+            sql_file_path += EXTENSIONS[self.compress]
+        return sql_file_path
+
+    def iter_sql(self, dbf_file_path: str, table_name: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate the SQL for a DBF file lazily, in the order it would be written.
+
+        Yields the header comments and DDL, then the INSERT statements (or
+        bulk-load rows) one batch at a time, then the closing statements, so
+        the output can be streamed to a socket, queue or pipe without an
+        intermediate file. Batches are rendered by the configured engine on
+        the calling thread.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table (default: sanitized file stem)
+
+        Yields:
+            Chunks of SQL text; their concatenation is the .sql file
+
+        Raises:
+            ValueError: For the MySQL LOAD DATA bulk form, which needs a
+                separate data file
+        """
+        if self.bulk_format == "tsv":
+            raise ValueError("LOAD DATA output needs a separate data file and cannot be streamed")
+
+        self.stats = ConversionStats(dbf_file_path)
+        with self._open_table(dbf_file_path) as dbf:
+            if table_name is None:
+                table_name = self._sanitize_identifier(Path(dbf_file_path).stem)
+            fields = self._describe_fields(dbf)
+            for text, _ in self._iter_sql(dbf, dbf_file_path, table_name, fields, ""):
+                yield text
+
+    def write_sql(self, dbf_file_path: str, sql_file: Any, table_name: Optional[str] = None) -> int:
+        """
+        Convert a DBF file and write the SQL to an open file-like object.
+
+        Uses the pipeline when pipeline_workers is set; jobs needs a real
+        output file and is only used by convert_dbf_to_sql.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            sql_file: Object with a write(str) method, e.g. sys.stdout or a socket
+                file from socket.makefile("w")
+            table_name: Name of the table (default: sanitized file stem)
+
+        Returns:
+            Number of records written
+
+        Raises:
+            ValueError: For the MySQL LOAD DATA bulk form, which needs a
+                separate data file
+        """
+        if self.bulk_format == "tsv":
+            raise ValueError("LOAD DATA output needs a separate data file and cannot be streamed")
+
+        stats = self.stats = ConversionStats(dbf_file_path)
+        started = time.perf_counter()
+        stats.input_bytes = os.path.getsize(dbf_file_path)
+        with stats.stage("open"):
+            table = self._open_table(dbf_file_path)
+        with table as dbf:
+            if table_name is None:
+                table_name = self._sanitize_identifier(Path(dbf_file_path).stem)
+            with stats.stage("open"):
+                fields = self._describe_fields(dbf)
+            self.progress.start_file(dbf_file_path, len(dbf), estimate_data_size(dbf_file_path))
+            with self._memory_budget(dbf, table_name, fields):
+                total_processed = self._write_sql(dbf, dbf_file_path, table_name, fields, sql_file)
+        stats.records = total_processed
+        stats.wall_time = time.perf_counter() - started
+        self.progress.finish_file(total_processed)
+        return total_processed
+
+    def _sql_preamble(
+        self,
+        dbf_file_path: str,
+        record_count: int,
+        table_name: str,
+        fields: List[Dict[str, Any]],
+        data_file_name: str,
+    ) -> str:
+        """
+        Generate the header comments, DDL and bulk-load header of a table.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            record_count: Number of records reported in the header
+            table_name: Name of the table
+            fields: List of field definitions
+            data_file_name: Name of the file holding the rows (TSV form only)
+
+        Returns:
+            SQL text written before the rows
+        """
+        preamble = (
+            f"-- Generated from {dbf_file_path}\n"
+            f"-- Total records: {record_count}\n"
+            "-- Generated by DBF2SQL Converter\n\n"
+            + self._create_table_sql(table_name, fields)
+            + "\n"
+        )
+        if self.bulk_format != "insert":
+            field_names = [field["name"] for field in fields]
+            preamble += self.dialect.bulk_header_sql(table_name, field_names, data_file_name)
+        return preamble
+
+    def _sql_postamble(self, total_processed: int) -> str:
+        """
+        Generate the bulk-load footer and completion comment of a table.
+
+        Args:
+            total_processed: Number of records converted
+
+        Returns:
+            SQL text written after the rows
+        """
+        postamble = self.dialect.bulk_footer_sql() if self.bulk_format != "insert" else ""
+        return postamble + f"-- Conversion completed: {total_processed} records processed\n"
+
+    def _iter_sql(
+        self,
+        dbf: Union[DBFReader, Any],
+        dbf_file_path: str,
+        table_name: str,
+        fields: List[Dict[str, Any]],
+        data_file_name: str,
+    ) -> Iterator[Tuple[str, Optional[int]]]:
+        """
+        Generate the output of a table as (text, rows) chunks.
+
+        Args:
+            dbf: Table returned by _open_table
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table
+            fields: List of field definitions
+            data_file_name: Name of the file holding the rows (TSV form only)
+
+        Yields:
+            (text, None) for SQL statements and comments, (text, count) for
+            the rows of a batch, which go to the data file in the TSV form
+        """
+        field_names = [field["name"] for field in fields]
+        yield self._sql_preamble(dbf_file_path, len(dbf), table_name, fields, data_file_name), None
+
+        total_processed = 0
+        for insert_sql, count in self._iter_insert_batches(dbf, table_name, field_names):
+            yield insert_sql + "\n", count
+            total_processed += count
+
+        yield self._sql_postamble(total_processed), None
+
+    def _write_sql(
+        self,
+        dbf: Union[DBFReader, Any],
+        dbf_file_path: str,
+        table_name: str,
+        fields: List[Dict[str, Any]],
+        sql_file: Any,
+        data_file: Any = None,
+        data_file_name: str = "",
+        sql_file_path: Optional[str] = None,
+        data_codec: Optional[str] = None,
+    ) -> int:
+        """
+        Write the output of a table to open file objects.
+
+        Sequential conversions write the chunks of _iter_sql. With jobs (and
+        a real output file) or pipeline_workers, the rows come from the
+        worker processes or the pipeline instead, between the same preamble
+        and postamble.
+
+        Args:
+            dbf: Table returned by _open_table
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table
+            fields: List of field definitions
+            sql_file: Object the SQL is written to
+            data_file: Object the rows are written to (default: sql_file)
+            data_file_name: Name of data_file, referenced by LOAD DATA
+            sql_file_path: Path of sql_file when it is a real file; enables jobs
+            data_codec: Compression codec of data_file
+
+        Returns:
+            Number of records written
+        """
+        if data_file is None:
+            data_file = sql_file
+        field_names = [field["name"] for field in fields]
+
+        # Split the record range across worker processes if requested
+        ranges: List[Tuple[int, int]] = []
+        if self.jobs > 1 and isinstance(dbf, DBFReader) and sql_file_path is not None:
+            ranges = partition_records(dbf, self.jobs, self.batch_size)
+
+        if len(ranges) <= 1 and self.pipeline_workers == 0:
+            total_processed = 0
+            for text, count in self._iter_sql(
+                dbf, dbf_file_path, table_name, fields, data_file_name
+            ):
+                if count is None:
+                    with self.stats.stage("write"):
+                        sql_file.write(text)
+                    continue
+                with self.stats.stage("write"):
+                    data_file.write(text)
+                total_processed += count
+                self.progress.update(total_processed)
+            return total_processed
+
+        sql_file.write(
+            self._sql_preamble(dbf_file_path, len(dbf), table_name, fields, data_file_name)
+        )
+
+        if len(ranges) > 1:
+            assert sql_file_path is not None
+            total_processed = self._write_inserts_parallel(
+                dbf_file_path,
+                sql_file_path,
+                table_name,
+                field_names,
+                ranges,
+                data_file,
+                data_codec,
+            )
+        else:
+            pipeline = ConversionPipeline(
+                self, table_name, field_names, self.pipeline_workers, self.queue_depth
+            )
+            total_processed = pipeline.run(dbf, data_file)
+            self._record_pipeline_stats(pipeline.stats)
+
+        sql_file.write(self._sql_postamble(total_processed))
+        return total_processed
+
+    def _write_sql_checkpointed(
+        self,
+        dbf: DBFReader,
+        dbf_file_path: str,
+        table_name: str,
+        fields: List[Dict[str, Any]],
+        sql_file_path: str,
+        codec: Optional[str],
+        data_file_path: Optional[str] = None,
+    ) -> int:
+        """
+        Write the output of a table sequentially, checkpointing along the way.
+
+        The records are converted in ranges of checkpoint_interval active
+        records, aligned to batch_size so the batches, and hence the output,
+        are the same as without checkpoints. After each range the output is
+        synced and a Checkpoint is saved; it is removed once the conversion
+        completes. With resume set and a checkpoint that still matches the
+        source and settings, the output files are truncated to their
+        checkpointed sizes and the conversion continues from there.
+
+        Args:
+            dbf: Open native reader
+            dbf_file_path: Path to the DBF file
+            table_name: Name of the table
+            fields: List of field definitions
+            sql_file_path: Path of the output SQL file
+            codec: Compression codec of the SQL file
+            data_file_path: Path of the separate TSV data file, if any
+
+        Returns:
+            Number of records written, including those of the interrupted run
+        """
+        if self.jobs > 1 or self.pipeline_workers:
+            self.logger.info("checkpointed conversions run sequentially; ignoring jobs/pipeline")
+
+        field_names = [field["name"] for field in fields]
+        data_file_name = Path(data_file_path or sql_file_path).name
+        checkpoint = Checkpoint(sql_file_path)
+        settings = self._cache_settings()
+
+        state = checkpoint.load(dbf_file_path, settings) if self.resume else None
+        if self.resume and state is None:
+            self.logger.info(f"No usable checkpoint for {sql_file_path}; starting over")
+        start = state["next_record"] if state is not None else 0
+        total_processed = state["records"] if state is not None else 0
+        if state is not None and state.get("batch_size", self.batch_size) != self.batch_size:
+            # Keep the batches of the interrupted run, e.g. as planned for a memory budget
+            self.logger.info(f"Continuing with the checkpointed batch size {state['batch_size']}")
+            self.batch_size = state["batch_size"]
+        interval = self.checkpoint_interval or DEFAULT_CHECKPOINT_INTERVAL
+        interval = max(1, interval // self.batch_size) * self.batch_size
+        if state is not None:
+            for output_path, offset in state["offsets"].items():
+                os.truncate(output_path, offset)
+            self.logger.info(f"Resuming {dbf_file_path} at record {start}")
+
+        with ExitStack() as stack:
+            append = state is not None
+            sql_file = stack.enter_context(
+                open_output(sql_file_path, codec, append, self.compress_block_size)
+            )
+            data_file = sql_file
+            if data_file_path is not None:
+                data_file = stack.enter_context(
+                    open(data_file_path, "a" if append else "w", encoding="utf-8", newline="\n")
                 )
-                return True
+            outputs = {sql_file_path: sql_file}
+            if data_file_path is not None:
+                outputs[data_file_path] = data_file
+
+            if state is None:
+                sql_file.write(
+                    self._sql_preamble(dbf_file_path, len(dbf), table_name, fields, data_file_name)
+                )
+
+            for range_start, range_stop in iter_batch_ranges(dbf, interval):
+                if range_start < start:
+                    continue
+                for insert_sql, count in self._iter_insert_batches(
+                    dbf, table_name, field_names, range_start, range_stop
+                ):
+                    with self.stats.stage("write"):
+                        data_file.write(insert_sql)
+                        data_file.write("\n")
+                    total_processed += count
+                    self.progress.update(total_processed)
+
+                with self.stats.stage("write"):
+                    offsets = {path: synced_offset(output) for path, output in outputs.items()}
+                checkpoint.save(
+                    dbf_file_path, settings, range_stop, total_processed, offsets, self.batch_size
+                )
+                self.logger.debug(f"Checkpoint saved after {total_processed} records")
+
+            sql_file.write(self._sql_postamble(total_processed))
+
+        checkpoint.remove()
+        return total_processed
+
+    def _record_pipeline_stats(self, pipeline_stats: PipelineStats) -> None:
+        """Keep the statistics of a pipelined conversion and fold them into stats."""
+        self.pipeline_stats = pipeline_stats
+        self.logger.info(f"Pipeline: {pipeline_stats}")
+        self.stats.batches += pipeline_stats.batches
+        self.stats.peak_batch_bytes = max(
+            self.stats.peak_batch_bytes, pipeline_stats.max_batch_bytes
+        )
+        self.stats.times["read"] += pipeline_stats.reader_busy
+        self.stats.times["format"] += pipeline_stats.formatter_busy
+        self.stats.times["write"] += pipeline_stats.writer_busy
+
+    def _write_sharded(
+        self,
+        dbf: Union[DBFReader, Any],
+        dbf_file_path: str,
+        sql_file_path: str,
+        codec: Optional[str],
+        table_name: str,
+        fields: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Write the DDL and the INSERT batches of a table to numbered shard files.
 
+        Shard 0 holds the DDL; every later shard is a self-contained load of
+        consecutive batches with the dialect's bulk-load header and footer.
+        A manifest listing the shards and their row counts is written last.
+
+        Args:
+            dbf: Table returned by _open_table
+            dbf_file_path: Path to the DBF file
+            sql_file_path: Unsharded output path the shard names derive from
+            codec: Compression codec of the shards
+            table_name: Name of the table
+            fields: List of field definitions
+
+        Returns:
+            Total number of records converted
+        """
+        field_names = [field["name"] for field in fields]
+        bulk = self.bulk_format != "insert"
+
+        def shard_header(data_file_name: str) -> str:
+            header = f"-- Generated from {dbf_file_path}\n-- Table: {table_name}\n\n"
+            if bulk:
+                header += self.dialect.bulk_header_sql(table_name, field_names, data_file_name)
+            return header
+
+        writer = ShardedWriter(
+            sql_file_path,
+            codec,
+            self.max_output_size,
+            self.rows_per_file,
+            shard_header,
+            self.dialect.bulk_footer_sql() if bulk else "",
+            ".tsv" if self.bulk_format == "tsv" else None,
+            self.compress_block_size,
+        )
+        writer.write_ddl(
+            f"-- Generated from {dbf_file_path}\n"
+            f"-- Total records: {len(dbf)}\n"
+            "-- Generated by DBF2SQL Converter\n\n"
+            + self._create_table_sql(table_name, fields)
+            + "\n"
+        )
+
+        if self.jobs > 1:
+            self.logger.info("sharded output is written by a single process; ignoring jobs")
+
+        total_processed = 0
+        try:
+            if self.pipeline_workers > 0:
+                pipeline = ConversionPipeline(
+                    self, table_name, field_names, self.pipeline_workers, self.queue_depth
+                )
+                total_processed = pipeline.run(dbf, writer)
+                self._record_pipeline_stats(pipeline.stats)
+            else:
+                for insert_sql, count in self._iter_insert_batches(dbf, table_name, field_names):
+                    with self.stats.stage("write"):
+                        writer.write_batch(insert_sql, count)
+                    total_processed += count
+                    self.progress.update(total_processed)
+        except BaseException:
+            writer.abort()
+            raise
+
+        with self.stats.stage("write"):
+            manifest = writer.close(dbf_file_path, table_name)
+        self.stats.output_bytes = sum(
+            os.path.getsize(writer.base.with_name(name))
+            for shard in manifest["shards"]
+            for name in (shard["file"], shard.get("data_file"))
+            if name is not None
+        )
+        self.logger.info(f"Wrote {len(manifest['shards'])} shards and {writer.manifest_path}")
+        return total_processed
+
+    def convert_dbf_tail(self, dbf_file_path: str, output_dir: Optional[str] = None) -> bool:
+        """
+        Convert only the records appended to a DBF file since the previous run.
+
+        The number of converted records is kept in the conversion cache, so
+        either cache_file or an output directory is required. The first run
+        (or one with force set) writes the complete .sql file. Later runs read
+        from header_length + index * record_length onwards and write the new
+        records, without DDL, to a delta file named after the first record
+        index, e.g. "table.delta-50000000.sql". If the file no longer looks
+        like an extension of what was converted (a different record layout or
+        settings, fewer records, or a changed last converted record), the
+        file is converted completely again and its old delta files are
+        removed. Records deleted or edited before the last converted one are
+        not revisited. Requires the native reader.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            output_dir: Output directory for SQL files (optional)
+
+        Returns:
+            True if conversion was successful, False otherwise
+        """
+        if not Path(dbf_file_path).exists():
+            self.logger.error(f"DBF file not found: {dbf_file_path}")
+            return False
+
+        cache = self._conversion_cache(output_dir)
+        if cache is None:
+            self.logger.error(
+                f"Tail mode keeps its position in the conversion cache; give an output "
+                f"directory or a cache file to convert {dbf_file_path}"
+            )
+            return False
+
+        sql_file_path = self._default_sql_path(dbf_file_path, output_dir)
+        settings = self._cache_settings()
+        self.stats = ConversionStats(dbf_file_path)
+
+        try:
+            state = None if self.force else cache.tail(dbf_file_path)
+            with self._open_native(dbf_file_path) as dbf:
+                start = state.get("records", 0) if state is not None else 0
+                if state is not None and state == self._tail_state(dbf, start, settings):
+                    total_processed = self._write_tail(dbf, dbf_file_path, sql_file_path, start)
+                    if total_processed is not None:
+                        cache.record_tail(
+                            dbf_file_path, self._tail_state(dbf, dbf.record_count, settings)
+                        )
+                        self._save_cache(cache)
+                    return True
+                record_count = dbf.record_count
+        except UnsupportedDBFError as e:
+            self.logger.info(f"Tail mode requires the native reader ({e}); converting all records")
+            return self.convert_dbf_to_sql(dbf_file_path, output_dir=output_dir)
         except Exception as e:
             self.logger.error(f"Error converting {dbf_file_path}: {str(e)}")
             return False
 
+        if state is not None:
+            self.logger.info(f"{dbf_file_path} was not only appended to; converting all records")
+        if not self.convert_dbf_to_sql(dbf_file_path, output_dir=output_dir):
+            return False
+
+        # The complete file supersedes the deltas of earlier runs
+        base = shard_base(sql_file_path, self.compress)
+        for delta_path in base.parent.glob(f"{base.name}.delta-*"):
+            self.logger.info(f"Removing superseded {delta_path}")
+            delta_path.unlink()
+
+        try:
+            with self._open_native(dbf_file_path) as dbf:
+                if dbf.record_count != record_count:
+                    # Records were appended during the conversion; which is unknown
+                    self.logger.warning(f"{dbf_file_path} changed while it was being converted")
+                    return True
+                cache.record_tail(dbf_file_path, self._tail_state(dbf, record_count, settings))
+        except (OSError, UnsupportedDBFError) as e:
+            self.logger.warning(f"Could not cache conversion of {dbf_file_path}: {str(e)}")
+            return True
+        self._save_cache(cache)
+        return True
+
+    def _tail_state(self, dbf: DBFReader, records: int, settings: str) -> Dict[str, Any]:
+        """
+        Describe what converting the first records of a table depended on.
+
+        Args:
+            dbf: Open native reader
+            records: Number of records converted so far
+            settings: Signature of the converter settings affecting the output
+
+        Returns:
+            Dictionary that stays equal while records are only appended
+        """
+        last_record = b""
+        if 0 < records <= dbf.record_count:
+            last_record = bytes(dbf.read_block(records - 1, records))
+        return {
+            "records": records,
+            "header_length": dbf.header_length,
+            "record_length": dbf.record_length,
+            "last_record": hashlib.blake2b(last_record, digest_size=16).hexdigest(),
+            "settings": settings,
+        }
+
+    def _write_tail(
+        self, dbf: DBFReader, dbf_file_path: str, sql_file_path: str, start: int
+    ) -> Optional[int]:
+        """
+        Write the records from an index onwards to a delta file.
+
+        Args:
+            dbf: Open native reader
+            dbf_file_path: Path to the DBF file
+            sql_file_path: Path of the complete output file the delta name derives from
+            start: Index of the first record to convert
+
+        Returns:
+            Number of records written, or None if there were no new records
+        """
+        stop = dbf.record_count
+        if stop == start:
+            self.logger.info(f"No new records in {dbf_file_path}")
+            return None
+
+        base = shard_base(sql_file_path, self.compress)
+        suffix = ".sql" + (EXTENSIONS[self.compress] if self.compress else "")
+        delta_path = str(base.with_name(f"{base.name}.delta-{start}{suffix}"))
+        data_file_path: Optional[str] = None
+        if self.bulk_format == "tsv":
+            data_file_path = str(base.with_name(f"{base.name}.delta-{start}.tsv"))
+
+        table_name = self._sanitize_identifier(Path(dbf_file_path).stem)
+        fields = self._describe_fields(dbf)
+        field_names = [field["name"] for field in fields]
+        self.logger.info(
+            f"Converting records {start} to {stop - 1} of {dbf_file_path} to {delta_path}"
+        )
+
+        Path(delta_path).parent.mkdir(parents=True, exist_ok=True)
+        stats = self.stats = ConversionStats(dbf_file_path, delta_path)
+        started = time.perf_counter()
+        self.progress.start_file(dbf_file_path, stop - start, (stop - start) * dbf.record_length)
+        total_processed = 0
+        with self._memory_budget(dbf, table_name, fields, self.compress), ExitStack() as stack:
+            sql_file = stack.enter_context(
+                open_output(delta_path, self.compress, block_size=self.compress_block_size)
+            )
+            data_file = sql_file
+            if data_file_path is not None:
+                data_file = stack.enter_context(
+                    open(data_file_path, "w", encoding="utf-8", newline="\n")
+                )
+
+            sql_file.write(
+                f"-- Generated from {dbf_file_path}\n"
+                f"-- Appended records: {start} to {stop - 1}\n"
+                "-- Generated by DBF2SQL Converter\n\n"
+            )
+            if self.bulk_format != "insert":
+                sql_file.write(
+                    self.dialect.bulk_header_sql(
+                        table_name, field_names, Path(data_file_path or delta_path).name
+                    )
+                )
+            for insert_sql, count in self._iter_insert_batches(
+                dbf, table_name, field_names, start, stop
+            ):
+                with stats.stage("write"):
+                    data_file.write(insert_sql)
+                    data_file.write("\n")
+                total_processed += count
+                self.progress.update(total_processed)
+            with stats.stage("write"):
+                sql_file.write(self._sql_postamble(total_processed))
+                stack.close()
+
+        stats.input_bytes = (stop - start) * dbf.record_length
+        stats.output_bytes = sum(
+            os.path.getsize(path) for path in (delta_path, data_file_path) if path is not None
+        )
+        stats.wall_time = time.perf_counter() - started
+        self.progress.finish_file(total_processed)
+        self.logger.info(f"Successfully converted {total_processed} new records to {delta_path}")
+        return total_processed
+
+    def convert_dbf_to_database(
+        self,
+        dbf_file_path: str,
+        connect: Callable[[], Any],
+        table_name: Optional[str] = None,
+        commit_interval: int = 0,
+        connections: int = 1,
+        paramstyle: Optional[str] = None,
+    ) -> bool:
+        """
+        Load a DBF file straight into a database through DB-API connections.
+
+        The table is dropped and recreated, then the rows are inserted with
+        executemany in batches of batch_size, values bound as parameters.
+        With the generic dialect the dialect is picked from the connection's
+        driver (sqlite3, psycopg, pymysql, ...).
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            connect: Factory returning a new DB-API connection, e.g.
+                functools.partial(sqlite3.connect, "data.db")
+            table_name: Name of the target table (default: sanitized file stem)
+            commit_interval: Number of rows per transaction; 0 commits once
+                after the last row
+            connections: Number of connections loading record ranges in
+                parallel threads (native reader only); each range commits
+                on its own, and the factory must connect to the same database
+            paramstyle: DB-API paramstyle of the placeholders (default: the
+                driver module's paramstyle)
+
+        Returns:
+            True if the load was successful, False otherwise
+        """
+        try:
+            dbf_path = Path(dbf_file_path)
+            if not dbf_path.exists():
+                self.logger.error(f"DBF file not found: {dbf_file_path}")
+                return False
+
+            if table_name is None:
+                table_name = self._sanitize_identifier(dbf_path.stem)
+
+            self.logger.info(f"Loading {dbf_file_path} into table {table_name}")
+            self.stats = ConversionStats(dbf_file_path)
+
+            with self._open_table(dbf_file_path) as dbf:
+                fields = self._describe_fields(dbf)
+                field_names = [field["name"] for field in fields]
+                field_types = [field["type"] for field in fields]
+                self.progress.start_file(dbf_file_path, len(dbf), estimate_data_size(dbf_file_path))
+
+                ranges: List[Tuple[int, int]] = []
+                if connections > 1 and isinstance(dbf, DBFReader):
+                    ranges = partition_records(dbf, connections, self.batch_size)
+
+                connection = connect()
+                try:
+                    dialect = self.dialect
+                    if dialect.name == "generic":
+                        dialect = connection_dialect(connection)
+                    sink = DatabaseSink(connection, dialect, paramstyle, commit_interval)
+                    sink.create_table(table_name, fields)
+
+                    with self._memory_budget(dbf, table_name, fields, in_flight=len(ranges) or 1):
+                        if len(ranges) > 1:
+                            connection.close()
+                            total_loaded = self._load_ranges_parallel(
+                                dbf_file_path,
+                                connect,
+                                dialect,
+                                paramstyle,
+                                commit_interval,
+                                table_name,
+                                field_names,
+                                field_types,
+                                ranges,
+                            )
+                        else:
+                            total_loaded = sink.load(
+                                self._iter_row_batches(dbf),
+                                table_name,
+                                field_names,
+                                field_types,
+                                self.progress.update,
+                            )
+                finally:
+                    connection.close()
+
+            self.progress.finish_file(total_loaded)
+
+            self.logger.info(f"Successfully loaded {total_loaded} records into {table_name}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error loading {dbf_file_path}: {str(e)}")
+            return False
+
+    def _iter_row_batches(
+        self, table: Union[DBFReader, Any], start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Iterate over table rows in lists of up to batch_size rows.
+
+        Args:
+            table: Table returned by _open_table
+            start: Index of the first record to read (native reader only)
+            stop: Index after the last record to read (native reader only)
+
+        Yields:
+            Lists of value tuples
+        """
+        rows = self._iter_rows(table, start, stop)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _load_ranges_parallel(
+        self,
+        dbf_file_path: str,
+        connect: Callable[[], Any],
+        dialect: Dialect,
+        paramstyle: Optional[str],
+        commit_interval: int,
+        table_name: str,
+        field_names: List[str],
+        field_types: List[str],
+        ranges: List[Tuple[int, int]],
+    ) -> int:
+        """
+        Load record ranges concurrently, one thread and connection per range.
+
+        Args:
+            dbf_file_path: Path to the DBF file
+            connect: Factory returning a new DB-API connection
+            dialect: Dialect of the bound values and identifiers
+            paramstyle: DB-API paramstyle of the placeholders
+            commit_interval: Number of rows per transaction
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            field_types: DBF field type of each field
+            ranges: Record index ranges from partition_records
+
+        Returns:
+            Total number of records loaded
+        """
+
+        def load_range(start: int, stop: int) -> int:
+            # Connections are created in the thread that uses them (sqlite3 requires it)
+            connection = connect()
+            try:
+                sink = DatabaseSink(connection, dialect, paramstyle, commit_interval)
+                with self._open_native(dbf_file_path) as table:
+                    return sink.load(
+                        self._iter_row_batches(table, start, stop),
+                        table_name,
+                        field_names,
+                        field_types,
+                    )
+            finally:
+                connection.close()
+
+        total_loaded = 0
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(load_range, start, stop) for start, stop in ranges]
+            for future in futures:
+                total_loaded += future.result()
+                self.progress.update(total_loaded)
+
+        return total_loaded
+
     def convert_multiple_files(
         self, dbf_files: List[str], output_dir: Optional[str] = None
     ) -> Dict[str, bool]:
         """
         Convert multiple DBF files to SQL files.
 
+        Files whose output is still current according to the conversion cache
+        are skipped and reported as successful, unless force is set.
+        Successful conversions are recorded in the cache. The cache is kept in
+        cache_file, or else in the output directory; without either, every
+        file is converted. In tail mode each file goes through
+        convert_dbf_tail, one at a time. The statistics of each converted
+        file are kept in file_stats; see total_stats for their sum.
+
         Args:
             dbf_files: List of DBF file paths
             output_dir: Output directory for SQL files (optional)
@@ -328,10 +2008,193 @@ CREATE TABLE `{table_name}` (
         Returns:
             Dictionary mapping file paths to conversion success status
         """
-        results: Dict[str, bool] = {}
-
+        self.file_stats = {}
+        if self.tail:
+            results: Dict[str, bool] = {}
+            for dbf_file in dbf_files:
+                results[dbf_file] = self.convert_dbf_tail(dbf_file, output_dir=output_dir)
+                if results[dbf_file]:
+                    self.file_stats[dbf_file] = self.stats
+            return results
+
+        results = {}
+        cache = self._conversion_cache(output_dir)
+        settings = self._cache_settings()
+
+        pending: List[str] = []
         for dbf_file in dbf_files:
-            self.logger.info(f"Starting conversion of {dbf_file}")
-            results[dbf_file] = self.convert_dbf_to_sql(dbf_file, output_dir=output_dir)
+            output_path = self._cached_output_path(dbf_file, output_dir)
+            if (
+                cache is not None
+                and not self.force
+                and cache.is_current(dbf_file, output_path, settings)
+            ):
+                self.logger.info(f"Skipping {dbf_file}: {output_path} is up to date")
+                results[dbf_file] = True
+            else:
+                pending.append(dbf_file)
+
+        if len(pending) > 1:
+            self.progress.start_run(
+                len(pending), sum(estimate_data_size(dbf_file) for dbf_file in pending)
+            )
+
+        if self.workers > 1 and len(pending) > 1:
+            results.update(self._convert_files_parallel(pending, output_dir))
+            # Keep the statistics in input order rather than completion order
+            self.file_stats = {
+                dbf_file: self.file_stats[dbf_file]
+                for dbf_file in dbf_files
+                if dbf_file in self.file_stats
+            }
+            if cache is not None:
+                for dbf_file in pending:
+                    if results[dbf_file]:
+                        self._record_conversion(cache, dbf_file, output_dir, settings)
+                self._save_cache(cache)
+        else:
+            for dbf_file in pending:
+                self.logger.info(f"Starting conversion of {dbf_file}")
+                results[dbf_file] = self.convert_dbf_to_sql(dbf_file, output_dir=output_dir)
+                if results[dbf_file]:
+                    self.file_stats[dbf_file] = self.stats
+                    if cache is not None:
+                        self._record_conversion(cache, dbf_file, output_dir, settings)
+                        self._save_cache(cache)
+
+        self.progress.finish_run()
+        return {dbf_file: results[dbf_file] for dbf_file in dbf_files}
+
+    def _cache_settings(self) -> str:
+        """
+        Summarize the settings that affect the output, for the conversion cache.
 
-        return results
+        Returns:
+            Digest that changes whenever a converted file would come out differently
+        """
+        settings = {
+            # A memory budget's plan depends on the memory in use and is not a setting
+            "batch_size": self._configured_batch_size or self.batch_size,
+            "encoding": self.encoding,
+            "engine": self.engine,
+            "passthrough": self.passthrough,
+            "max_statement_bytes": self.max_statement_bytes,
+            "columns": self.columns,
+            "exclude_columns": self.exclude_columns,
+            "where": self.where.expression if self.where else None,
+            "dialect": self.dialect.name,
+            "bulk_format": self.bulk_format,
+            "compress": self.compress,
+            "max_output_size": self.max_output_size,
+            "rows_per_file": self.rows_per_file,
+        }
+        if self.max_memory:
+            settings["max_memory"] = self.max_memory
+        encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _cached_output_path(self, dbf_file_path: str, output_dir: Optional[str]) -> str:
+        """Output file the conversion cache checks: the SQL file or the shard manifest."""
+        sql_file_path = self._default_sql_path(dbf_file_path, output_dir)
+        if self.max_output_size or self.rows_per_file:
+            base = shard_base(sql_file_path, self.compress)
+            return str(base.with_name(base.name + MANIFEST_SUFFIX))
+        return sql_file_path
+
+    def _conversion_cache(self, output_dir: Optional[str]) -> Optional[ConversionCache]:
+        """
+        Load the conversion cache used for an output directory.
+
+        Args:
+            output_dir: Output directory for SQL files (optional)
+
+        Returns:
+            The cache in cache_file or the output directory, or None when there
+            is neither (the output then goes next to the DBF files, where no
+            cache is written)
+        """
+        if self.cache_file is not None:
+            return ConversionCache(self.cache_file)
+        if output_dir is not None:
+            return ConversionCache(str(Path(output_dir) / CACHE_FILE))
+        return None
+
+    def _record_conversion(
+        self,
+        cache: ConversionCache,
+        dbf_file_path: str,
+        output_dir: Optional[str],
+        settings: str,
+    ) -> None:
+        """Record a successful conversion in the cache."""
+        output_path = self._cached_output_path(dbf_file_path, output_dir)
+        try:
+            cache.record(dbf_file_path, output_path, settings)
+        except OSError as e:
+            self.logger.warning(f"Could not cache conversion of {dbf_file_path}: {str(e)}")
+
+    def _save_cache(self, cache: ConversionCache) -> None:
+        """Write the conversion cache; failing to do so does not fail the conversion."""
+        try:
+            cache.save()
+        except OSError as e:
+            self.logger.warning(f"Could not write conversion cache {cache.path}: {str(e)}")
+
+    def _convert_files_parallel(
+        self, dbf_files: List[str], output_dir: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """
+        Convert files in a process pool, scheduling the largest files first.
+
+        File sizes are estimated from the DBF headers (record count times record
+        length) so a large file started last does not keep one worker busy
+        while the others sit idle.
+
+        Args:
+            dbf_files: List of DBF file paths
+            output_dir: Output directory for SQL files (optional)
+
+        Returns:
+            Dictionary mapping file paths to conversion success status, in input order
+        """
+        sizes = {dbf_file: estimate_data_size(dbf_file) for dbf_file in set(dbf_files)}
+        schedule = sorted(sizes, key=sizes.__getitem__, reverse=True)
+        outcomes: Dict[str, bool] = {}
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(schedule))) as executor:
+            futures: Dict["Future[Tuple[bool, Dict[str, Any]]]", str] = {}
+            for dbf_file in schedule:
+                self.logger.info(f"Starting conversion of {dbf_file}")
+                futures[executor.submit(self._convert_with_stats, dbf_file, output_dir)] = dbf_file
+
+            # Workers report no progress of their own; files count as they complete
+            for future in as_completed(futures):
+                dbf_file = futures[future]
+                try:
+                    outcomes[dbf_file], stats = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error converting {dbf_file}: {str(e)}")
+                    outcomes[dbf_file] = False
+                    stats = ConversionStats().as_dict()
+                if outcomes[dbf_file]:
+                    self.file_stats[dbf_file] = ConversionStats.from_dict(stats)
+                self.progress.start_file(dbf_file, stats["records"], sizes[dbf_file])
+                self.progress.finish_file(stats["records"], stats["wall_time"])
+
+        return {dbf_file: outcomes[dbf_file] for dbf_file in dbf_files}
+
+    def _convert_with_stats(
+        self, dbf_file_path: str, output_dir: Optional[str]
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Convert a file in a worker process and return its outcome and statistics."""
+        success = self.convert_dbf_to_sql(dbf_file_path, output_dir=output_dir)
+        return success, self.stats.as_dict()
+
+    def total_stats(self) -> ConversionStats:
+        """
+        Sum the statistics of the files converted by convert_multiple_files.
+
+        Returns:
+            Aggregate statistics; files skipped as up to date are not included
+        """
+        return ConversionStats.total(self.file_stats.values())
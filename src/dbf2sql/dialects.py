@@ -0,0 +1,488 @@
+"""
+SQL Dialects Module
+
+Describes how each target database spells the generated DDL and data: column
+types, identifier quoting, literal escaping, statement limits and the fastest
+bulk-load form the converter can emit for it.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ValueEncoder = Callable[[Any], str]
+ParameterAdapter = Optional[Callable[[Any], Any]]
+
+# Bulk-load forms: plain multi-row INSERTs, INSERTs in one transaction,
+# a PostgreSQL COPY block, or a LOAD DATA-compatible TSV file
+BULK_FORMATS = ("insert", "transaction", "copy", "tsv")
+
+# Escapes for tab-separated rows read by COPY and LOAD DATA (backslash first)
+DELIMITED_ESCAPES: Tuple[Tuple[str, str], ...] = (
+    ("\\", "\\\\"),
+    ("\t", "\\t"),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+)
+
+DELIMITED_NULL = "\\N"
+
+INFINITY = float("inf")
+
+
+def _finite_or_none(value: Any) -> Any:
+    """Bind Infinity and NaN, which have no SQL literal, as NULL."""
+    if value is None or value != value or value == INFINITY or value == -INFINITY:
+        return None
+    return value
+
+
+class Dialect:
+    """
+    SQL flavour of the generated statements.
+
+    The base class is the converter's original output: backtick-quoted
+    identifiers, MySQL-style column types, quotes escaped by doubling and
+    newlines written as \\n. Subclasses override the class attributes and,
+    where needed, the methods.
+    """
+
+    name = "generic"
+    identifier_quotes = ("`", "`")
+    text_prefix = "'"
+    text_escapes: Tuple[Tuple[str, str], ...] = (("'", "''"), ("\n", "\\n"), ("\r", "\\r"))
+    true_literal = "TRUE"
+    false_literal = "FALSE"
+    type_names: Dict[str, str] = {
+        "C": "VARCHAR({length})",
+        "N": "DECIMAL(19,2)",
+        "F": "DECIMAL(19,2)",
+        "D": "DATE",
+        "L": "BOOLEAN",
+        "M": "TEXT",
+        "I": "INTEGER",
+        "B": "DOUBLE",
+        "T": "DATETIME",
+        "Y": "DECIMAL(19,4)",
+    }
+    default_type = "VARCHAR({length})"
+
+    # Largest number of rows a single INSERT ... VALUES may carry (None: no limit)
+    max_insert_rows: Optional[int] = None
+
+    bulk_format = "insert"
+    begin_sql = "BEGIN TRANSACTION;"
+    commit_sql = "COMMIT;"
+    delimited_escapes = DELIMITED_ESCAPES
+    delimited_true = "t"
+    delimited_false = "f"
+
+    def quote_identifier(self, identifier: str) -> str:
+        """
+        Quote a sanitized table or column name.
+
+        Args:
+            identifier: Sanitized identifier
+
+        Returns:
+            Quoted identifier
+        """
+        opening, closing = self.identifier_quotes
+        return f"{opening}{identifier}{closing}"
+
+    def sql_type(self, field_type: str, field_length: int, field_decimal: int) -> str:
+        """
+        Convert a DBF field type to a column type.
+
+        Args:
+            field_type: DBF field type (C, N, D, L, etc.)
+            field_length: Field length
+            field_decimal: Decimal places
+
+        Returns:
+            SQL type string
+        """
+        template = self.type_names.get(field_type, self.default_type)
+        return template.format(length=field_length, decimal=field_decimal)
+
+    def escape_text(self, value: str) -> str:
+        """Apply the dialect's string literal escapes, without the quotes."""
+        for old, new in self.text_escapes:
+            value = value.replace(old, new)
+        return value
+
+    def escape_value(self, value: Any) -> str:
+        """
+        Render any value as a SQL literal.
+
+        Args:
+            value: Value to escape
+
+        Returns:
+            Escaped SQL value string
+        """
+        if value is None:
+            return "NULL"
+        elif isinstance(value, str):
+            return f"{self.text_prefix}{self.escape_text(value)}'"
+        elif isinstance(value, bool):
+            return self.true_literal if value else self.false_literal
+        elif isinstance(value, (int, float)):
+            # Infinity and NaN have no SQL literal
+            if isinstance(value, float):
+                if value != value or value in (float("inf"), float("-inf")):
+                    return "NULL"
+            return str(value)
+        else:
+            # Dates, timestamps and decimals are not Unicode text, so no N prefix
+            return f"'{self.escape_text(str(value))}'"
+
+    def value_encoders(self, field_types: List[str]) -> List[ValueEncoder]:
+        """
+        Build one SQL literal encoder per column from the DBF field types.
+
+        Each encoder produces exactly what escape_value would for the values
+        that field type decodes to, without the generic type dispatch. Field
+        types without a specialized encoder use escape_value.
+
+        Args:
+            field_types: DBF field type of each column, in column order
+
+        Returns:
+            List of encoder callables, one per column
+        """
+        inf = float("inf")
+        logical = {True: self.true_literal, False: self.false_literal, None: "NULL"}
+        prefix = self.text_prefix
+        escapes = self.text_escapes
+
+        if escapes == Dialect.text_escapes:
+
+            def encode_char(value: str) -> str:
+                # Character fields always decode to str, never None
+                return (
+                    prefix
+                    + value.replace("'", "''").replace("\n", "\\n").replace("\r", "\\r")
+                    + "'"
+                )
+
+        elif escapes == (("'", "''"),):
+
+            def encode_char(value: str) -> str:
+                return prefix + value.replace("'", "''") + "'"
+
+        else:
+            escape_text = self.escape_text
+
+            def encode_char(value: str) -> str:
+                return prefix + escape_text(value) + "'"
+
+        def encode_float(value: Any) -> str:
+            if value is None or value != value or value == inf or value == -inf:
+                return "NULL"
+            return str(value)
+
+        def encode_numeric(value: Any) -> str:
+            if value.__class__ is int:
+                return str(value)
+            if value is None or value != value or value == inf or value == -inf:
+                return "NULL"
+            return str(value)
+
+        def encode_integer(value: Any) -> str:
+            return str(value)
+
+        def encode_logical(value: Any) -> str:
+            return logical[value]
+
+        def encode_quoted(value: Any) -> str:
+            # Dates, timestamps and currency never contain quotes or newlines
+            return "NULL" if value is None else f"'{value}'"
+
+        encoders_by_type: Dict[str, ValueEncoder] = {
+            "C": encode_char,
+            "V": encode_char,
+            "N": encode_numeric,
+            "F": encode_float,
+            "O": encode_float,
+            "I": encode_integer,
+            "+": encode_integer,
+            "L": encode_logical,
+            "D": encode_quoted,
+            "T": encode_quoted,
+            "@": encode_quoted,
+            "Y": encode_quoted,
+        }
+
+        return [encoders_by_type.get(field_type, self.escape_value) for field_type in field_types]
+
+    def escape_delimited_value(self, value: Any) -> str:
+        """
+        Render any value as a field of a tab-separated bulk-load row.
+
+        Args:
+            value: Value to escape
+
+        Returns:
+            Field text: \\N for NULL, backslash escapes for special characters
+        """
+        if value is None:
+            return DELIMITED_NULL
+        elif isinstance(value, bool):
+            return self.delimited_true if value else self.delimited_false
+        elif isinstance(value, float):
+            if value != value or value in (float("inf"), float("-inf")):
+                return DELIMITED_NULL
+            return str(value)
+        elif isinstance(value, int):
+            return str(value)
+        else:
+            text = str(value)
+            for old, new in self.delimited_escapes:
+                text = text.replace(old, new)
+            return text
+
+    def delimited_encoders(self, field_types: List[str]) -> List[ValueEncoder]:
+        """
+        Build one tab-separated row field encoder per column.
+
+        Each encoder produces exactly what escape_delimited_value would for
+        the values that field type decodes to.
+
+        Args:
+            field_types: DBF field type of each column, in column order
+
+        Returns:
+            List of encoder callables, one per column
+        """
+        inf = float("inf")
+        logical = {True: self.delimited_true, False: self.delimited_false, None: DELIMITED_NULL}
+        escapes = self.delimited_escapes
+
+        if escapes == DELIMITED_ESCAPES:
+
+            def encode_text(value: str) -> str:
+                return (
+                    value.replace("\\", "\\\\")
+                    .replace("\t", "\\t")
+                    .replace("\n", "\\n")
+                    .replace("\r", "\\r")
+                )
+
+        else:
+
+            def encode_text(value: str) -> str:
+                for old, new in escapes:
+                    value = value.replace(old, new)
+                return value
+
+        def encode_number(value: Any) -> str:
+            if value is None or value != value or value == inf or value == -inf:
+                return DELIMITED_NULL
+            return str(value)
+
+        def encode_integer(value: Any) -> str:
+            return str(value)
+
+        def encode_logical(value: Any) -> str:
+            return logical[value]
+
+        def encode_plain(value: Any) -> str:
+            # Dates, timestamps and currency never contain special characters
+            return DELIMITED_NULL if value is None else str(value)
+
+        encoders_by_type: Dict[str, ValueEncoder] = {
+            "C": encode_text,
+            "V": encode_text,
+            "N": encode_number,
+            "F": encode_number,
+            "O": encode_number,
+            "I": encode_integer,
+            "+": encode_integer,
+            "L": encode_logical,
+            "D": encode_plain,
+            "T": encode_plain,
+            "@": encode_plain,
+            "Y": encode_plain,
+        }
+
+        return [
+            encoders_by_type.get(field_type, self.escape_delimited_value)
+            for field_type in field_types
+        ]
+
+    def parameter_adapters(self, field_types: List[str]) -> List[ParameterAdapter]:
+        """
+        Build one adapter per column for values bound as DB-API parameters.
+
+        Infinity and NaN, which the SQL output writes as NULL, are bound as
+        None; other values are passed to the driver unchanged.
+
+        Args:
+            field_types: DBF field type of each column, in column order
+
+        Returns:
+            List of adapter callables, None for columns bound as decoded
+        """
+        return [_finite_or_none if field_type in "NFOB" else None for field_type in field_types]
+
+    def bulk_header_sql(self, table_name: str, field_names: List[str], data_file: str) -> str:
+        """
+        Generate the statement(s) written before the rows of a bulk load.
+
+        Args:
+            table_name: Name of the table
+            field_names: List of field names
+            data_file: Name of the separate data file (TSV form only)
+
+        Returns:
+            SQL text, empty if the bulk form needs none
+        """
+        if self.bulk_format == "transaction":
+            return f"{self.begin_sql}\n\n"
+        return ""
+
+    def bulk_footer_sql(self) -> str:
+        """Generate the statement(s) written after the rows of a bulk load."""
+        if self.bulk_format == "transaction":
+            return f"{self.commit_sql}\n\n"
+        return ""
+
+
+class MySQLDialect(Dialect):
+    """MySQL / MariaDB: backslash escapes; bulk form is a LOAD DATA TSV file."""
+
+    name = "mysql"
+    text_escapes = (
+        ("\\", "\\\\"),
+        ("'", "''"),
+        ("\0", "\\0"),
+        ("\n", "\\n"),
+        ("\r", "\\r"),
+        ("\x1a", "\\Z"),
+    )
+    bulk_format = "tsv"
+    delimited_escapes = DELIMITED_ESCAPES + (("\0", "\\0"),)
+    delimited_true = "1"
+    delimited_false = "0"
+
+    def bulk_header_sql(self, table_name: str, field_names: List[str], data_file: str) -> str:
+        field_list = ", ".join(self.quote_identifier(field) for field in field_names)
+        return (
+            f"-- Rows are in {data_file}; run from its directory with: mysql --local-infile=1\n"
+            f"LOAD DATA LOCAL INFILE '{data_file}'\n"
+            f"    INTO TABLE {self.quote_identifier(table_name)}\n"
+            "    CHARACTER SET utf8mb4\n"
+            "    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+            "    LINES TERMINATED BY '\\n'\n"
+            f"    ({field_list});\n\n"
+        )
+
+
+class PostgreSQLDialect(Dialect):
+    """PostgreSQL: standard-conforming strings; bulk form is COPY ... FROM stdin."""
+
+    name = "postgresql"
+    identifier_quotes = ('"', '"')
+    text_escapes = (("'", "''"),)
+    type_names = dict(Dialect.type_names, B="DOUBLE PRECISION", T="TIMESTAMP")
+    bulk_format = "copy"
+
+    def bulk_header_sql(self, table_name: str, field_names: List[str], data_file: str) -> str:
+        field_list = ", ".join(self.quote_identifier(field) for field in field_names)
+        return f"COPY {self.quote_identifier(table_name)} ({field_list}) FROM stdin;\n"
+
+    def bulk_footer_sql(self) -> str:
+        return "\\.\n\n"
+
+
+class SQLiteDialect(Dialect):
+    """SQLite: bulk form is multi-row INSERTs inside a single transaction."""
+
+    name = "sqlite"
+    identifier_quotes = ('"', '"')
+    text_escapes = (("'", "''"),)
+    true_literal = "1"
+    false_literal = "0"
+    bulk_format = "transaction"
+
+    def parameter_adapters(self, field_types: List[str]) -> List[ParameterAdapter]:
+        adapters = super().parameter_adapters(field_types)
+
+        def adapt_number(value: Any) -> Any:
+            # Integers beyond 64 bits cannot be bound; SQLite stores such literals as REAL
+            if value.__class__ is int and not -(2**63) <= value < 2**63:
+                return float(value)
+            return _finite_or_none(value)
+
+        def adapt_text(value: Any) -> Any:
+            # sqlite3 cannot bind Decimal, and its date adapters are deprecated;
+            # bind the text the SQL output would contain instead
+            return None if value is None else str(value)
+
+        return [
+            adapt_text if field_type in "DT@Y" else adapt_number if field_type == "N" else adapter
+            for field_type, adapter in zip(field_types, adapters)
+        ]
+
+
+class SQLServerDialect(Dialect):
+    """SQL Server: N'' literals, at most 1000 rows per INSERT, one transaction."""
+
+    name = "sqlserver"
+    identifier_quotes = ("[", "]")
+    text_prefix = "N'"
+    text_escapes = (("'", "''"),)
+    true_literal = "1"
+    false_literal = "0"
+    type_names = dict(
+        Dialect.type_names,
+        C="NVARCHAR({length})",
+        L="BIT",
+        M="NVARCHAR(MAX)",
+        I="INT",
+        B="FLOAT",
+        T="DATETIME2",
+    )
+    default_type = "NVARCHAR({length})"
+    max_insert_rows = 1000
+    bulk_format = "transaction"
+    commit_sql = "COMMIT TRANSACTION;"
+
+    def sql_type(self, field_type: str, field_length: int, field_decimal: int) -> str:
+        sql_type = super().sql_type(field_type, field_length, field_decimal)
+        # NVARCHAR(n) is limited to 4000 characters
+        if sql_type.startswith("NVARCHAR(") and field_length > 4000:
+            return "NVARCHAR(MAX)"
+        return sql_type
+
+
+DIALECTS: Dict[str, Dialect] = {
+    dialect.name: dialect
+    for dialect in (
+        Dialect(),
+        MySQLDialect(),
+        PostgreSQLDialect(),
+        SQLiteDialect(),
+        SQLServerDialect(),
+    )
+}
+
+
+def get_dialect(name: str) -> Dialect:
+    """
+    Look up a dialect by name.
+
+    Args:
+        name: One of the DIALECTS keys
+
+    Returns:
+        The dialect
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return DIALECTS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown dialect: {name!r} (expected one of {', '.join(DIALECTS)})"
+        ) from None
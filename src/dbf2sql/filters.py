@@ -0,0 +1,394 @@
+"""
+Row Filter Module
+
+Parses the simple WHERE expressions accepted by --where and compiles them into
+predicates over raw DBF records (native reader) or decoded value tuples
+(dbfread). Character and date comparisons are evaluated on the fixed-width
+field bytes wherever possible, so rejected records are never decoded.
+"""
+
+import datetime
+import operator
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Sequence, Tuple
+
+from .reader import DBFReader, ascii_safe_encoding
+
+TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>'(?:[^']|'')*')
+      | (?P<number>[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)
+      | (?P<op><=|>=|<>|!=|=|<|>)
+      | (?P<punct>[(),])
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )""",
+    re.VERBOSE,
+)
+
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+KEYWORDS = {"AND", "OR", "NOT", "IN", "IS", "NULL", "TRUE", "FALSE"}
+
+NUMERIC_TYPES = "NFOBI+Y"
+
+# A literal is (kind, text) with kind "string", "number" or "bool"
+Literal = Tuple[str, Any]
+Node = Tuple[Any, ...]
+
+# Leaf tests return None when the outcome is unknown (NULL operand), as in SQL
+Test = Callable[[Any], Optional[bool]]
+
+
+class WhereClause:
+    """
+    A parsed --where expression.
+
+    Supports comparisons (=, !=, <>, <, <=, >, >=), [NOT] IN lists and
+    IS [NOT] NULL on single columns, combined with AND, OR, NOT and
+    parentheses. Literals are quoted strings, numbers and TRUE/FALSE; dates
+    are written as 20240101 or '2024-01-01'. Comparisons with NULL values
+    are unknown and reject the record, as in SQL.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Parse an expression.
+
+        Args:
+            expression: Filter expression, e.g. "STATUS = 'A' AND DATE >= 20240101"
+
+        Raises:
+            ValueError: If the expression cannot be parsed
+        """
+        self.expression = expression
+        self._tokens = _tokenize(expression)
+        self._position = 0
+        self.tree = self._parse_or()
+        if self._position != len(self._tokens):
+            self._fail("unexpected " + repr(self._tokens[self._position][1]))
+        del self._tokens
+
+    def __str__(self) -> str:
+        return self.expression
+
+    def compile_raw(self, reader: DBFReader) -> Callable[[bytes], bool]:
+        """
+        Compile the expression into a predicate over raw records of a table.
+
+        Only the fields the expression refers to are sliced, and C and D
+        fields are compared as bytes where that gives the same result.
+
+        Args:
+            reader: Open native reader; its table_fields may include fields
+                left out by a column projection
+
+        Returns:
+            Predicate returning True for records that match
+        """
+        fields = {field.name.upper(): field for field in reader.table_fields}
+        escape_raw = ascii_safe_encoding(reader.encoding)
+
+        def compile_leaf(node: Node) -> Test:
+            field = fields.get(node[1].upper())
+            if field is None:
+                raise ValueError(f"Unknown column in --where: {node[1]}")
+
+            start, end = field.offset, field.offset + field.length
+            decode = reader.decoder_for(field)
+            test = _leaf_test(node, field.name, field.type)
+
+            if field.type in "CV" and escape_raw and node[0] in ("compare", "in"):
+                raw_test = _raw_char_test(node, reader.encoding, decode, start, end)
+                if raw_test is not None:
+                    return raw_test
+            if field.type == "D" and node[0] in ("compare", "in"):
+                return _raw_date_test(node, test, decode, start, end)
+
+            return lambda record: test(decode(record[start:end]))
+
+        return _accept(_compile(self.tree, compile_leaf))
+
+    def compile_values(
+        self, field_names: Sequence[str], field_types: Sequence[str]
+    ) -> Callable[[Sequence[Any]], bool]:
+        """
+        Compile the expression into a predicate over decoded value tuples.
+
+        Args:
+            field_names: Names of all table fields, in table order
+            field_types: DBF field type of each field
+
+        Returns:
+            Predicate returning True for rows that match
+        """
+        indexes = {name.upper(): index for index, name in enumerate(field_names)}
+
+        def compile_leaf(node: Node) -> Test:
+            index = indexes.get(node[1].upper())
+            if index is None:
+                raise ValueError(f"Unknown column in --where: {node[1]}")
+
+            test = _leaf_test(node, field_names[index], field_types[index])
+            return lambda row: test(row[index])
+
+        return _accept(_compile(self.tree, compile_leaf))
+
+    # Recursive descent parser over the token list
+
+    def _peek(self) -> Optional[str]:
+        if self._position < len(self._tokens):
+            kind, text = self._tokens[self._position]
+            return text.upper() if kind == "name" else text
+        return None
+
+    def _take(self) -> Tuple[str, str]:
+        if self._position >= len(self._tokens):
+            self._fail("unexpected end of expression")
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        if self._peek() != text:
+            self._fail(f"expected {text!r}")
+        self._position += 1
+
+    def _fail(self, message: str) -> NoReturn:
+        raise ValueError(f"Invalid --where expression {self.expression!r}: {message}")
+
+    def _parse_or(self) -> Node:
+        parts = [self._parse_and()]
+        while self._peek() == "OR":
+            self._position += 1
+            parts.append(self._parse_and())
+        return parts[0] if len(parts) == 1 else ("or", parts)
+
+    def _parse_and(self) -> Node:
+        parts = [self._parse_not()]
+        while self._peek() == "AND":
+            self._position += 1
+            parts.append(self._parse_not())
+        return parts[0] if len(parts) == 1 else ("and", parts)
+
+    def _parse_not(self) -> Node:
+        if self._peek() == "NOT":
+            self._position += 1
+            return ("not", self._parse_not())
+        if self._peek() == "(":
+            self._position += 1
+            node = self._parse_or()
+            self._expect(")")
+            return node
+        return self._parse_condition()
+
+    def _parse_condition(self) -> Node:
+        kind, name = self._take()
+        if kind != "name" or name.upper() in KEYWORDS:
+            self._fail(f"expected a column name, got {name!r}")
+
+        following = self._peek()
+        if following == "IS":
+            self._position += 1
+            negated = self._peek() == "NOT"
+            if negated:
+                self._position += 1
+            self._expect("NULL")
+            return ("null", name, negated)
+
+        negated = following == "NOT"
+        if negated:
+            self._position += 1
+            following = self._peek()
+        if following == "IN":
+            self._position += 1
+            self._expect("(")
+            literals = [self._parse_literal()]
+            while self._peek() == ",":
+                self._position += 1
+                literals.append(self._parse_literal())
+            self._expect(")")
+            return ("in", name, literals, negated)
+        if negated:
+            self._fail("expected IN after NOT")
+
+        kind, op = self._take()
+        if kind != "op":
+            self._fail(f"expected a comparison operator after {name}")
+        return ("compare", name, op, self._parse_literal())
+
+    def _parse_literal(self) -> Literal:
+        kind, text = self._take()
+        if kind == "string":
+            return ("string", text[1:-1].replace("''", "'"))
+        if kind == "number":
+            return ("number", text)
+        if kind == "name" and text.upper() in ("TRUE", "FALSE"):
+            return ("bool", text.upper() == "TRUE")
+        self._fail(f"expected a literal, got {text!r}")
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    """Split an expression into (kind, text) tokens."""
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    end = len(expression.rstrip())
+
+    while position < end:
+        match = TOKEN.match(expression, position)
+        if match is None or match.lastgroup is None:
+            raise ValueError(
+                f"Invalid --where expression {expression!r}: "
+                f"unexpected character at position {position}"
+            )
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+
+    return tokens
+
+
+def _coerce(literal: Literal, name: str, field_type: str) -> Any:
+    """Convert a literal to the Python type a field of the given type decodes to."""
+    kind, text = literal
+    try:
+        if field_type in "CV" and kind == "string":
+            return text
+        if field_type in NUMERIC_TYPES and kind == "number":
+            if field_type == "Y":
+                return Decimal(text)
+            try:
+                return int(text)
+            except ValueError:
+                return float(text)
+        if field_type == "D" and kind in ("string", "number"):
+            digits = text.replace("-", "") if kind == "string" else text
+            if len(digits) == 8 and digits.isdigit():
+                return datetime.date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+        if field_type in "T@" and kind == "string":
+            return datetime.datetime.fromisoformat(text)
+        if field_type == "L" and kind == "bool":
+            return text
+    except (ValueError, InvalidOperation):
+        pass
+
+    raise ValueError(f"Cannot compare column {name} (type {field_type}) with {text!r}")
+
+
+def _leaf_test(node: Node, name: str, field_type: str) -> Test:
+    """Build the test for one condition over a decoded field value."""
+    kind = node[0]
+
+    if kind == "null":
+        negated = node[2]
+        return lambda value: (value is not None) is negated
+
+    if kind == "in":
+        values = frozenset(_coerce(literal, name, field_type) for literal in node[2])
+        negated = node[3]
+        return lambda value: None if value is None else (value in values) is not negated
+
+    compare = COMPARISONS[node[2]]
+    operand = _coerce(node[3], name, field_type)
+    return lambda value: None if value is None else compare(value, operand)
+
+
+def _raw_char_test(
+    node: Node, encoding: str, decode: Callable[[bytes], Any], start: int, end: int
+) -> Optional[Test]:
+    """Equality and IN on a C field, compared as bytes for ASCII contents."""
+    if node[0] == "in":
+        literals, negated = node[2], node[3]
+    elif node[2] in ("=", "!=", "<>"):
+        literals, negated = [node[3]], node[2] != "="
+    else:
+        return None
+
+    texts = frozenset(_coerce(literal, node[1], "C") for literal in literals)
+    encoded = set()
+    for text in texts:
+        try:
+            encoded.add(text.encode(encoding))
+        except UnicodeEncodeError:
+            pass
+    raw_values = frozenset(encoded)
+
+    def test(record: bytes) -> bool:
+        data = record[start:end].rstrip(b"\0 ")
+        if data.isascii():
+            return (data in raw_values) is not negated
+        return (decode(data) in texts) is not negated
+
+    return test
+
+
+def _raw_date_test(
+    node: Node, test: Test, decode: Callable[[bytes], Any], start: int, end: int
+) -> Test:
+    """Compare D fields as YYYYMMDD bytes; blank and odd values are decoded."""
+    if node[0] == "in":
+        dates = [_coerce(literal, node[1], "D") for literal in node[2]]
+        raw_values = frozenset(date.strftime("%Y%m%d").encode("ascii") for date in dates)
+        negated = node[3]
+
+        def raw_test(data: bytes) -> bool:
+            return (data in raw_values) is not negated
+
+    else:
+        compare = COMPARISONS[node[2]]
+        operand = _coerce(node[3], node[1], "D").strftime("%Y%m%d").encode("ascii")
+
+        def raw_test(data: bytes) -> bool:
+            return compare(data, operand)
+
+    def date_test(record: bytes) -> Optional[bool]:
+        data = record[start:end]
+        if data.isdigit() and data[:4] != b"0000":
+            return raw_test(data)
+        return test(decode(data))
+
+    return date_test
+
+
+def _compile(node: Node, compile_leaf: Callable[[Node], Test]) -> Test:
+    """Combine leaf tests following SQL three-valued logic."""
+    kind = node[0]
+
+    if kind == "not":
+        inner = _compile(node[1], compile_leaf)
+
+        def negate(item: Any) -> Optional[bool]:
+            result = inner(item)
+            return None if result is None else not result
+
+        return negate
+
+    if kind in ("and", "or"):
+        parts = [_compile(part, compile_leaf) for part in node[1]]
+        decisive = kind == "or"
+
+        def combine(item: Any) -> Optional[bool]:
+            outcome: Optional[bool] = not decisive
+            for part in parts:
+                result = part(item)
+                if result is decisive:
+                    return decisive
+                if result is None:
+                    outcome = None
+            return outcome
+
+        return combine
+
+    return compile_leaf(node)
+
+
+def _accept(test: Test) -> Callable[[Any], bool]:
+    """Turn a three-valued test into a predicate that only accepts True."""
+    return lambda item: test(item) is True
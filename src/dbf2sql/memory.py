@@ -0,0 +1,199 @@
+"""
+Memory Budget Module
+
+Sizes batches and output buffers so a conversion stays within a memory budget,
+and samples the memory in use to report the high-water mark of each file.
+"""
+
+import mmap
+import sys
+import threading
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+# Rows decoded and rendered up front to measure the memory one row takes
+MEMORY_SAMPLE_ROWS = 256
+
+MIN_BATCH_SIZE = 10
+
+MIN_BLOCK_SIZE = 64 * 1024
+
+# Shares of the budget left above the baseline given to in-flight batches and to
+# compression buffers; the remainder is headroom for the allocator and decoders
+BATCH_SHARE = 0.5
+COMPRESSION_SHARE = 0.2
+
+# Seconds between two samples of the memory in use
+SAMPLE_INTERVAL = 0.05
+
+
+def private_memory() -> Optional[int]:
+    """
+    Return the resident memory of this process that is not backed by files.
+
+    Pages of memory-mapped DBF files are clean and reclaimable and are not
+    counted, so this is the memory a conversion can actually run out of.
+
+    Returns:
+        Size in bytes, or None where /proc/self/statm is unavailable
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            fields = statm.read().split()
+        return (int(fields[1]) - int(fields[2])) * mmap.PAGESIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Return the peak resident set size of this process over its lifetime.
+
+    Returns:
+        Size in bytes, or None where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def rows_size(rows: Sequence[Tuple[Any, ...]]) -> int:
+    """
+    Return the memory held by a batch of decoded rows.
+
+    Args:
+        rows: Value tuples as produced by the readers
+
+    Returns:
+        Size in bytes of the list, its tuples and their values
+    """
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+    return size
+
+
+class BudgetPlan(NamedTuple):
+    """Batch and buffer sizes chosen for a memory budget."""
+
+    batch_size: int
+    block_size: int
+    batch_bytes: int
+
+
+def plan_budget(
+    limit: int,
+    baseline: int,
+    row_bytes: float,
+    batch_size: int,
+    batches_in_flight: int = 1,
+    processes: int = 1,
+    compress_threads: int = 0,
+    block_size: int = 0,
+) -> BudgetPlan:
+    """
+    Size batches and compression blocks to fit a memory budget.
+
+    The budget is shared by the converting processes. Within each, what is
+    left above the baseline goes partly to the batches that can be in
+    flight at once (decoded rows plus their rendered SQL) and, with
+    compression, partly to the blocks buffered by the compression threads.
+
+    Args:
+        limit: Memory budget in bytes
+        baseline: Memory already in use by a process before converting
+        row_bytes: Measured memory of one decoded and rendered row
+        batch_size: Requested batch size, the upper bound of the result
+        batches_in_flight: Batches held at the same time, e.g. in pipeline queues
+        processes: Number of processes converting at the same time
+        compress_threads: Compression threads, 0 for uncompressed output
+        block_size: Requested compression block size, the upper bound of the result
+
+    Returns:
+        Batch size, compression block size and the bytes budgeted per batch
+    """
+    available = max(0, limit // max(1, processes) - baseline)
+
+    if compress_threads:
+        # One block being filled plus two per queued member, each held compressed and not
+        compression = int(available * COMPRESSION_SHARE)
+        per_block = compression // (3 + 4 * compress_threads)
+        block_size = max(MIN_BLOCK_SIZE, min(block_size, per_block))
+
+    batch_bytes = int(available * BATCH_SHARE) // max(1, batches_in_flight)
+    rows = int(batch_bytes / row_bytes) if row_bytes > 0 else batch_size
+    if 0 < rows < batch_size:
+        # One significant digit keeps the batch size, and so the output, the same
+        # across runs whose baselines differ slightly
+        scale = 10 ** (len(str(rows)) - 1)
+        rows = rows // scale * scale
+    # The requested batch size stays the upper bound even below MIN_BATCH_SIZE
+    return BudgetPlan(min(batch_size, max(MIN_BATCH_SIZE, rows)), block_size, batch_bytes)
+
+
+class MemoryMonitor:
+    """
+    Samples the memory in use on a background thread and keeps the maximum.
+
+    Uses private_memory() where available; elsewhere the high-water mark is
+    the lifetime peak RSS of the process from peak_rss().
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between two samples
+        """
+        self.interval = interval
+        self.baseline = private_memory()
+        self.peak = self.baseline or 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Take one sample."""
+        current = private_memory()
+        if current is not None and current > self.peak:
+            self.peak = current
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        if self.baseline is None:
+            return
+        self._thread = threading.Thread(target=self._run, name="dbf2sql-memory", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Optional[int]:
+        """
+        Stop sampling.
+
+        Returns:
+            High-water mark in bytes, or None if memory cannot be measured
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.sample()
+            return self.peak
+        return peak_rss()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+
+def format_bytes(size: int) -> str:
+    """Render a byte count with a binary unit, e.g. 1.5 GiB."""
+    value = float(size)
+    units: List[str] = ["B", "KiB", "MiB", "GiB"]
+    for unit in units:
+        if value < 1024 or unit == units[-1]:
+            break
+        value /= 1024
+    return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
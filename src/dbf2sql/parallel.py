@@ -0,0 +1,125 @@
+"""
+Parallel Conversion Helpers
+
+Splits a DBF file into record ranges that can be converted independently and
+stitches the resulting shard files back together in order.
+"""
+
+import os
+import shutil
+from typing import Iterator, List, Tuple
+
+from .reader import RECORD_ACTIVE, DBFReader
+
+ACTIVE_FLAG = bytes([RECORD_ACTIVE])
+
+# Chunk size for the copy fallback when no zero-copy syscall is available
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def partition_records(reader: DBFReader, parts: int, align: int) -> List[Tuple[int, int]]:
+    """
+    Split a table into record index ranges with equal numbers of active records.
+
+    Every range except the last holds a multiple of ``align`` active records, so
+    batches rendered independently per range line up with the batches a single
+    pass over the whole file would produce.
+
+    Args:
+        reader: Open native reader for the DBF file
+        parts: Maximum number of ranges to produce
+        align: Number of active records each range boundary is aligned to
+
+    Returns:
+        List of (start, stop) record index ranges covering the whole table
+    """
+    flags = reader.deletion_flags()
+    active = flags.count(ACTIVE_FLAG)
+    if active == 0:
+        # Nothing to split (empty table, or no record is active and passes the filter)
+        return [(0, len(flags))]
+
+    batches = -(-active // align)
+    per_part = -(-batches // max(1, parts)) * align
+
+    bounds = [0]
+    position = 0
+    counted = 0
+    for target in range(per_part, active, per_part):
+        # Advance until exactly `target` active records lie before `position`
+        while counted < target:
+            step = target - counted
+            counted += flags.count(ACTIVE_FLAG, position, position + step)
+            position += step
+        bounds.append(position)
+    bounds.append(len(flags))
+
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_batch_ranges(reader: DBFReader, batch_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Split a table into consecutive record index ranges of batch_size active records.
+
+    Inactive records are included in whichever range they fall in, so the last
+    range may hold fewer active records (possibly none).
+
+    Args:
+        reader: Open native reader for the DBF file
+        batch_size: Number of active records per range
+
+    Yields:
+        (start, stop) record index ranges covering the whole table
+    """
+    flags = reader.deletion_flags()
+    total = len(flags)
+    start = 0
+
+    while start < total:
+        stop = start + batch_size
+        active = flags.count(ACTIVE_FLAG, start, stop)
+        while active < batch_size and stop < total:
+            step = batch_size - active
+            active += flags.count(ACTIVE_FLAG, stop, stop + step)
+            stop += step
+
+        stop = min(stop, total)
+        yield start, stop
+        start = stop
+
+
+def append_file(dst_fd: int, src_path: str) -> None:
+    """
+    Append the contents of a file to an open file descriptor.
+
+    Uses os.copy_file_range or os.sendfile where available so the data is
+    copied in the kernel, falling back to a buffered copy otherwise.
+
+    Args:
+        dst_fd: File descriptor positioned at the end of the destination
+        src_path: Path of the file to append
+    """
+    with open(src_path, "rb") as src:
+        remaining = os.fstat(src.fileno()).st_size
+
+        for name in ("copy_file_range", "sendfile"):
+            copy = getattr(os, name, None)
+            if copy is None:
+                continue
+            try:
+                while remaining > 0:
+                    if name == "sendfile":
+                        copied = copy(dst_fd, src.fileno(), None, remaining)
+                    else:
+                        copied = copy(src.fileno(), dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                # Unsupported for this file system or platform; try the next method
+                continue
+            if remaining == 0:
+                return
+
+        with open(dst_fd, "ab", closefd=False) as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
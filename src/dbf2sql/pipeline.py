@@ -0,0 +1,414 @@
+"""
+Pipelined Conversion Module
+
+Runs reading, formatting and writing as separate stages connected by bounded
+queues: a reader thread, a pool of formatter workers and a single writer
+thread that writes INSERT statements in their original order.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .parallel import iter_batch_ranges
+from .reader import DBFReader
+
+if TYPE_CHECKING:
+    from .converter import DBFToSQLConverter
+
+# Sentinel marking the end of a stage's output
+_DONE = object()
+
+# How often blocked queue operations re-check for a failed stage (seconds)
+_POLL_INTERVAL = 0.1
+
+# Formatter owned by the current worker process
+_worker_formatter: Optional["BatchFormatter"] = None
+
+
+def free_threaded() -> bool:
+    """Return True when running on a free-threaded (no GIL) Python build."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class PipelineStats:
+    """Queue depth and per-stage busy time of one pipelined conversion."""
+
+    def __init__(self, formatter_workers: int, queue_depth: int, executor: str):
+        self.formatter_workers = formatter_workers
+        self.queue_depth = queue_depth
+        self.executor = executor
+        self.batches = 0
+        self.max_batch_bytes = 0
+        self.reader_busy = 0.0
+        self.formatter_busy = 0.0
+        self.writer_busy = 0.0
+        self.wall_time = 0.0
+        self.max_read_queue = 0
+        self.max_write_queue = 0
+        self._read_queue_total = 0
+        self._write_queue_total = 0
+
+    def sample_queues(self, read_depth: int, write_depth: int) -> None:
+        """Record the queue depths observed when a batch is dispatched."""
+        self.max_read_queue = max(self.max_read_queue, read_depth)
+        self.max_write_queue = max(self.max_write_queue, write_depth)
+        self._read_queue_total += read_depth
+        self._write_queue_total += write_depth
+
+    @property
+    def mean_read_queue(self) -> float:
+        return self._read_queue_total / self.batches if self.batches else 0.0
+
+    @property
+    def mean_write_queue(self) -> float:
+        return self._write_queue_total / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {
+            "executor": self.executor,
+            "formatter_workers": self.formatter_workers,
+            "queue_depth": self.queue_depth,
+            "batches": self.batches,
+            "max_batch_bytes": self.max_batch_bytes,
+            "wall_time": round(self.wall_time, 6),
+            "reader_busy": round(self.reader_busy, 6),
+            "formatter_busy": round(self.formatter_busy, 6),
+            "writer_busy": round(self.writer_busy, 6),
+            "max_read_queue": self.max_read_queue,
+            "mean_read_queue": round(self.mean_read_queue, 3),
+            "max_write_queue": self.max_write_queue,
+            "mean_write_queue": round(self.mean_write_queue, 3),
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.batches} batches in {self.wall_time:.2f}s; busy: "
+            f"reader {self.reader_busy:.2f}s, "
+            f"formatters {self.formatter_busy:.2f}s ({self.formatter_workers} {self.executor}), "
+            f"writer {self.writer_busy:.2f}s; queue depth (max/mean of {self.queue_depth}): "
+            f"read {self.max_read_queue}/{self.mean_read_queue:.1f}, "
+            f"write {self.max_write_queue}/{self.mean_write_queue:.1f}"
+        )
+
+
+class BatchFormatter:
+    """
+    Formatter stage: turns one batch payload into an INSERT statement.
+
+    Payloads are either raw record bytes (native reader), decoded in the
+    formatter with its own reader, or lists of value tuples (dbfread).
+    """
+
+    def __init__(
+        self,
+        converter: "DBFToSQLConverter",
+        table_name: str,
+        field_names: List[str],
+        field_types: List[str],
+        dbf_file_path: Optional[str] = None,
+    ):
+        """
+        Initialize the formatter.
+
+        Args:
+            converter: Converter whose escaping and statement formatting is used
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            field_types: DBF field type of each column
+            dbf_file_path: DBF file to decode raw record payloads with, if any
+        """
+        self.converter = converter
+        self.table_name = table_name
+        self.field_names = field_names
+        self.field_types = field_types
+        self.encoders = converter._build_value_encoders(field_types)
+        self.dbf_file_path = dbf_file_path
+        self._reader: Optional[DBFReader] = None
+        self._renderer: Any = None
+        self._raw_encoders: Any = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The reader holds a memory map and encoders are closures; each worker
+        # process opens and builds its own
+        state = self.__dict__.copy()
+        state["_reader"] = None
+        state["_renderer"] = None
+        state["_raw_encoders"] = None
+        state["encoders"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.encoders = self.converter._build_value_encoders(self.field_types)
+
+    def open(self) -> None:
+        """Open the reader used to decode raw payloads, if one is needed."""
+        if self.dbf_file_path is not None:
+            self._open_reader()
+
+    def close(self) -> None:
+        """Close the reader opened by this formatter."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+            self._renderer = None
+            self._raw_encoders = None
+
+    def _open_reader(self) -> DBFReader:
+        if self._reader is None:
+            assert self.dbf_file_path is not None
+            self._reader = self.converter._open_native(self.dbf_file_path)
+            if self.converter.engine == "numpy":
+                from .vectorized import NumpyBatchRenderer
+
+                self._renderer = NumpyBatchRenderer(
+                    self._reader,
+                    self.encoders,
+                    self.converter.passthrough,
+                    self.converter.dialect,
+                )
+            elif self.converter.passthrough:
+                self._raw_encoders = self.converter._build_raw_encoders(self._reader, self.encoders)
+        return self._reader
+
+    def format(self, payload: Union[bytes, List[Tuple[Any, ...]]]) -> Tuple[str, int, float]:
+        """
+        Format one batch.
+
+        Args:
+            payload: Raw record bytes or a list of value tuples
+
+        Returns:
+            Tuple of (INSERT SQL statement, number of records, busy seconds)
+        """
+        started = time.perf_counter()
+        converter = self.converter
+
+        if isinstance(payload, bytes):
+            reader = self._open_reader()
+            if self._renderer is not None or self._raw_encoders is not None:
+                if self._renderer is not None:
+                    values_list = self._renderer.render_block(payload)
+                else:
+                    values_list = converter._render_raw_records(
+                        reader.iter_block_records(payload), self._raw_encoders
+                    )
+                insert_sql = (
+                    converter._format_batch(self.table_name, self.field_names, values_list)
+                    if values_list
+                    else ""
+                )
+                return insert_sql, len(values_list), time.perf_counter() - started
+            rows: Any = reader.iter_block_rows(payload)
+        else:
+            rows = payload
+
+        records = list(rows)
+        insert_sql = converter._process_records_batch(
+            records, self.table_name, self.field_names, self.encoders
+        )
+        return insert_sql, len(records), time.perf_counter() - started
+
+
+def _init_worker(formatter: BatchFormatter) -> None:
+    global _worker_formatter
+    _worker_formatter = formatter
+
+
+def _format_in_worker(payload: Union[bytes, List[Tuple[Any, ...]]]) -> Tuple[str, int, float]:
+    assert _worker_formatter is not None
+    return _worker_formatter.format(payload)
+
+
+class ConversionPipeline:
+    """Reader -> formatter pool -> ordered writer pipeline for one table."""
+
+    def __init__(
+        self,
+        converter: "DBFToSQLConverter",
+        table_name: str,
+        field_names: List[str],
+        workers: int,
+        queue_depth: int,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            converter: Converter whose settings and formatting are used
+            table_name: Name of the table
+            field_names: List of sanitized field names
+            workers: Number of formatter workers
+            queue_depth: Capacity of each queue between stages, in batches
+        """
+        self.converter = converter
+        self.table_name = table_name
+        self.field_names = field_names
+        self.workers = max(1, workers)
+        self.queue_depth = max(1, queue_depth)
+        self.use_threads = free_threaded()
+        self.stats = PipelineStats(
+            self.workers, self.queue_depth, "threads" if self.use_threads else "processes"
+        )
+
+    def _iter_payloads(self, table: Any) -> Iterator[Union[bytes, List[Tuple[Any, ...]]]]:
+        """Reader stage: yield raw record blocks or lists of decoded rows."""
+        batch_size = self.converter.batch_size
+
+        if isinstance(table, DBFReader):
+            for start, stop in iter_batch_ranges(table, batch_size):
+                yield table.read_selected_block(start, stop).tobytes()
+            return
+
+        rows = self.converter._iter_rows(table)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    def _create_executor(self, formatter: BatchFormatter) -> Executor:
+        if self.use_threads:
+            return ThreadPoolExecutor(max_workers=self.workers)
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(formatter,)
+        )
+
+    @staticmethod
+    def _put(queue: "Queue[Any]", item: Any, failed: threading.Event) -> bool:
+        """Put an item, giving up if another stage has failed."""
+        while not failed.is_set():
+            try:
+                queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    @staticmethod
+    def _get(queue: "Queue[Any]", failed: threading.Event) -> Any:
+        """Get an item, returning the end sentinel if another stage has failed."""
+        while not failed.is_set():
+            try:
+                return queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                continue
+        return _DONE
+
+    def run(self, table: Any, sql_file: Any) -> int:
+        """
+        Convert all records of an open table and write them to sql_file.
+
+        Args:
+            table: Table returned by DBFToSQLConverter._open_table
+            sql_file: Open text file the INSERT statements are written to, or a
+                ShardedWriter, whose write_batch() receives each batch
+
+        Returns:
+            Total number of records written
+        """
+        stats = self.stats
+        progress = self.converter.progress
+        read_queue: "Queue[Any]" = Queue(maxsize=self.queue_depth)
+        write_queue: "Queue[Any]" = Queue(maxsize=self.queue_depth)
+        failed = threading.Event()
+        errors: List[BaseException] = []
+        total_processed = 0
+        write_batch = getattr(sql_file, "write_batch", None)
+
+        def read() -> None:
+            try:
+                payloads = self._iter_payloads(table)
+                while True:
+                    started = time.perf_counter()
+                    payload = next(payloads, _DONE)
+                    stats.reader_busy += time.perf_counter() - started
+                    if payload is _DONE or not self._put(read_queue, payload, failed):
+                        break
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+            finally:
+                self._put(read_queue, _DONE, failed)
+
+        def write() -> None:
+            nonlocal total_processed
+            try:
+                while True:
+                    future = self._get(write_queue, failed)
+                    if future is _DONE:
+                        break
+                    insert_sql, count, busy = future.result()
+                    stats.formatter_busy += busy
+                    if not count:
+                        continue
+                    if len(insert_sql) > stats.max_batch_bytes:
+                        stats.max_batch_bytes = len(insert_sql)
+
+                    started = time.perf_counter()
+                    if write_batch is not None:
+                        write_batch(insert_sql, count)
+                    else:
+                        sql_file.write(insert_sql)
+                        sql_file.write("\n")
+                    stats.writer_busy += time.perf_counter() - started
+
+                    total_processed += count
+                    progress.update(total_processed)
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+
+        formatter = BatchFormatter(
+            self.converter,
+            self.table_name,
+            self.field_names,
+            [str(field.type) for field in table.fields],
+            table.filename if isinstance(table, DBFReader) else None,
+        )
+        if self.use_threads:
+            # Formatter threads share one reader; open it before they start
+            formatter.open()
+        started = time.perf_counter()
+
+        with self._create_executor(formatter) as executor:
+            reader_thread = threading.Thread(target=read, name="dbf2sql-reader", daemon=True)
+            writer_thread = threading.Thread(target=write, name="dbf2sql-writer", daemon=True)
+            reader_thread.start()
+            writer_thread.start()
+
+            # Dispatch batches to the formatters in read order
+            while True:
+                payload = self._get(read_queue, failed)
+                if payload is _DONE:
+                    break
+
+                future: "Future[Tuple[str, int, float]]"
+                if self.use_threads:
+                    future = executor.submit(formatter.format, payload)
+                else:
+                    future = executor.submit(_format_in_worker, payload)
+
+                stats.batches += 1
+                stats.sample_queues(read_queue.qsize(), write_queue.qsize())
+                if not self._put(write_queue, future, failed):
+                    break
+
+            self._put(write_queue, _DONE, failed)
+            reader_thread.join()
+            writer_thread.join()
+
+        stats.wall_time = time.perf_counter() - started
+        formatter.close()
+
+        if errors:
+            raise errors[0]
+
+        return total_processed
@@ -0,0 +1,317 @@
+"""
+Progress Reporting Module
+
+Reports how far a conversion got: records written against the record count of
+the file, and for runs over several files the share of the total record data
+(header record count times record length) converted. Updates are throttled to
+a fixed interval, so reporting costs one clock read per batch.
+"""
+
+import json
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, TextIO, Union
+
+PROGRESS_MODES = ("log", "bar", "json", "none")
+
+# Seconds between two updates of each mode when none is configured
+DEFAULT_INTERVALS = {"log": 5.0, "bar": 0.2, "json": 1.0, "callback": 0.5}
+
+BAR_WIDTH = 30
+
+
+class ProgressUpdate(NamedTuple):
+    """Snapshot of a conversion's progress, as passed to progress callbacks."""
+
+    file: Optional[str]
+    records: int
+    total_records: int
+    bytes: int
+    total_bytes: int
+    files_done: int
+    total_files: int
+    elapsed: float
+    rows_per_second: float
+    eta: Optional[float]
+    finished: bool
+
+    @property
+    def fraction(self) -> float:
+        """Share of the run converted, from 0.0 to 1.0."""
+        if self.total_bytes:
+            return min(1.0, self.bytes / self.total_bytes)
+        if self.total_records:
+            return min(1.0, self.records / self.total_records)
+        return 1.0 if self.finished else 0.0
+
+    @property
+    def file_fraction(self) -> float:
+        """Share of the current file converted, from 0.0 to 1.0."""
+        if self.finished or not self.total_records:
+            return 1.0 if self.finished else 0.0
+        return min(1.0, self.records / self.total_records)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Render a duration as H:MM:SS, or "?" when unknown."""
+    if seconds is None:
+        return "?"
+    minutes, secs = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+class Progress:
+    """
+    Progress of a conversion run over one or more files.
+
+    Modes are "log" (info messages on the converter's logger), "bar" (a
+    progress bar redrawn in place on stderr), "json" (one JSON object per
+    update on stderr) and "none". A callable is called with a
+    ProgressUpdate instead. The converter calls start_file when a file is
+    opened, update with the running record count after each batch and
+    finish_file when the file is complete; start_run and finish_run frame
+    runs over several files.
+    """
+
+    def __init__(
+        self,
+        mode: Union[str, Callable[[ProgressUpdate], None]] = "log",
+        interval: Optional[float] = None,
+        logger: Optional[logging.Logger] = None,
+        stream: Optional[TextIO] = None,
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            mode: One of PROGRESS_MODES, or a callback receiving ProgressUpdate
+            interval: Minimum seconds between two updates (default: per mode,
+                see DEFAULT_INTERVALS)
+            logger: Logger of the "log" mode (default: the "dbf2sql" logger)
+            stream: Output of the "bar" and "json" modes (default: sys.stderr)
+
+        Raises:
+            ValueError: For an unknown mode
+        """
+        self.callback: Optional[Callable[[ProgressUpdate], None]] = None
+        if callable(mode):
+            self.callback, mode = mode, "callback"
+        elif mode not in PROGRESS_MODES:
+            raise ValueError(
+                f"Unknown progress mode: {mode!r} (expected one of {', '.join(PROGRESS_MODES)})"
+            )
+        self.mode = mode
+        self.interval = DEFAULT_INTERVALS.get(mode, 0.0) if interval is None else interval
+        self.logger = logger or logging.getLogger("dbf2sql")
+        self.stream = stream
+
+        self.total_files = 0
+        self.total_bytes = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.run_started = 0.0
+
+        self.file: Optional[str] = None
+        self.total_records = 0
+        self.file_bytes = 0
+        self.file_started = 0.0
+        self._next_update = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes convert ranges for a parent that reports their progress
+        state = self.__dict__.copy()
+        state.update(mode="none", callback=None, stream=None)
+        return state
+
+    def start_run(self, total_files: int, total_bytes: int) -> None:
+        """
+        Start a run over several files.
+
+        Args:
+            total_files: Number of files to convert
+            total_bytes: Sum of their record data sizes (see estimate_data_size)
+        """
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files_done = 0
+        self.bytes_done = 0
+        self.run_started = time.perf_counter()
+
+    def start_file(self, path: Optional[str], total_records: int, data_bytes: int = 0) -> None:
+        """
+        Start reporting on one file.
+
+        Args:
+            path: Path of the file
+            total_records: Number of records that will be written
+            data_bytes: Size of its record data, counted towards the run total
+        """
+        self.file = path
+        self.total_records = total_records
+        self.file_bytes = data_bytes
+        self.file_started = time.perf_counter()
+        self._next_update = self.file_started + self.interval
+        if not self.total_files:
+            self.run_started = self.file_started
+
+    def update(self, records: int) -> None:
+        """
+        Report the number of records of the current file written so far.
+
+        Cheap enough to call after every batch: nothing is reported until
+        the interval since the previous update has passed.
+
+        Args:
+            records: Records written so far
+        """
+        if self.mode == "none":
+            return
+        now = time.perf_counter()
+        if now < self._next_update:
+            return
+        self._next_update = now + self.interval
+        self._emit(self._snapshot(records, now, False))
+
+    def finish_file(self, records: int, elapsed: Optional[float] = None) -> None:
+        """
+        Report a file as complete.
+
+        Args:
+            records: Records written in total
+            elapsed: Seconds the file took, when it was converted elsewhere
+                (e.g. in a worker process); default: since start_file
+        """
+        if self.total_files:
+            self.files_done += 1
+            self.bytes_done += self.file_bytes
+        if self.mode != "none":
+            now = time.perf_counter()
+            if elapsed is not None:
+                self.file_started = now - elapsed
+            self._emit(self._snapshot(records, now, True))
+        self.file = None
+
+    def finish_run(self) -> None:
+        """End a run over several files."""
+        if self.mode == "json" and self.total_files:
+            elapsed = time.perf_counter() - self.run_started
+            self._write(
+                json.dumps(
+                    {
+                        "event": "done",
+                        "files": self.files_done,
+                        "total_files": self.total_files,
+                        "bytes": self.bytes_done,
+                        "elapsed": round(elapsed, 3),
+                    }
+                )
+                + "\n"
+            )
+        self.total_files = 0
+        self.total_bytes = 0
+
+    def _snapshot(self, records: int, now: float, finished: bool) -> ProgressUpdate:
+        """Build the update of the current state."""
+        fraction = 1.0 if finished else 0.0
+        if self.total_records and not finished:
+            fraction = min(1.0, records / self.total_records)
+        file_elapsed = now - self.file_started
+        rows_per_second = records / file_elapsed if file_elapsed > 0 else 0.0
+
+        if self.total_files:
+            # Across files the estimate goes by record data, as file sizes differ widely
+            # finish_file has already counted a finished file in bytes_done
+            done = self.bytes_done + (0 if finished else int(fraction * self.file_bytes))
+            total = self.total_bytes
+            elapsed = now - self.run_started
+        else:
+            done = int(fraction * self.file_bytes)
+            total = self.file_bytes
+            elapsed = file_elapsed
+
+        eta: Optional[float] = None
+        if finished and not self.total_files:
+            eta = 0.0
+        elif self.total_files and total and done:
+            eta = elapsed * (total - done) / done
+        elif self.total_records and records:
+            eta = file_elapsed * (self.total_records - records) / records
+
+        return ProgressUpdate(
+            self.file,
+            records,
+            self.total_records,
+            done,
+            total,
+            self.files_done,
+            self.total_files,
+            elapsed,
+            rows_per_second,
+            eta,
+            finished,
+        )
+
+    def _emit(self, update: ProgressUpdate) -> None:
+        """Report an update in the configured mode."""
+        if self.callback is not None:
+            self.callback(update)
+        elif self.mode == "log":
+            # A single file's completion is already logged by the converter
+            if not update.finished or update.total_files:
+                self.logger.info(self._describe(update))
+        elif self.mode == "bar":
+            self._write(self._bar(update) + ("\n" if update.finished else ""))
+        elif self.mode == "json":
+            event = "file" if update.finished else "progress"
+            self._write(json.dumps({"event": event, **self._as_dict(update)}) + "\n")
+
+    def _write(self, text: str) -> None:
+        stream = self.stream or sys.stderr
+        stream.write(text)
+        stream.flush()
+
+    def _describe(self, update: ProgressUpdate) -> str:
+        """Render an update as a log message."""
+        if update.finished:
+            text = f"Finished {update.records} records"
+        else:
+            text = f"Processed {update.records} of {update.total_records} records"
+        if update.file is not None:
+            text += f" of {update.file}"
+        text += f" ({update.file_fraction:.1%}), {update.rows_per_second:,.0f} rows/s"
+        if update.total_files:
+            current = update.files_done + (0 if update.finished else 1)
+            text += f", file {current}/{update.total_files}, {update.fraction:.1%} of all data"
+        return text + f", ETA {format_duration(update.eta)}"
+
+    def _bar(self, update: ProgressUpdate) -> str:
+        """Render an update as a progress bar line."""
+        filled = int(update.fraction * BAR_WIDTH)
+        prefix = ""
+        if update.total_files:
+            current = update.files_done + (0 if update.finished else 1)
+            prefix = f"[{current}/{update.total_files}] "
+        return (
+            f"\r{prefix}[{'#' * filled}{'-' * (BAR_WIDTH - filled)}] {update.fraction:6.1%} "
+            f"{update.records:,}/{update.total_records:,} rows "
+            f"{update.rows_per_second:,.0f} rows/s ETA {format_duration(update.eta)}\033[K"
+        )
+
+    @staticmethod
+    def _as_dict(update: ProgressUpdate) -> Dict[str, Any]:
+        """Render an update as a JSON-serializable dictionary."""
+        return {
+            "file": update.file,
+            "records": update.records,
+            "total_records": update.total_records,
+            "bytes": update.bytes,
+            "total_bytes": update.total_bytes,
+            "files_done": update.files_done,
+            "total_files": update.total_files,
+            "percent": round(update.fraction * 100, 2),
+            "elapsed": round(update.elapsed, 3),
+            "rows_per_second": round(update.rows_per_second, 1),
+            "eta": round(update.eta, 1) if update.eta is not None else None,
+        }
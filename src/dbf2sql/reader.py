@@ -0,0 +1,592 @@
+"""
+Native DBF Reader Module
+
+Parses DBF headers directly and memory-maps the file so records can be
+handed out as fixed-width memoryview slices without per-record dict
+construction.
+"""
+
+import codecs
+import datetime
+import mmap
+import os
+import struct
+from decimal import Decimal
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Offset from julian day numbers (used in T fields) to proleptic Gregorian ordinals
+JULIAN_DAY_OFFSET = 1721425
+
+# Record deletion flags and end-of-file marker
+RECORD_ACTIVE = 0x20
+RECORD_DELETED = 0x2A
+END_OF_FILE = 0x1A
+
+# Visual FoxPro versions that store B fields as doubles instead of memo indexes
+VFP_VERSIONS = (0x30, 0x31, 0x32)
+
+DBF_HEADER = struct.Struct("<BBBBLHH20x")
+DBF_FIELD = struct.Struct("<11sc4xBB14x")
+
+
+class UnsupportedDBFError(ValueError):
+    """Raised when a DBF file uses a variant the native reader does not handle."""
+
+
+class DBFField(NamedTuple):
+    """Field descriptor parsed from the DBF header."""
+
+    name: str
+    type: str
+    length: int
+    decimal_count: int
+    offset: int
+
+
+def _parse_char(data: bytes, encoding: str, errors: str) -> str:
+    return data.rstrip(b"\0 ").decode(encoding, errors)
+
+
+def _parse_numeric(data: bytes) -> Any:
+    data = data.strip().strip(b"*")
+    try:
+        return int(data)
+    except ValueError:
+        if not data.strip():
+            return None
+        return float(data.replace(b",", b"."))
+
+
+def _parse_float(data: bytes) -> Optional[float]:
+    data = data.strip().strip(b"*")
+    if data:
+        return float(data)
+    return None
+
+
+def _parse_date(data: bytes) -> Optional[datetime.date]:
+    try:
+        return datetime.date(int(data[:4]), int(data[4:6]), int(data[6:8]))
+    except ValueError:
+        if data.strip(b" 0") == b"":
+            return None
+        raise ValueError(f"invalid date {data!r}")
+
+
+def _parse_logical(data: bytes) -> Optional[bool]:
+    if data in b"TtYy":
+        return True
+    if data in b"FfNn":
+        return False
+    if data in b"? ":
+        return None
+    raise ValueError(f"Illegal value for logical field: {data!r}")
+
+
+def _parse_integer(data: bytes) -> int:
+    return int(struct.unpack("<i", data)[0])
+
+
+def _parse_double(data: bytes) -> float:
+    return float(struct.unpack("<d", data)[0])
+
+
+def _parse_currency(data: bytes) -> Decimal:
+    return Decimal(struct.unpack("<q", data)[0]) / 10000
+
+
+def _parse_timestamp(data: bytes) -> Optional[datetime.datetime]:
+    if not data.strip():
+        return None
+    day, msec = struct.unpack("<LL", data)
+    if not day:
+        return None
+    return datetime.datetime.fromordinal(day - JULIAN_DAY_OFFSET) + datetime.timedelta(
+        seconds=msec / 1000
+    )
+
+
+def header_date(year: int, month: int, day: int) -> Optional[datetime.date]:
+    """
+    Return the last-update date stored in a DBF header.
+
+    Args:
+        year: Year byte, an offset from 1900 (values below 80 from 2000, as
+            written by some older tools)
+        month: Month byte
+        day: Day byte
+
+    Returns:
+        The date, or None if the bytes do not form a valid date
+    """
+    try:
+        return datetime.date(2000 + year if year < 80 else 1900 + year, month, day)
+    except ValueError:
+        return None
+
+
+def ascii_safe_encoding(encoding: str) -> bool:
+    """
+    Return True if ASCII bytes always stand for themselves in the encoding.
+
+    This holds for UTF-8 and for single-byte codepages whose lower half is
+    ASCII. In such encodings quotes and newlines can be found and escaped in
+    the raw bytes before decoding; multi-byte codepages (e.g. Shift-JIS) and
+    UTF-16 need to be decoded first.
+
+    Args:
+        encoding: Codec name
+
+    Returns:
+        True if the encoding is ASCII-safe
+    """
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    if name in ("utf-8", "ascii"):
+        return True
+
+    try:
+        decoded = bytes(range(256)).decode(name, "replace")
+    except (UnicodeError, LookupError):
+        return False
+    return len(decoded) == 256 and decoded[:128] == bytes(range(128)).decode("ascii")
+
+
+def select_fields(
+    names: Sequence[str],
+    columns: Optional[Sequence[str]] = None,
+    exclude_columns: Optional[Sequence[str]] = None,
+) -> List[int]:
+    """
+    Resolve a column projection to field indexes.
+
+    Names are matched case-insensitively, as DBF field names are usually
+    stored in upper case. Fields keep their table order.
+
+    Args:
+        names: Field names of the table, in table order
+        columns: Fields to keep (default: all fields)
+        exclude_columns: Fields to drop
+
+    Returns:
+        Indexes of the selected fields
+
+    Raises:
+        ValueError: If a name matches no field or no field is left
+    """
+    known = {name.upper() for name in names}
+    requested = list(columns or []) + list(exclude_columns or [])
+    unknown = [name for name in requested if name.upper() not in known]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+
+    keep = None if columns is None else {name.upper() for name in columns}
+    drop = {name.upper() for name in exclude_columns or []}
+    indexes = [
+        index
+        for index, name in enumerate(names)
+        if (keep is None or name.upper() in keep) and name.upper() not in drop
+    ]
+    if not indexes:
+        raise ValueError("No columns left to convert after applying the column selection")
+
+    return indexes
+
+
+def estimate_data_size(filename: str) -> int:
+    """
+    Estimate the size of a DBF file's record data from its header alone.
+
+    Args:
+        filename: Path to the DBF file
+
+    Returns:
+        Header record count times record length, the file size if the file is
+        too short to hold a header, or 0 if it cannot be opened
+    """
+    try:
+        with open(filename, "rb") as infile:
+            header = infile.read(DBF_HEADER.size)
+            if len(header) < DBF_HEADER.size:
+                return os.fstat(infile.fileno()).st_size
+    except OSError:
+        return 0
+    _, _, _, _, record_count, _, record_length = DBF_HEADER.unpack(header)
+    return int(record_count) * int(record_length)
+
+
+class DBFReader:
+    """
+    Memory-mapped reader for fixed-width DBF records.
+
+    Decoding matches dbfread's field parsers so output is identical regardless
+    of which reader produced the values. Records are selected the way dbfread
+    selects them too: only records flagged active (a space) are returned, and
+    reading stops at the end-of-file marker or the end of the data, whatever
+    the record count in the header says. Memo-backed fields and unknown field
+    types raise UnsupportedDBFError so callers can fall back to dbfread.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        encoding: str = "utf-8",
+        char_decode_errors: str = "strict",
+        columns: Optional[Sequence[str]] = None,
+        exclude_columns: Optional[Sequence[str]] = None,
+    ):
+        """
+        Open and parse a DBF file.
+
+        Fields left out by the column projection are never sliced or decoded,
+        and their type does not need to be supported.
+
+        Args:
+            filename: Path to the DBF file
+            encoding: Character encoding for field names and C fields
+            char_decode_errors: Error handler used when decoding text
+            columns: Fields to read (default: all fields); see select_fields
+            exclude_columns: Fields to skip; see select_fields
+        """
+        self.filename = filename
+        self.encoding = encoding
+        self.char_decode_errors = char_decode_errors
+        self.fields: List[DBFField] = []
+
+        self._file = open(filename, "rb")
+        try:
+            self._read_header()
+            self.table_fields = list(self.fields)
+            if columns is not None or exclude_columns is not None:
+                indexes = select_fields(
+                    [field.name for field in self.fields], columns, exclude_columns
+                )
+                self.fields = [self.fields[index] for index in indexes]
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._view = memoryview(self._mm)
+        # Like dbfread, trust the data rather than the header record count
+        self.record_count = max(0, (len(self._mm) - self.header_length) // self.record_length)
+        self._decoders = self._build_decoders()
+        self.record_filter: Optional[Callable[[bytes], bool]] = None
+        self._selection: Optional[bytes] = None
+
+    def _read_header(self) -> None:
+        """Parse the table header and field descriptors."""
+        header = self._file.read(DBF_HEADER.size)
+        if len(header) < DBF_HEADER.size:
+            raise UnsupportedDBFError("file too short for a DBF header")
+
+        version, year, month, day, record_count, header_length, record_length = DBF_HEADER.unpack(
+            header
+        )
+        self.version: int = version
+        self.header_record_count: int = record_count
+        self.header_length: int = header_length
+        self.record_length: int = record_length
+
+        self.date = header_date(year, month, day)
+
+        if self.record_length < 1:
+            raise UnsupportedDBFError(f"invalid record length {self.record_length}")
+
+        offset = 1  # Skip the deletion flag
+        while True:
+            sep = self._file.read(1)
+            if sep in (b"\r", b"\n", b""):
+                break
+
+            raw = sep + self._file.read(DBF_FIELD.size - 1)
+            if len(raw) < DBF_FIELD.size:
+                raise UnsupportedDBFError("truncated field descriptor")
+
+            raw_name, raw_type, length, decimal_count = DBF_FIELD.unpack(raw)
+            field_type = chr(ord(raw_type))
+
+            # For character fields > 255 bytes the high byte is stored in decimal_count
+            if field_type == "C":
+                length |= decimal_count << 8
+                decimal_count = 0
+
+            name = raw_name.split(b"\0")[0].decode(self.encoding, self.char_decode_errors)
+            self.fields.append(DBFField(name, field_type, length, decimal_count, offset))
+            offset += length
+
+        if offset > self.record_length:
+            raise UnsupportedDBFError("field lengths exceed the record length")
+
+    def _build_decoders(self) -> List[Tuple[int, int, Callable[[bytes], Any]]]:
+        """Build one (start, end, decoder) entry per field, once per file."""
+        return [
+            (field.offset, field.offset + field.length, self.decoder_for(field))
+            for field in self.fields
+        ]
+
+    def decoder_for(self, field: DBFField) -> Callable[[bytes], Any]:
+        """
+        Return the decoder for one field's raw bytes.
+
+        Args:
+            field: Field descriptor of this table
+
+        Returns:
+            Callable turning the field bytes into a Python value
+
+        Raises:
+            UnsupportedDBFError: If the field type is not handled natively
+        """
+        encoding = self.encoding
+        errors = self.char_decode_errors
+        field_type = field.type
+
+        if field_type in "CV":
+
+            def decode_char(data: bytes) -> str:
+                return _parse_char(data, encoding, errors)
+
+            return decode_char
+        if field_type == "N":
+            return _parse_numeric
+        if field_type == "F":
+            return _parse_float
+        if field_type == "D":
+            return _parse_date
+        if field_type == "L":
+            if field.length != 1:
+                raise UnsupportedDBFError(f"Field type L must have length 1 (was {field.length})")
+            return _parse_logical
+        if field_type in "I+":
+            if field.length != 4:
+                raise UnsupportedDBFError(f"Field type I must have length 4 (was {field.length})")
+            return _parse_integer
+        if field_type == "O" or (field_type == "B" and self.version in VFP_VERSIONS):
+            return _parse_double
+        if field_type == "Y":
+            return _parse_currency
+        if field_type in "T@":
+            return _parse_timestamp
+        raise UnsupportedDBFError(f"Unsupported field type: {field_type!r}")
+
+    def record_offset(self, index: int) -> int:
+        """Return the byte offset of the record at the given index."""
+        return self.header_length + index * self.record_length
+
+    def read_block(self, start: int, stop: int) -> memoryview:
+        """
+        Return the raw bytes of records [start, stop) as one contiguous memoryview.
+
+        Deleted records and the end-of-file marker are included; callers are
+        expected to inspect the deletion flag of each record themselves.
+        """
+        stop = min(stop, self.record_count)
+        return self._view[self.record_offset(start) : self.record_offset(max(start, stop))]
+
+    def read_selected_block(self, start: int, stop: int) -> memoryview:
+        """
+        Like read_block, but with records rejected by the record filter flagged as deleted.
+
+        Without a filter this is the memory-mapped block itself; with one it
+        is a copy whose deletion flags are those of deletion_flags(). The
+        filter is evaluated on the block's records only, unless the selection
+        of the whole file has already been made.
+        """
+        block = self.read_block(start, stop)
+        if self.record_filter is None:
+            return block
+
+        data = bytearray(block)
+        if self._selection is not None:
+            flags = self._selection[start:stop]
+        else:
+            flags = self._select_records(start, stop)
+        data[0 : len(flags) * self.record_length : self.record_length] = flags
+        return memoryview(bytes(data))
+
+    def set_filter(self, record_filter: Optional[Callable[[bytes], bool]]) -> None:
+        """
+        Restrict the active records to those accepted by a predicate.
+
+        The predicate receives the raw record bytes. Reading a record range
+        evaluates it on that range only; the first call of deletion_flags
+        evaluates it once over the whole file and keeps the selection for all
+        later reads. Rejected records are treated exactly like deleted ones by
+        every method of the reader, except len(), which counts the active
+        records stored in the file without evaluating the filter.
+
+        Args:
+            record_filter: Predicate over raw records, or None to remove the filter
+        """
+        self.record_filter = record_filter
+        self._selection = None
+
+    @property
+    def decoders(self) -> List[Tuple[int, int, Callable[[bytes], Any]]]:
+        """Per-field (start, end, decoder) entries in field order."""
+        return self._decoders
+
+    def iter_records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[memoryview]:
+        """
+        Iterate over active records as memoryview slices.
+
+        Args:
+            start: Index of the first record to read
+            stop: Index after the last record to read (default: all records)
+
+        Yields:
+            Memoryview of each raw record, including the deletion flag byte
+        """
+        view = self._view
+        record_length = self.record_length
+        if stop is None or stop > self.record_count:
+            stop = self.record_count
+
+        if self._selection is not None:
+            flags = self._selection
+            offset = self.record_offset(start)
+            for index in range(start, min(stop, len(flags))):
+                if flags[index] == RECORD_ACTIVE:
+                    yield view[offset : offset + record_length]
+                offset += record_length
+            return
+
+        # Without a selection of the whole file, the filter runs on this range only
+        accept = self.record_filter
+        offset = self.record_offset(start)
+        for _ in range(start, stop):
+            flag = view[offset]
+            if flag == END_OF_FILE:
+                break
+            if flag == RECORD_ACTIVE and (
+                accept is None or accept(self._mm[offset : offset + record_length])
+            ):
+                yield view[offset : offset + record_length]
+            offset += record_length
+
+    def decode_record(self, record: memoryview) -> Tuple[Any, ...]:
+        """
+        Decode a raw record into a tuple of Python values in field order.
+
+        Args:
+            record: Raw record as returned by iter_records, or its bytes
+
+        Returns:
+            Tuple of decoded field values
+        """
+        data = bytes(record)
+        return tuple(decoder(data[start:end]) for start, end, decoder in self._decoders)
+
+    def iter_block_rows(self, data: bytes) -> Iterator[Tuple[Any, ...]]:
+        """
+        Decode the active records in a block of raw record bytes.
+
+        Args:
+            data: Consecutive raw records, e.g. a copy of read_block()
+
+        Yields:
+            Tuple of decoded field values for each active record
+        """
+        decoders = self._decoders
+        for record in self.iter_block_records(data):
+            yield tuple(decoder(record[start:end]) for start, end, decoder in decoders)
+
+    def iter_block_records(self, data: bytes) -> Iterator[bytes]:
+        """
+        Split a block of raw record bytes into its active records.
+
+        Args:
+            data: Consecutive raw records, e.g. a copy of read_block()
+
+        Yields:
+            Raw bytes of each active record, including the deletion flag byte
+        """
+        record_length = self.record_length
+        for offset in range(0, len(data) - record_length + 1, record_length):
+            flag = data[offset]
+            if flag == END_OF_FILE:
+                break
+            if flag == RECORD_ACTIVE:
+                yield data[offset : offset + record_length]
+
+    def iter_rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        Iterate over decoded active records in the given index range.
+
+        Args:
+            start: Index of the first record to read
+            stop: Index after the last record to read (default: all records)
+
+        Yields:
+            Tuple of decoded field values for each record
+        """
+        decode = self.decode_record
+        for record in self.iter_records(start, stop):
+            yield decode(record)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return self.iter_rows()
+
+    def deletion_flags(self) -> bytes:
+        """
+        Return the deletion flag byte of every record, one byte per record.
+
+        The result is truncated at the end-of-file marker, if there is one.
+        Records rejected by the record filter are flagged as deleted.
+        """
+        if self.record_filter is not None:
+            if self._selection is None:
+                self._selection = self._select_records()
+            return self._selection
+        return self._raw_deletion_flags()
+
+    def _raw_deletion_flags(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Return the deletion flags stored in the file for records [start, stop)."""
+        if stop is None or stop > self.record_count:
+            stop = self.record_count
+        flags: bytes = self._mm[
+            self.record_offset(start) : self.record_offset(max(start, stop)) : self.record_length
+        ]
+        eof = flags.find(bytes([END_OF_FILE]))
+        if eof != -1:
+            flags = flags[:eof]
+        return flags
+
+    def _select_records(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Evaluate the record filter on records [start, stop), flagging rejects as deleted."""
+        assert self.record_filter is not None
+        accept = self.record_filter
+        mm = self._mm
+        record_length = self.record_length
+        flags = bytearray(self._raw_deletion_flags(start, stop))
+
+        offset = self.record_offset(start)
+        for index, flag in enumerate(flags):
+            if flag == RECORD_ACTIVE and not accept(mm[offset : offset + record_length]):
+                flags[index] = RECORD_DELETED
+            offset += record_length
+
+        return bytes(flags)
+
+    def __len__(self) -> int:
+        """Return the number of active records in the file, before any record filter."""
+        return self._raw_deletion_flags().count(bytes([RECORD_ACTIVE]))
+
+    def close(self) -> None:
+        """Release the memory map and the underlying file."""
+        try:
+            self._view.release()
+            self._mm.close()
+        except BufferError:
+            # Record views are still referenced; the map is released with them
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "DBFReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
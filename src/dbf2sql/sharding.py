@@ -0,0 +1,207 @@
+"""
+Output Sharding Module
+
+Splits the SQL output of one table into numbered, self-contained shard files
+so several client sessions can load them in parallel, and records the shards
+in a JSON manifest.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .compression import DEFAULT_BLOCK_SIZE, EXTENSIONS, open_output
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def shard_base(sql_file_path: str, codec: Optional[str]) -> Path:
+    """
+    Strip the .sql and compression extensions from an output path.
+
+    Args:
+        sql_file_path: Output path, e.g. "out/table.sql.gz"
+        codec: Compression codec of the output
+
+    Returns:
+        Path without extensions, e.g. "out/table"
+    """
+    name = sql_file_path
+    if codec is not None and name.lower().endswith(EXTENSIONS[codec]):
+        name = name[: -len(EXTENSIONS[codec])]
+    return Path(name).with_suffix("")
+
+
+class ShardedWriter:
+    """
+    Write INSERT batches across numbered shard files.
+
+    Shard 0 holds the DDL. Data shards start when the current one would
+    exceed max_bytes (uncompressed) or max_rows; batches are never split, so
+    a single batch larger than the limits gets a shard of its own. Every
+    data shard carries its own bulk-load header and footer (COPY, BEGIN /
+    COMMIT, LOAD DATA), so shards load independently once shard 0 has run.
+    """
+
+    def __init__(
+        self,
+        sql_file_path: str,
+        codec: Optional[str],
+        max_bytes: int,
+        max_rows: int,
+        shard_header: Callable[[str], str],
+        shard_footer: str,
+        data_suffix: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        """
+        Initialize the writer; no file is created until something is written.
+
+        Args:
+            sql_file_path: Unsharded output path the shard names derive from
+            codec: Compression codec of the shard SQL files
+            max_bytes: Uncompressed size limit of each data shard (0: none)
+            max_rows: Row limit of each data shard (0: none)
+            shard_header: Returns the text that opens a data shard, given the
+                name of the file holding its rows
+            shard_footer: Text that closes a data shard
+            data_suffix: Extension of separate row files (".tsv" for LOAD DATA),
+                or None to write the rows into the shard SQL files
+            block_size: Uncompressed characters per compressed block
+        """
+        self.base = shard_base(sql_file_path, codec)
+        self.codec = codec
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.shard_header = shard_header
+        self.shard_footer = shard_footer
+        self.data_suffix = data_suffix
+        self.block_size = block_size
+        self.shards: List[Dict[str, Any]] = []
+
+        self._sql_file: Any = None
+        self._data_file: Any = None
+        self._rows = 0
+        self._bytes = 0
+
+    def shard_path(self, index: int, suffix: Optional[str] = None) -> Path:
+        """
+        Path of a shard file.
+
+        Args:
+            index: Shard number, 0 for the DDL shard
+            suffix: File extension (default: .sql plus the codec's extension)
+
+        Returns:
+            Path such as "out/table.0003.sql.gz"
+        """
+        if suffix is None:
+            suffix = ".sql" + (EXTENSIONS[self.codec] if self.codec else "")
+        return self.base.with_name(f"{self.base.name}.{index:04d}{suffix}")
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the JSON manifest next to the shards."""
+        return self.base.with_name(self.base.name + MANIFEST_SUFFIX)
+
+    def write_ddl(self, text: str) -> None:
+        """
+        Write shard 0.
+
+        Args:
+            text: Header comments and DDL
+        """
+        path = self.shard_path(0)
+        with open_output(str(path), self.codec, block_size=self.block_size) as ddl_file:
+            ddl_file.write(text)
+        self.shards.append({"file": path.name, "rows": 0, "bytes": _size(text)})
+
+    def write_batch(self, text: str, count: int) -> None:
+        """
+        Write one rendered batch, starting a new data shard first if needed.
+
+        Args:
+            text: INSERT statement(s) or tab-separated rows of the batch
+            count: Number of rows in the batch
+        """
+        size = _size(text) + 1
+        if self._rows and (
+            (self.max_rows and self._rows + count > self.max_rows)
+            or (self.max_bytes and self._bytes + size > self.max_bytes)
+        ):
+            self._close_shard()
+        if self._sql_file is None:
+            self._open_shard()
+
+        self._data_file.write(text)
+        self._data_file.write("\n")
+        self._rows += count
+        self._bytes += size
+
+    def close(self, source: str, table_name: str) -> Dict[str, Any]:
+        """
+        Close the last shard and write the manifest.
+
+        Args:
+            source: Path of the converted DBF file
+            table_name: Name of the table
+
+        Returns:
+            The manifest contents
+        """
+        if self._sql_file is not None:
+            self._close_shard()
+
+        manifest = {
+            "source": source,
+            "table": table_name,
+            "total_rows": sum(shard["rows"] for shard in self.shards),
+            "shards": self.shards,
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+            manifest_file.write("\n")
+        return manifest
+
+    def abort(self) -> None:
+        """Close any open shard files after a failure."""
+        for handle in (self._data_file, self._sql_file):
+            if handle is not None and not getattr(handle, "closed", False):
+                handle.close()
+        self._sql_file = self._data_file = None
+
+    def _open_shard(self) -> None:
+        index = len(self.shards)
+        path = self.shard_path(index)
+        self._sql_file = open_output(str(path), self.codec, block_size=self.block_size)
+        self._data_file = self._sql_file
+        data_name = path.name
+        if self.data_suffix is not None:
+            data_path = self.shard_path(index, self.data_suffix)
+            self._data_file = open(data_path, "w", encoding="utf-8", newline="\n")
+            data_name = data_path.name
+
+        header = self.shard_header(data_name)
+        self._sql_file.write(header)
+        self.shards.append({"file": path.name, "rows": 0, "bytes": _size(header)})
+        if self.data_suffix is not None:
+            self.shards[-1]["data_file"] = data_name
+        self._rows = 0
+        self._bytes = 0
+
+    def _close_shard(self) -> None:
+        footer = self.shard_footer + f"-- Shard completed: {self._rows} records\n"
+        self._sql_file.write(footer)
+        if self._data_file is not self._sql_file:
+            self._data_file.close()
+        self._sql_file.close()
+
+        shard = self.shards[-1]
+        shard["rows"] = self._rows
+        shard["bytes"] += self._bytes + _size(footer)
+        self._sql_file = self._data_file = None
+
+
+def _size(text: str) -> int:
+    """UTF-8 size of a string."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
@@ -0,0 +1,204 @@
+"""
+Database Sink Module
+
+Loads converted rows straight into a database through DB-API 2.0 connections
+with executemany and parameter binding, instead of writing SQL text that has
+to be parsed again by a client.
+"""
+
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .dialects import Dialect, get_dialect
+
+# Dialect to use for connections of well-known driver modules
+DRIVER_DIALECTS = {
+    "sqlite3": "sqlite",
+    "psycopg": "postgresql",
+    "psycopg2": "postgresql",
+    "pg8000": "postgresql",
+    "pymysql": "mysql",
+    "MySQLdb": "mysql",
+    "mysql": "mysql",
+    "pyodbc": "sqlserver",
+    "pymssql": "sqlserver",
+}
+
+PARAMSTYLES = ("qmark", "numeric", "named", "format", "pyformat")
+
+
+def connection_dialect(connection: Any) -> Dialect:
+    """
+    Guess the dialect of a DB-API connection from its driver module.
+
+    Args:
+        connection: Open DB-API connection
+
+    Returns:
+        The matching dialect, or the generic dialect for unknown drivers
+    """
+    driver = type(connection).__module__.split(".")[0]
+    return get_dialect(DRIVER_DIALECTS.get(driver, "generic"))
+
+
+def connection_paramstyle(connection: Any) -> str:
+    """
+    Look up the paramstyle of the driver module a DB-API connection comes from.
+
+    Args:
+        connection: Open DB-API connection
+
+    Returns:
+        The driver's paramstyle, "qmark" if it cannot be found
+    """
+    module = type(connection).__module__
+    while module:
+        paramstyle = getattr(sys.modules.get(module), "paramstyle", None)
+        if paramstyle in PARAMSTYLES:
+            return str(paramstyle)
+        module = module.rpartition(".")[0]
+    return "qmark"
+
+
+class DatabaseSink:
+    """
+    Bulk-load rows into one table through a DB-API connection.
+
+    Rows are bound as parameters and sent with executemany, one call per
+    batch. The connection commits every commit_interval rows, or once after
+    the last row when commit_interval is 0, and rolls back on errors.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        dialect: Dialect,
+        paramstyle: Optional[str] = None,
+        commit_interval: int = 0,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            connection: Open DB-API connection owned by the caller
+            dialect: Dialect of the DDL, identifiers and bound values
+            paramstyle: DB-API paramstyle of the placeholders (default: the
+                driver module's paramstyle)
+            commit_interval: Number of rows per transaction; 0 loads
+                everything in a single transaction
+        """
+        self.connection = connection
+        self.dialect = dialect
+        self.paramstyle = paramstyle or connection_paramstyle(connection)
+        if self.paramstyle not in PARAMSTYLES:
+            raise ValueError(
+                f"Unknown paramstyle: {self.paramstyle!r} "
+                f"(expected one of {', '.join(PARAMSTYLES)})"
+            )
+        self.commit_interval = max(0, commit_interval)
+
+    def create_table(self, table_name: str, fields: List[Dict[str, Any]]) -> None:
+        """
+        Drop and recreate the target table, then commit.
+
+        Args:
+            table_name: Name of the table
+            fields: List of field definitions with name, type, length and decimal
+        """
+        quote = self.dialect.quote_identifier
+        columns = ", ".join(
+            f"{quote(field['name'])} "
+            f"{self.dialect.sql_type(field['type'], field['length'], field['decimal'])}"
+            for field in fields
+        )
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(table_name)}")
+            cursor.execute(f"CREATE TABLE {quote(table_name)} ({columns})")
+        finally:
+            cursor.close()
+        self.connection.commit()
+
+    def insert_sql(self, table_name: str, field_names: List[str]) -> str:
+        """
+        Build the parameterized INSERT statement passed to executemany.
+
+        Args:
+            table_name: Name of the table
+            field_names: List of field names
+
+        Returns:
+            INSERT statement with one placeholder per field
+        """
+        if self.paramstyle == "qmark":
+            placeholders = ["?"] * len(field_names)
+        elif self.paramstyle == "numeric":
+            placeholders = [f":{index + 1}" for index in range(len(field_names))]
+        elif self.paramstyle == "named":
+            placeholders = [f":p{index}" for index in range(len(field_names))]
+        else:
+            placeholders = ["%s"] * len(field_names)
+
+        quote = self.dialect.quote_identifier
+        field_list = ", ".join(quote(field) for field in field_names)
+        return f"INSERT INTO {quote(table_name)} ({field_list}) VALUES ({', '.join(placeholders)})"
+
+    def load(
+        self,
+        batches: Iterable[List[Tuple[Any, ...]]],
+        table_name: str,
+        field_names: List[str],
+        field_types: List[str],
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Insert batches of rows and commit them.
+
+        Args:
+            batches: Lists of rows as tuples of decoded values in field order
+            table_name: Name of the table
+            field_names: List of field names
+            field_types: DBF field type of each field
+            progress: Called with the running row count after each batch
+
+        Returns:
+            Number of rows inserted
+        """
+        sql = self.insert_sql(table_name, field_names)
+        adapters = self.dialect.parameter_adapters(field_types)
+        adapted = [(index, adapt) for index, adapt in enumerate(adapters) if adapt is not None]
+        named = self.paramstyle == "named"
+        keys = [f"p{index}" for index in range(len(field_names))]
+
+        total = 0
+        uncommitted = 0
+        cursor = self.connection.cursor()
+        try:
+            for rows in batches:
+                params: List[Any] = rows
+                if adapted:
+                    params = [list(row) for row in rows]
+                    for row in params:
+                        for index, adapt in adapted:
+                            row[index] = adapt(row[index])
+                if named:
+                    params = [dict(zip(keys, row)) for row in params]
+
+                cursor.executemany(sql, params)
+                total += len(rows)
+                uncommitted += len(rows)
+                if self.commit_interval and uncommitted >= self.commit_interval:
+                    self.connection.commit()
+                    uncommitted = 0
+                if progress is not None:
+                    progress(total)
+
+            self.connection.commit()
+        except BaseException:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        return total
@@ -0,0 +1,180 @@
+"""
+Conversion Statistics Module
+
+Per-stage counters of a conversion: time spent opening, reading, formatting
+and writing, rows, bytes in and out, batches and the largest batch. Counters
+are updated once per batch, cheap enough to stay on in production.
+"""
+
+import time
+from typing import Any, Dict, Iterable, Optional
+
+STAGES = ("open", "read", "format", "write")
+
+
+class _StageTimer:
+    """Context manager adding the time of a block to one stage."""
+
+    __slots__ = ("times", "stage", "started")
+
+    def __init__(self, times: Dict[str, float], stage: str):
+        self.times = times
+        self.stage = stage
+        self.started = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.times[self.stage] += time.perf_counter() - self.started
+
+
+class ConversionStats:
+    """
+    Counters of one conversion, or the sum of several.
+
+    Stages are "open" (header and field parsing), "read" (record decoding),
+    "format" (escaping values and joining statements) and "write" (writing,
+    compressing and closing the output). Engines that render straight from
+    the raw record bytes (numpy, passthrough) and worker processes (jobs)
+    report their decoding under "format". With jobs the batches are rendered
+    in worker processes and peak_batch_bytes stays 0. peak_memory_bytes is
+    only measured with a memory budget (see MemoryMonitor).
+    """
+
+    def __init__(self, source: Optional[str] = None, output: Optional[str] = None):
+        """
+        Initialize empty counters.
+
+        Args:
+            source: Path of the DBF file
+            output: Path of the output file
+        """
+        self.source = source
+        self.output = output
+        self.files = 0
+        self.records = 0
+        self.batches = 0
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.peak_batch_bytes = 0
+        self.peak_memory_bytes: Optional[int] = None
+        self.times: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.wall_time = 0.0
+
+    def stage(self, name: str) -> _StageTimer:
+        """
+        Time a block as part of a stage.
+
+        Args:
+            name: One of STAGES
+
+        Returns:
+            Context manager adding the elapsed time of its block to the stage
+        """
+        return _StageTimer(self.times, name)
+
+    def add_batch(self, text: str, count: int) -> None:
+        """
+        Count a rendered batch.
+
+        Args:
+            text: Rendered SQL or rows of the batch
+            count: Number of records in it
+        """
+        self.batches += 1
+        self.records += count
+        if len(text) > self.peak_batch_bytes:
+            self.peak_batch_bytes = len(text)
+
+    def add(self, other: "ConversionStats") -> None:
+        """
+        Add the counters of another conversion, e.g. to build a total.
+
+        Args:
+            other: Statistics to add
+        """
+        self.files += max(1, other.files)
+        self.records += other.records
+        self.batches += other.batches
+        self.input_bytes += other.input_bytes
+        self.output_bytes += other.output_bytes
+        self.peak_batch_bytes = max(self.peak_batch_bytes, other.peak_batch_bytes)
+        if other.peak_memory_bytes is not None:
+            self.peak_memory_bytes = max(self.peak_memory_bytes or 0, other.peak_memory_bytes)
+        for stage in STAGES:
+            self.times[stage] += other.times[stage]
+        self.wall_time += other.wall_time
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.records / self.wall_time if self.wall_time else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        data: Dict[str, Any] = {}
+        if self.source is not None:
+            data["source"] = self.source
+        if self.output is not None:
+            data["output"] = self.output
+        if self.files:
+            data["files"] = self.files
+        data.update(
+            {
+                "records": self.records,
+                "batches": self.batches,
+                "input_bytes": self.input_bytes,
+                "output_bytes": self.output_bytes,
+                "peak_batch_bytes": self.peak_batch_bytes,
+                "peak_memory_bytes": self.peak_memory_bytes,
+                "wall_time": round(self.wall_time, 6),
+                "stage_times": {stage: round(self.times[stage], 6) for stage in STAGES},
+                "rows_per_second": round(self.rows_per_second, 1),
+            }
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversionStats":
+        """
+        Rebuild statistics from as_dict() output, e.g. sent by a worker process.
+
+        Args:
+            data: Dictionary returned by as_dict
+
+        Returns:
+            Equivalent statistics object
+        """
+        stats = cls(data.get("source"), data.get("output"))
+        stats.files = data.get("files", 0)
+        for key in ("records", "batches", "input_bytes", "output_bytes", "peak_batch_bytes"):
+            setattr(stats, key, data[key])
+        stats.peak_memory_bytes = data.get("peak_memory_bytes")
+        stats.wall_time = data["wall_time"]
+        stats.times.update(data["stage_times"])
+        return stats
+
+    @classmethod
+    def total(cls, parts: Iterable["ConversionStats"]) -> "ConversionStats":
+        """
+        Sum the statistics of several conversions.
+
+        Args:
+            parts: Statistics of the individual files
+
+        Returns:
+            Aggregate statistics; wall_time is the sum of the files' wall times
+        """
+        total = cls()
+        for part in parts:
+            total.add(part)
+        return total
+
+    def __str__(self) -> str:
+        stages = ", ".join(f"{stage} {self.times[stage]:.2f}s" for stage in STAGES)
+        return (
+            f"{self.records} records in {self.batches} batches, {self.wall_time:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s); {stages}; "
+            f"{self.input_bytes:,} bytes in, {self.output_bytes:,} bytes out, "
+            f"largest batch {self.peak_batch_bytes:,} bytes"
+        )
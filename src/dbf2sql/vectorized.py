@@ -0,0 +1,291 @@
+"""
+NumPy Vectorized Engine Module
+
+Maps whole batches of fixed-width DBF records onto a NumPy structured array
+with one field per DBF column and renders SQL VALUES tuples column by column.
+"""
+
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, checked by numpy_available()
+    np = None  # type: ignore[assignment]
+
+from .dialects import Dialect
+from .reader import DBFReader
+
+DIGIT_0 = ord("0")
+DIGIT_9 = ord("9")
+NUMERIC_BYTES = b" 0123456789-."
+LOGICAL_VALUES = {b"TtYy": True, b"FfNn": False, b"? ": None}
+
+# Longest integer literal that always fits in an int64
+MAX_INT64_DIGITS = 18
+
+
+def numpy_available() -> bool:
+    """Return True if NumPy can be imported."""
+    return np is not None
+
+
+class NumpyBatchRenderer:
+    """
+    Render DBF records to SQL VALUES tuples one column at a time.
+
+    N, F, I, D, L and C columns are converted with vectorized NumPy operations.
+    Cells outside those fast paths (unusual numeric formats, invalid dates,
+    types without a vectorized form) are decoded and escaped one by one, so
+    the output is identical to the row-by-row engine.
+    """
+
+    def __init__(
+        self,
+        reader: DBFReader,
+        encoders: List[Callable[[Any], str]],
+        passthrough: bool = False,
+        dialect: Optional[Dialect] = None,
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            reader: Open native reader for the DBF file
+            encoders: Per-column value encoders used on the per-cell path
+            passthrough: Emit plain N and F literals as stored instead of
+                converting them to numbers and back
+            dialect: SQL dialect of the string and boolean literals
+                (default: the generic dialect)
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for the numpy engine. Please install it with: pip install numpy"
+            )
+
+        self.reader = reader
+        self.encoders = encoders
+        self.passthrough = passthrough
+        self.dialect = dialect or Dialect()
+        self.dtype = np.dtype(
+            {
+                "names": ["flag"] + [f"f{i}" for i in range(len(reader.fields))],
+                "formats": ["S1"] + [f"S{field.length}" for field in reader.fields],
+                "offsets": [0] + [field.offset for field in reader.fields],
+                "itemsize": reader.record_length,
+            }
+        )
+
+        self._numeric_bytes = np.frombuffer(NUMERIC_BYTES, dtype=np.uint8)
+        self._logical_lookup = np.full(256, "", dtype="U5")
+        literals = {
+            True: self.dialect.true_literal,
+            False: self.dialect.false_literal,
+            None: "NULL",
+        }
+        for raw_values, value in LOGICAL_VALUES.items():
+            self._logical_lookup[list(raw_values)] = literals[value]
+
+    def iter_batches(
+        self, batch_size: int, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[List[str]]:
+        """
+        Render active records in batches.
+
+        Args:
+            batch_size: Number of rendered rows per yielded batch
+            start: Index of the first record to read
+            stop: Index after the last record to read (default: all records)
+
+        Yields:
+            Lists of rendered "(v1, v2, ...)" tuples, batch_size long except the last
+        """
+        pending: List[str] = []
+        if stop is None or stop > self.reader.record_count:
+            stop = self.reader.record_count
+
+        for block_start in range(start, stop, batch_size):
+            block = self.reader.read_selected_block(
+                block_start, min(block_start + batch_size, stop)
+            )
+            rendered, at_eof = self._render_active(np.frombuffer(block, dtype=self.dtype))
+
+            pending.extend(rendered)
+            if len(pending) >= batch_size:
+                yield pending[:batch_size]
+                del pending[:batch_size]
+
+            if at_eof:
+                break
+
+        if pending:
+            yield pending
+
+    def render_block(self, data: bytes) -> List[str]:
+        """
+        Render the active records in a block of raw record bytes.
+
+        Args:
+            data: Consecutive raw records, e.g. a copy of DBFReader.read_block()
+
+        Returns:
+            List of rendered "(v1, v2, ...)" tuples
+        """
+        return self._render_active(np.frombuffer(data, dtype=self.dtype))[0]
+
+    def _render_active(self, records: Any) -> Tuple[List[str], bool]:
+        """Drop inactive records, stop at the end-of-file marker and render the rest."""
+        flags = records["flag"]
+        eof = np.flatnonzero(flags == b"\x1a")
+        if eof.size:
+            records = records[: eof[0]]
+            flags = flags[: eof[0]]
+
+        return self.render(records[flags == b" "]), bool(eof.size)
+
+    def render(self, records: Any) -> List[str]:
+        """
+        Render a structured array of records to VALUES tuples.
+
+        Args:
+            records: Structured array with the renderer's dtype
+
+        Returns:
+            List of rendered "(v1, v2, ...)" tuples
+        """
+        count = len(records)
+        if not self.reader.fields:
+            return ["()"] * count
+
+        columns = [
+            self._render_column(index, np.ascontiguousarray(records[f"f{index}"]))
+            for index in range(len(self.reader.fields))
+        ]
+
+        return [f"({', '.join(row)})" for row in zip(*columns)]
+
+    def _render_column(self, index: int, column: Any) -> List[str]:
+        """Render one contiguous S-dtype column, falling back per cell where needed."""
+        field_type = self.reader.fields[index].type
+        rendered: Optional[List[str]] = None
+        fast: Any = None
+
+        try:
+            if field_type in "CV":
+                rendered, fast = self._render_char(column)
+            elif field_type in "I+":
+                rendered = list(map(str, column.view("<i4").tolist()))
+            elif field_type == "N":
+                rendered, fast = self._render_numeric(column, allow_int=True)
+            elif field_type == "F":
+                rendered, fast = self._render_numeric(column, allow_int=False)
+            elif field_type == "D":
+                rendered, fast = self._render_date(column)
+            elif field_type == "L":
+                logical = self._logical_lookup[column.view(np.uint8)]
+                rendered, fast = list(logical.tolist()), logical != ""
+        except ValueError:
+            # Malformed values: let the per-cell decoder handle or report them
+            rendered = None
+
+        if rendered is not None and fast is None:
+            return rendered
+
+        if rendered is None:
+            slow = np.arange(len(column))
+        else:
+            slow = np.flatnonzero(~fast)
+            if not slow.size:
+                return rendered
+
+        cells = [""] * len(column) if rendered is None else rendered
+        decoder = self.reader.decoders[index][2]
+        encode = self.encoders[index]
+        raw = column.tobytes()
+        width = column.itemsize
+        for i in slow.tolist():
+            cells[i] = encode(decoder(raw[i * width : (i + 1) * width]))
+
+        return cells
+
+    def _render_char(self, column: Any) -> Tuple[List[str], Any]:
+        """Strip, decode and quote a C column in bulk; returns values and fast-path mask."""
+        stripped = np.char.rstrip(column, b"\0 ")
+        text = np.char.decode(stripped, self.reader.encoding, self.reader.char_decode_errors)
+        fast = None
+        for old, new in self.dialect.text_escapes:
+            if "\0" in old:
+                # NumPy strings cannot match NUL; values holding one go per cell
+                fast = np.char.find(stripped, b"\0") == -1
+                continue
+            text = np.char.replace(text, old, new)
+        result: List[str] = np.char.add(np.char.add(self.dialect.text_prefix, text), "'").tolist()
+        return result, fast
+
+    def _render_numeric(self, column: Any, allow_int: bool) -> Tuple[List[str], Any]:
+        """Convert an N or F column; returns rendered values and the fast-path mask."""
+        count = len(column)
+        matrix = column.view(np.uint8).reshape(count, column.itemsize)
+        stripped = np.char.strip(column)
+
+        # Only plain "-123" / "-123.45" literals take the vectorized path
+        fast = np.isin(matrix, self._numeric_bytes).all(axis=1)
+        fast &= np.char.find(stripped, b" ") == -1
+        fast &= np.char.rfind(stripped, b"-") <= 0
+        fast &= np.char.count(stripped, b".") <= 1
+
+        if self.passthrough:
+            # Copy literals with at least one digit; "-" or "." alone go per cell
+            digits = ((matrix >= DIGIT_0) & (matrix <= DIGIT_9)).any(axis=1)
+            fast &= digits | (stripped == b"")
+            rendered = np.char.decode(stripped, "ascii", "replace").astype(object)
+            rendered[stripped == b""] = "NULL"
+            return rendered.tolist(), fast
+
+        blank = fast & (stripped == b"")
+        numeric = fast & ~blank
+        has_dot = np.char.find(stripped, b".") != -1
+        integer = numeric & ~has_dot if allow_int else np.zeros(count, dtype=bool)
+        integer &= np.char.str_len(stripped) <= MAX_INT64_DIGITS
+        fraction = numeric & ~integer
+        if allow_int:
+            fraction &= has_dot
+
+        if integer.all():
+            return list(map(str, stripped.astype(np.int64).tolist())), integer
+        if fraction.all():
+            values = stripped.astype(np.float64)
+            if np.isfinite(values).all():
+                return list(map(repr, values.tolist())), fraction
+
+        rendered = np.full(count, "NULL", dtype=object)
+        if integer.any():
+            rendered[integer] = list(map(str, stripped[integer].astype(np.int64).tolist()))
+        if fraction.any():
+            values = stripped[fraction].astype(np.float64)
+            text = np.array(list(map(repr, values.tolist())), dtype=object)
+            text[~np.isfinite(values)] = "NULL"
+            rendered[fraction] = text
+
+        fast = blank | integer | fraction
+        return rendered.tolist(), fast
+
+    def _render_date(self, column: Any) -> Tuple[List[str], Any]:
+        """Convert a D column of YYYYMMDD values; blanks and oddities go per cell."""
+        count = len(column)
+        matrix = column.view(np.uint8).reshape(count, column.itemsize)[:, :8]
+
+        fast = ((matrix >= DIGIT_0) & (matrix <= DIGIT_9)).all(axis=1)
+        fast &= (matrix[:, :4] != DIGIT_0).any(axis=1)
+
+        quoted = np.full((count, 12), ord("'"), dtype=np.uint8)
+        quoted[:, 1:5] = matrix[:, 0:4]
+        quoted[:, 5] = ord("-")
+        quoted[:, 6:8] = matrix[:, 4:6]
+        quoted[:, 8] = ord("-")
+        quoted[:, 9:11] = matrix[:, 6:8]
+        iso = quoted.view("S12").ravel()
+
+        # Raises ValueError for impossible dates such as 20230230
+        np.char.strip(iso[fast], b"'").astype("datetime64[D]")
+
+        return iso.astype("U12").tolist(), fast
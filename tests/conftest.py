@@ -0,0 +1,40 @@
+"""
+Shared fixtures: sample DBF files and a helper converting them.
+"""
+
+import itertools
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+
+from .dbfdata import write_sample
+
+
+@pytest.fixture
+def make_dbf(tmp_path: Path) -> Callable[..., str]:
+    """Return a function writing a sample DBF file, see tests.dbfdata.write_sample."""
+    counter = itertools.count()
+
+    def make(rows: int, deleted_every: int = 0, seed: int = 0, **options: Any) -> str:
+        path = tmp_path / f"data{next(counter)}.dbf"
+        return write_sample(path, rows, deleted_every=deleted_every, seed=seed, **options)
+
+    return make
+
+
+@pytest.fixture
+def convert(tmp_path: Path) -> Callable[..., bytes]:
+    """Return a function converting a DBF file with the given options and returning the SQL."""
+    counter = itertools.count()
+
+    def run(dbf_path: str, **options: Any) -> bytes:
+        options.setdefault("encoding", "cp1252")
+        converter = DBFToSQLConverter(**options)
+        sql_path = tmp_path / f"output{next(counter)}.sql"
+        assert converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+        return sql_path.read_bytes()
+
+    return run
@@ -0,0 +1,192 @@
+"""
+DBF files built field by field for the tests.
+"""
+
+import datetime
+import random
+import struct
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Raw field contents: text is encoded and padded to the field length, bytes are
+# written as they are, None leaves the field blank
+Value = Union[str, bytes, None]
+
+MEMO_BLOCK_SIZE = 512
+
+
+class Field(NamedTuple):
+    """Field descriptor of a test table."""
+
+    name: str
+    type: str
+    length: int
+    decimal: int = 0
+
+
+SAMPLE_FIELDS = [
+    Field("NAME", "C", 24),
+    Field("CODE", "C", 6),
+    Field("QTY", "N", 8),
+    Field("PRICE", "N", 12, 2),
+    Field("RATE", "F", 16, 4),
+    Field("BORN", "D", 8),
+    Field("ACTIVE", "L", 1),
+]
+
+NAMES = [
+    "Smith",
+    "O'Brien",
+    "Müller",
+    "Ærø Shipping",
+    "back\\slash",
+    "two\nlines",
+    "carriage\rreturn",
+    "",
+    "  padded",
+    'Zoë\'s "quoted" café',
+]
+
+
+def _field_bytes(field: Field, value: Value, encoding: str) -> bytes:
+    if value is None:
+        return b" " * field.length
+    data = value if isinstance(value, bytes) else value.encode(encoding)
+    if len(data) > field.length:
+        raise ValueError(f"Value too long for field {field.name}: {value!r}")
+    if field.type in "NF":
+        return data.rjust(field.length)
+    return data.ljust(field.length)
+
+
+def write_dbf(
+    path: Union[str, Path],
+    fields: Sequence[Field],
+    records: Sequence[Sequence[Value]],
+    flags: Optional[Sequence[bytes]] = None,
+    version: int = 0x03,
+    date: Tuple[int, int, int] = (124, 1, 1),
+    encoding: str = "cp1252",
+    header_count: Optional[int] = None,
+    end_marker: bool = True,
+) -> str:
+    """
+    Write a DBF file.
+
+    M fields take the memo text; it is stored in a dBase III .dbt file next
+    to the table, and the table version gets the memo bit.
+
+    Args:
+        path: Path of the DBF file
+        fields: Field descriptors
+        records: Field contents of each record
+        flags: Deletion flag byte of each record (default: all active, b" ")
+        version: Version byte; 0x30 writes a Visual FoxPro header
+        date: Year (offset from 1900), month and day of the header date
+        encoding: Encoding of text values
+        header_count: Record count stored in the header (default: len(records))
+        end_marker: Whether to end the records with the 0x1A marker
+
+    Returns:
+        Path of the DBF file as a string
+    """
+    path = Path(path)
+    memo_blocks: List[bytes] = []
+    if any(field.type == "M" for field in fields):
+        version |= 0x80
+        memo_path = path.with_suffix(".dbt")
+
+    body = bytearray()
+    for index, record in enumerate(records):
+        body += flags[index] if flags is not None else b" "
+        for field, value in zip(fields, record):
+            if field.type == "M" and isinstance(value, str):
+                block = 1 + sum(len(memo) // MEMO_BLOCK_SIZE for memo in memo_blocks)
+                memo = value.encode(encoding) + b"\x1a\x1a"
+                memo_blocks.append(memo.ljust(-(-len(memo) // MEMO_BLOCK_SIZE) * MEMO_BLOCK_SIZE))
+                value = str(block)
+            body += _field_bytes(field, value, encoding)
+
+    descriptors = bytearray()
+    for field in fields:
+        length, decimal = field.length, field.decimal
+        if field.type == "C" and length > 255:
+            # Character fields store the high byte of their length as decimal count
+            length, decimal = length & 0xFF, length >> 8
+        name = field.name.encode("ascii").ljust(11, b"\0")
+        descriptors += struct.pack(
+            "<11sc4xBB14x", name, field.type.encode("ascii"), length, decimal
+        )
+    descriptors += b"\r"
+    if version == 0x30:
+        # Visual FoxPro headers end with a 263-byte backlink area
+        descriptors += b"\0" * 263
+
+    header_length = 32 + len(descriptors)
+    record_length = 1 + sum(field.length for field in fields)
+    count = len(records) if header_count is None else header_count
+    header = struct.pack("<BBBBLHH20x", version, *date, count, header_length, record_length)
+
+    path.write_bytes(header + descriptors + body + (b"\x1a" if end_marker else b""))
+    if memo_blocks:
+        next_block = 1 + sum(len(memo) // MEMO_BLOCK_SIZE for memo in memo_blocks)
+        memo_header = struct.pack("<L", next_block).ljust(MEMO_BLOCK_SIZE, b"\0")
+        memo_path.write_bytes(memo_header + b"".join(memo_blocks))
+    return str(path)
+
+
+def sample_records(rows: int, seed: int = 0) -> List[List[Value]]:
+    """
+    Build deterministic contents for SAMPLE_FIELDS.
+
+    Values include quotes, backslashes, line breaks, non-ASCII text, blanks
+    (NULL), negative numbers and invalid logicals.
+
+    Args:
+        rows: Number of records
+        seed: Random seed
+
+    Returns:
+        Field contents of each record
+    """
+    rng = random.Random(seed)
+    records: List[List[Value]] = []
+    for index in range(rows):
+        born = datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randrange(25000))
+        records.append(
+            [
+                rng.choice(NAMES),
+                f"C{index % 1000:03d}" if index % 11 else None,
+                str(rng.randrange(-9999, 99999)) if index % 7 else None,
+                f"{rng.uniform(-1e6, 1e6):.2f}" if index % 5 else None,
+                f"{rng.uniform(-1e3, 1e3):.4f}" if index % 9 else None,
+                born.strftime("%Y%m%d") if index % 13 else None,
+                rng.choice("TFtfYN?"),
+            ]
+        )
+    return records
+
+
+def write_sample(
+    path: Union[str, Path], rows: int, deleted_every: int = 0, seed: int = 0, **options: object
+) -> str:
+    """
+    Write a table of SAMPLE_FIELDS with sample_records contents.
+
+    Args:
+        path: Path of the DBF file
+        rows: Number of records
+        deleted_every: Flag every n-th record as deleted (default: none)
+        seed: Random seed of the contents
+        **options: Further write_dbf arguments
+
+    Returns:
+        Path of the DBF file as a string
+    """
+    flags = [
+        b"*" if deleted_every and index % deleted_every == deleted_every - 1 else b" "
+        for index in range(rows)
+    ]
+    return write_dbf(
+        path, SAMPLE_FIELDS, sample_records(rows, seed), flags, **options  # type: ignore[arg-type]
+    )
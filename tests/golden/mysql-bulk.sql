@@ -0,0 +1,28 @@
+-- Generated from {dbf_path}
+-- Total records: 3
+-- Generated by DBF2SQL Converter
+
+-- Table: golden
+-- Generated by DBF2SQL Converter
+DROP TABLE IF EXISTS `golden`;
+CREATE TABLE `golden` (
+    `NAME` VARCHAR(20),
+    `QTY` DECIMAL(19,2),
+    `PRICE` DECIMAL(19,2),
+    `RATE` DECIMAL(19,2),
+    `BORN` DATE,
+    `OK` BOOLEAN
+);
+
+-- Create index on first column for better performance (optional)
+-- CREATE INDEX idx_golden_1 ON `golden` (`NAME`);
+
+-- Rows are in mysql-bulk.tsv; run from its directory with: mysql --local-infile=1
+LOAD DATA LOCAL INFILE 'mysql-bulk.tsv'
+    INTO TABLE `golden`
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY '\t' ESCAPED BY '\\'
+    LINES TERMINATED BY '\n'
+    (`NAME`, `QTY`, `PRICE`, `RATE`, `BORN`, `OK`);
+
+-- Conversion completed: 3 records processed
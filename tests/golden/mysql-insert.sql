@@ -0,0 +1,27 @@
+-- Generated from {dbf_path}
+-- Total records: 3
+-- Generated by DBF2SQL Converter
+
+-- Table: golden
+-- Generated by DBF2SQL Converter
+DROP TABLE IF EXISTS `golden`;
+CREATE TABLE `golden` (
+    `NAME` VARCHAR(20),
+    `QTY` DECIMAL(19,2),
+    `PRICE` DECIMAL(19,2),
+    `RATE` DECIMAL(19,2),
+    `BORN` DATE,
+    `OK` BOOLEAN
+);
+
+-- Create index on first column for better performance (optional)
+-- CREATE INDEX idx_golden_1 ON `golden` (`NAME`);
+
+INSERT INTO `golden` (`NAME`, `QTY`, `PRICE`, `RATE`, `BORN`, `OK`) VALUES
+    ('O''Brien', 12, 3.5, -1.25, '1999-12-31', TRUE),
+    ('back\\slash\ntwo', NULL, -0.1, NULL, NULL, NULL);
+
+INSERT INTO `golden` (`NAME`, `QTY`, `PRICE`, `RATE`, `BORN`, `OK`) VALUES
+    ('Zoë', -4, 1000.0, 2.0, '2024-02-29', FALSE);
+
+-- Conversion completed: 3 records processed
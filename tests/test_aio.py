@@ -0,0 +1,125 @@
+"""
+Tests of the asyncio API.
+"""
+
+import asyncio
+import gzip
+from pathlib import Path
+from typing import Any, AsyncGenerator, Callable, Iterator, List, cast
+
+import pytest
+
+from dbf2sql import AsyncDBFToSQLConverter, DBFToSQLConverter
+
+
+def test_iter_sql_matches_blocking_output(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes]
+) -> None:
+    dbf_path = make_dbf(1200, deleted_every=6)
+    aconverter = AsyncDBFToSQLConverter(batch_size=100, encoding="cp1252")
+
+    async def collect() -> str:
+        return "".join([chunk async for chunk in aconverter.iter_sql(dbf_path)])
+
+    assert asyncio.run(collect()).encode("utf-8") == convert(dbf_path, batch_size=100)
+
+
+def test_concurrent_files_match_blocking_output(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (700, 1500, 2300)]
+    missing = str(tmp_path / "missing.dbf")
+    aconverter = AsyncDBFToSQLConverter(batch_size=100, encoding="cp1252")
+
+    results = asyncio.run(
+        aconverter.convert_multiple_files(dbf_files + [missing], str(tmp_path / "out"), 3)
+    )
+
+    assert list(results) == dbf_files + [missing]
+    assert list(results.values()) == [True, True, True, False]
+    for dbf_file in dbf_files:
+        sql_path = tmp_path / "out" / f"{Path(dbf_file).stem}.sql"
+        assert sql_path.read_bytes() == convert(dbf_file, batch_size=100)
+
+
+def test_concurrent_files_keep_their_statistics(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (700, 1500, 2300)]
+    aconverter = AsyncDBFToSQLConverter(batch_size=100, encoding="cp1252")
+
+    results = asyncio.run(
+        aconverter.convert_multiple_files(dbf_files, str(tmp_path / "out"), concurrency=3)
+    )
+
+    assert all(results.values())
+    stats = aconverter.converter.file_stats
+    for dbf_file, rows in zip(dbf_files, (700, 1500, 2300)):
+        sql_path = tmp_path / "out" / f"{Path(dbf_file).stem}.sql"
+        assert stats[dbf_file].records == rows
+        assert stats[dbf_file].output == str(sql_path)
+        assert stats[dbf_file].output_bytes == sql_path.stat().st_size
+    assert aconverter.converter.total_stats().records == 4500
+
+
+def test_compressed_output(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_path = make_dbf(500)
+    aconverter = AsyncDBFToSQLConverter(encoding="cp1252", compress="gzip")
+
+    assert asyncio.run(aconverter.convert_dbf_to_sql(dbf_path, output_dir=str(tmp_path / "out")))
+    sql = gzip.decompress((tmp_path / "out" / "data0.sql.gz").read_bytes())
+    assert sql == convert(dbf_path)
+
+
+def test_slow_consumer_holds_back_rendering(
+    make_dbf: Callable[..., str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    converter = DBFToSQLConverter(batch_size=10, encoding="cp1252")
+    rendered: List[str] = []
+    closed: List[bool] = []
+    iter_sql = converter.iter_sql
+
+    def counting_iter_sql(*args: Any) -> Iterator[str]:
+        try:
+            for chunk in iter_sql(*args):
+                rendered.append(chunk)
+                yield chunk
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(converter, "iter_sql", counting_iter_sql)
+    aconverter = AsyncDBFToSQLConverter(converter)
+    dbf_path = make_dbf(1000)
+
+    async def consume_one() -> None:
+        chunks = cast(AsyncGenerator[str, None], aconverter.iter_sql(dbf_path))
+        await chunks.__anext__()
+        await asyncio.sleep(0.2)
+        # The first chunk and at most one rendered ahead
+        assert len(rendered) <= 2
+        await chunks.aclose()
+
+    asyncio.run(consume_one())
+    assert closed == [True]
+
+
+def test_cancel_stops_conversion(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(20000)
+    aconverter = AsyncDBFToSQLConverter(batch_size=10, encoding="cp1252")
+    sql_path = tmp_path / "out.sql"
+
+    async def cancel() -> bool:
+        task = asyncio.ensure_future(aconverter.convert_dbf_to_sql(dbf_path, str(sql_path)))
+        while not sql_path.exists():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    assert asyncio.run(cancel())
+    assert b"-- Conversion completed" not in sql_path.read_bytes()
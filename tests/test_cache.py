@@ -0,0 +1,126 @@
+"""
+Tests of the conversion cache (incremental reconversion of folders).
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.cache import CACHE_FILE, ConversionCache, source_state
+
+from .dbfdata import write_sample
+
+
+def run(
+    dbf_files: List[str], caplog: pytest.LogCaptureFixture, output_dir: Any = None, **options: Any
+) -> List[str]:
+    """Convert the files and return those that were skipped as up to date."""
+    options.setdefault("encoding", "cp1252")
+    caplog.clear()
+    converter = DBFToSQLConverter(**options)
+    with caplog.at_level(logging.INFO, logger="dbf2sql"):
+        results = converter.convert_multiple_files(dbf_files, output_dir=output_dir)
+    assert all(results.values())
+    return [
+        dbf_file
+        for dbf_file in dbf_files
+        if any(message.startswith(f"Skipping {dbf_file}:") for message in caplog.messages)
+    ]
+
+
+def test_source_state_reads_header(make_dbf: Callable[..., str]) -> None:
+    state = source_state(make_dbf(250, deleted_every=5))
+    # tests.dbfdata writes the header date 2024-01-01 (year byte 124)
+    assert state["header_date"] == "2024-01-01"
+    assert state["record_count"] == 250
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_unchanged_files_are_skipped(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture, workers: int
+) -> None:
+    dbf_files = [make_dbf(300), make_dbf(200, seed=1)]
+    output_dir = str(tmp_path / "out")
+
+    assert run(dbf_files, caplog, output_dir, workers=workers) == []
+    cache = json.loads((tmp_path / "out" / CACHE_FILE).read_text(encoding="utf-8"))
+    assert sorted(cache["files"]) == sorted(os.path.abspath(path) for path in dbf_files)
+
+    assert run(dbf_files, caplog, output_dir, workers=workers) == dbf_files
+    assert run(dbf_files, caplog, output_dir, workers=workers, force=True) == []
+    # Other settings produce other output
+    assert run(dbf_files, caplog, output_dir, workers=workers, batch_size=50) == []
+
+
+def test_changes_are_detected(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    first, second, third = make_dbf(300), make_dbf(300, seed=1), make_dbf(300, seed=2)
+    output_dir = str(tmp_path / "out")
+    run([first, second, third], caplog, output_dir)
+
+    # Same contents under a new modification time: the fingerprint decides
+    stat = os.stat(first)
+    os.utime(first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # Rewritten with other records of the same size
+    stat = os.stat(second)
+    write_sample(second, 300, seed=3)
+    os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    # Output removed
+    (tmp_path / "out" / "data2.sql").unlink()
+
+    assert run([first, second, third], caplog, output_dir) == [first]
+    assert run([first, second, third], caplog, output_dir) == [first, second, third]
+
+
+def test_no_cache_next_to_dbf_files(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    dbf_path = make_dbf(100)
+
+    assert run([dbf_path], caplog) == []
+    assert run([dbf_path], caplog) == []
+    assert (tmp_path / "data0.sql").exists()
+    assert not (tmp_path / CACHE_FILE).exists()
+
+
+def test_explicit_cache_file(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    dbf_path = make_dbf(100)
+    cache_file = str(tmp_path / "state" / "cache.json")
+
+    assert run([dbf_path], caplog, cache_file=cache_file) == []
+    assert run([dbf_path], caplog, cache_file=cache_file) == [dbf_path]
+    assert not (tmp_path / CACHE_FILE).exists()
+
+    output_dir = str(tmp_path / "out")
+    assert run([dbf_path], caplog, output_dir, cache_file=cache_file) == []
+    assert run([dbf_path], caplog, output_dir, cache_file=cache_file) == [dbf_path]
+    assert not (tmp_path / "out" / CACHE_FILE).exists()
+
+
+def test_unwritable_cache_does_not_fail_conversion(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    dbf_path = make_dbf(100)
+    # A directory where the cache file should be cannot be replaced by a file
+    cache_file = tmp_path / "cache.json"
+    cache_file.mkdir()
+
+    assert run([dbf_path], caplog, str(tmp_path / "out"), cache_file=str(cache_file)) == []
+    assert any("Could not write conversion cache" in message for message in caplog.messages)
+    assert (tmp_path / "out" / "data0.sql").exists()
+    assert os.listdir(tmp_path / "cache.json") == []
+    assert not (tmp_path / "cache.json.tmp").exists()
+
+
+def test_unreadable_cache_is_empty(tmp_path: Path) -> None:
+    path = tmp_path / CACHE_FILE
+    path.write_text("not json", encoding="utf-8")
+    assert ConversionCache(str(path)).entries == {}
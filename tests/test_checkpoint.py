@@ -0,0 +1,157 @@
+"""
+Tests of checkpoints and resuming interrupted conversions.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+import dbf2sql.converter
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.checkpoint import CHECKPOINT_SUFFIX, Checkpoint
+from dbf2sql.compression import DEFAULT_BLOCK_SIZE
+from dbf2sql.memory import BudgetPlan
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(monkeypatch: pytest.MonkeyPatch, saves: int) -> None:
+    """Make the conversion fail right after the given number of checkpoints."""
+    save = Checkpoint.save
+    count = 0
+
+    def failing_save(self: Checkpoint, *args: Any) -> None:
+        nonlocal count
+        save(self, *args)
+        count += 1
+        if count == saves:
+            raise Interrupted("interrupted")
+
+    monkeypatch.setattr(Checkpoint, "save", failing_save)
+
+
+def run(dbf_path: str, sql_path: Path, **options: Any) -> bool:
+    options.setdefault("encoding", "cp1252")
+    options.setdefault("batch_size", 100)
+    sql_path.parent.mkdir(exist_ok=True)
+    converter = DBFToSQLConverter(**options)
+    return converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+
+
+CASES: Dict[str, Dict[str, Any]] = {
+    "insert": {},
+    "postgresql-bulk": {"dialect": "postgresql", "output_format": "bulk"},
+    "mysql-bulk": {"dialect": "mysql", "output_format": "bulk"},
+    "where": {"where": "QTY > 0"},
+}
+
+
+@pytest.mark.parametrize("options", list(CASES.values()), ids=list(CASES))
+def test_checkpoints_keep_output(
+    make_dbf: Callable[..., str], tmp_path: Path, options: Dict[str, Any]
+) -> None:
+    dbf_path = make_dbf(3000, deleted_every=10)
+    # The LOAD DATA statement names the data file, so both outputs share a name
+    assert run(dbf_path, tmp_path / "plain" / "out.sql", **options)
+    assert run(dbf_path, tmp_path / "out.sql", checkpoint_interval=750, **options)
+
+    assert (tmp_path / "out.sql").read_bytes() == (tmp_path / "plain" / "out.sql").read_bytes()
+    assert not (tmp_path / ("out.sql" + CHECKPOINT_SUFFIX)).exists()
+    if options.get("dialect") == "mysql":
+        assert (tmp_path / "out.tsv").read_bytes() == (tmp_path / "plain" / "out.tsv").read_bytes()
+
+
+@pytest.mark.parametrize("options", list(CASES.values()), ids=list(CASES))
+def test_resume_after_interruption(
+    make_dbf: Callable[..., str],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    options: Dict[str, Any],
+) -> None:
+    dbf_path = make_dbf(3000, deleted_every=10)
+    assert run(dbf_path, tmp_path / "plain" / "out.sql", **options)
+
+    sql_path = tmp_path / "out.sql"
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 2)
+        assert not run(dbf_path, sql_path, checkpoint_interval=500, **options)
+
+    checkpoint = json.loads(Path(str(sql_path) + CHECKPOINT_SUFFIX).read_text(encoding="utf-8"))
+    assert 0 < checkpoint["next_record"] < 3000
+    if "where" not in options:
+        assert checkpoint["records"] == 1000
+    # Output written after the last checkpoint is discarded on resume
+    with open(sql_path, "a", encoding="utf-8") as sql_file:
+        sql_file.write("INSERT INTO half_written")
+
+    assert run(dbf_path, sql_path, resume=True, checkpoint_interval=500, **options)
+    assert sql_path.read_bytes() == (tmp_path / "plain" / "out.sql").read_bytes()
+    assert not Path(str(sql_path) + CHECKPOINT_SUFFIX).exists()
+    if options.get("dialect") == "mysql":
+        assert (tmp_path / "out.tsv").read_bytes() == (tmp_path / "plain" / "out.tsv").read_bytes()
+
+
+def test_resume_compressed_output(
+    make_dbf: Callable[..., str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dbf_path = make_dbf(3000, deleted_every=10)
+    assert run(dbf_path, tmp_path / "plain.sql")
+
+    sql_path = tmp_path / "out.sql.gz"
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 3)
+        assert not run(dbf_path, sql_path, checkpoint_interval=500)
+
+    assert run(dbf_path, sql_path, resume=True, checkpoint_interval=500)
+    assert gzip.decompress(sql_path.read_bytes()) == (tmp_path / "plain.sql").read_bytes()
+
+
+def test_resume_starts_over_when_settings_changed(
+    make_dbf: Callable[..., str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dbf_path = make_dbf(2000)
+    sql_path = tmp_path / "out.sql"
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 1)
+        assert not run(dbf_path, sql_path, checkpoint_interval=500)
+
+    assert run(dbf_path, sql_path, resume=True, max_statement_bytes=1 << 20)
+    assert run(dbf_path, tmp_path / "plain.sql", max_statement_bytes=1 << 20)
+    assert sql_path.read_bytes() == (tmp_path / "plain.sql").read_bytes()
+
+
+def test_resume_without_checkpoint(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(500)
+    assert run(dbf_path, tmp_path / "plain.sql")
+    assert run(dbf_path, tmp_path / "out.sql", resume=True)
+    assert (tmp_path / "out.sql").read_bytes() == (tmp_path / "plain.sql").read_bytes()
+
+
+def test_resume_keeps_batch_size_planned_for_memory_budget(
+    make_dbf: Callable[..., str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The plan depends on the memory in use, so a fresh process may plan differently
+    plans = [200, 300]
+
+    def plan_budget(*args: Any, **kwargs: Any) -> BudgetPlan:
+        return BudgetPlan(plans.pop(0), DEFAULT_BLOCK_SIZE, 1 << 30)
+
+    monkeypatch.setattr(dbf2sql.converter, "plan_budget", plan_budget)
+    dbf_path = make_dbf(3000)
+    sql_path = tmp_path / "out.sql"
+    options = {"batch_size": 1000, "checkpoint_interval": 600, "max_memory": 1 << 30}
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, 2)
+        assert not run(dbf_path, sql_path, **options)
+
+    checkpoint = json.loads(Path(str(sql_path) + CHECKPOINT_SUFFIX).read_text(encoding="utf-8"))
+    assert checkpoint["batch_size"] == 200
+    assert run(dbf_path, sql_path, resume=True, **options)
+    assert not plans
+    assert run(dbf_path, tmp_path / "plain.sql", batch_size=200)
+    assert sql_path.read_bytes() == (tmp_path / "plain.sql").read_bytes()
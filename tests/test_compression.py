@@ -0,0 +1,83 @@
+"""
+Tests of compressed output (--compress and .gz/.xz/.bz2 output paths).
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.compression import EXTENSIONS, CompressedWriter, codec_for_path
+
+DECOMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.decompress,
+    "xz": lzma.decompress,
+    "bz2": bz2.decompress,
+}
+
+MAGIC = {"gzip": b"\x1f\x8b", "xz": b"\xfd7zXZ\x00", "bz2": b"BZh"}
+
+
+def test_codec_for_path() -> None:
+    assert codec_for_path("table.sql.gz") == "gzip"
+    assert codec_for_path("TABLE.SQL.XZ") == "xz"
+    assert codec_for_path("out/table.sql.bz2") == "bz2"
+    assert codec_for_path("table.sql") is None
+
+
+@pytest.mark.parametrize("codec", sorted(DECOMPRESSORS))
+def test_writer_multi_member_round_trip(tmp_path: Path, codec: str) -> None:
+    path = tmp_path / "out.bin"
+    text = "".join(f"INSERT INTO t VALUES ({index}, 'Zoë');\n" for index in range(2000))
+    with CompressedWriter(str(path), codec, block_size=1000, threads=3) as writer:
+        for start in range(0, len(text), 777):
+            writer.write(text[start : start + 777])
+
+    data = path.read_bytes()
+    # Every block is a separate member/stream, each starting with the magic bytes
+    assert data.count(MAGIC[codec]) > 10
+    assert DECOMPRESSORS[codec](data) == text.encode("utf-8")
+
+
+def test_writer_rejects_unknown_codec(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown codec"):
+        CompressedWriter(str(tmp_path / "out.zst"), "zstd")
+
+
+@pytest.mark.parametrize("codec", sorted(DECOMPRESSORS))
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_compressed_output_matches_plain(
+    make_dbf: Callable[..., str],
+    convert: Callable[..., bytes],
+    tmp_path: Path,
+    codec: str,
+    jobs: int,
+) -> None:
+    dbf_path = make_dbf(2500, deleted_every=4)
+    expected = convert(dbf_path, batch_size=100)
+
+    output_dir = tmp_path / codec
+    converter = DBFToSQLConverter(encoding="cp1252", batch_size=100, jobs=jobs, compress=codec)
+    assert converter.convert_dbf_to_sql(dbf_path, output_dir=str(output_dir))
+
+    sql_path = output_dir / ("data0.sql" + EXTENSIONS[codec])
+    assert DECOMPRESSORS[codec](sql_path.read_bytes()) == expected
+
+
+def test_codec_inferred_from_output_path(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_path = make_dbf(300)
+    sql_path = tmp_path / "table.sql.xz"
+    converter = DBFToSQLConverter(encoding="cp1252")
+    assert converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+    assert lzma.decompress(sql_path.read_bytes()) == convert(dbf_path)
+
+
+def test_rejects_unknown_compression() -> None:
+    with pytest.raises(ValueError, match="Unknown compression"):
+        DBFToSQLConverter(compress="zip")
@@ -0,0 +1,82 @@
+"""
+Tests for the default SQL output of the converter.
+"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+
+from .dbfdata import Field, Value, write_dbf
+
+FIELDS = [
+    Field("NAME", "C", 20),
+    Field("QTY", "N", 6),
+    Field("PRICE", "N", 10, 2),
+    Field("RATE", "F", 12, 3),
+    Field("BORN", "D", 8),
+    Field("OK", "L", 1),
+]
+
+RECORDS: List[List[Value]] = [
+    ["O'Brien", "12", "3.50", "-1.250", "19991231", "T"],
+    ["deleted", "1", "1.00", "1.000", "20000101", "T"],
+    ["back\\slash\ntwo", None, "-0.10", None, None, "?"],
+    ["Zoë", "-4", "1000.00", "2.000", "20240229", "f"],
+]
+
+EXPECTED = """\
+-- Generated from {path}
+-- Total records: 3
+-- Generated by DBF2SQL Converter
+
+-- Table: golden
+-- Generated by DBF2SQL Converter
+DROP TABLE IF EXISTS `golden`;
+CREATE TABLE `golden` (
+    `NAME` VARCHAR(20),
+    `QTY` DECIMAL(19,2),
+    `PRICE` DECIMAL(19,2),
+    `RATE` DECIMAL(19,2),
+    `BORN` DATE,
+    `OK` BOOLEAN
+);
+
+-- Create index on first column for better performance (optional)
+-- CREATE INDEX idx_golden_1 ON `golden` (`NAME`);
+
+INSERT INTO `golden` (`NAME`, `QTY`, `PRICE`, `RATE`, `BORN`, `OK`) VALUES
+    ('O''Brien', 12, 3.5, -1.25, '1999-12-31', TRUE),
+    ('back\\slash\\ntwo', NULL, -0.1, NULL, NULL, NULL);
+
+INSERT INTO `golden` (`NAME`, `QTY`, `PRICE`, `RATE`, `BORN`, `OK`) VALUES
+    ('Zoë', -4, 1000.0, 2.0, '2024-02-29', FALSE);
+
+-- Conversion completed: 3 records processed
+"""
+
+
+@pytest.fixture
+def golden_dbf(tmp_path: Path) -> str:
+    return write_dbf(tmp_path / "golden.dbf", FIELDS, RECORDS, [b" ", b"*", b" ", b" "])
+
+
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+def test_golden_output(golden_dbf: str, convert: Callable[..., bytes], reader: str) -> None:
+    sql = convert(golden_dbf, batch_size=2, reader=reader)
+    assert sql.decode("utf-8") == EXPECTED.format(path=golden_dbf)
+
+
+def test_process_records_batch_takes_positional_rows() -> None:
+    converter = DBFToSQLConverter()
+    encoders = converter._build_value_encoders(["N", "C", "L"])
+    rows = iter([(1, "O'Brien", True), (None, "", None)])
+    sql = converter._process_records_batch(rows, "people", ["ID", "NAME", "OK"], encoders)
+    assert sql == (
+        "INSERT INTO `people` (`ID`, `NAME`, `OK`) VALUES\n"
+        "    (1, 'O''Brien', TRUE),\n"
+        "    (NULL, '', NULL);\n"
+    )
+    assert converter._process_records_batch([], "people", ["ID"]) == ""
@@ -0,0 +1,123 @@
+"""
+Tests of PostgreSQL COPY text output (--format copy).
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from dbfread import DBF
+
+from .dbfdata import Field, write_dbf
+from .test_converter import FIELDS, RECORDS
+
+EXPECTED = """\
+-- Generated from {path}
+-- Total records: 3
+-- Generated by DBF2SQL Converter
+
+-- Table: golden
+-- Generated by DBF2SQL Converter
+DROP TABLE IF EXISTS "golden";
+CREATE TABLE "golden" (
+    "NAME" VARCHAR(20),
+    "QTY" DECIMAL(19,2),
+    "PRICE" DECIMAL(19,2),
+    "RATE" DECIMAL(19,2),
+    "BORN" DATE,
+    "OK" BOOLEAN
+);
+
+-- Create index on first column for better performance (optional)
+-- CREATE INDEX idx_golden_1 ON "golden" ("NAME");
+
+COPY "golden" ("NAME", "QTY", "PRICE", "RATE", "BORN", "OK") FROM stdin;
+O'Brien\t12\t3.5\t-1.25\t1999-12-31\tt
+back\\\\slash\\ntwo\t\\N\t-0.1\t\\N\t\\N\t\\N
+Zoë\t-4\t1000.0\t2.0\t2024-02-29\tf
+\\.
+
+-- Conversion completed: 3 records processed
+"""
+
+COPY_ESCAPE = re.compile(r"\\(.)")
+UNESCAPE = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def copy_rows(sql: bytes) -> List[List[Optional[str]]]:
+    """Data lines of the COPY blocks, split into unescaped fields (None for NULL)."""
+    lines = sql.decode("utf-8").split("\n")
+    rows: List[List[Optional[str]]] = []
+    inside = False
+    for line in lines:
+        if line.startswith("COPY "):
+            inside = True
+        elif line == "\\.":
+            inside = False
+        elif inside:
+            rows.append(
+                [
+                    None if cell == "\\N" else COPY_ESCAPE.sub(lambda m: UNESCAPE[m.group(1)], cell)
+                    for cell in line.split("\t")
+                ]
+            )
+    return rows
+
+
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+def test_golden_output(tmp_path: Path, convert: Callable[..., bytes], reader: str) -> None:
+    dbf_path = write_dbf(tmp_path / "golden.dbf", FIELDS, RECORDS, [b" ", b"*", b" ", b" "])
+    sql = convert(dbf_path, batch_size=2, reader=reader, output_format="copy")
+    assert sql.decode("utf-8") == EXPECTED.format(path=dbf_path)
+
+
+def test_character_values_round_trip(tmp_path: Path, convert: Callable[..., bytes]) -> None:
+    texts = ["tab\there", "back\\slash", "line\nbreak\r", "\\N", "\\.", "'quoted'", "", "Zoë"]
+    dbf_path = write_dbf(tmp_path / "text.dbf", [Field("TEXT", "C", 20)], [[t] for t in texts])
+    rows = copy_rows(convert(dbf_path, output_format="copy"))
+    assert rows == [[text] for text in texts]
+    assert rows == [[record["TEXT"]] for record in DBF(dbf_path, encoding="cp1252")]
+
+
+def test_null_and_empty_string_differ(tmp_path: Path, convert: Callable[..., bytes]) -> None:
+    fields = [Field("TEXT", "C", 4), Field("QTY", "N", 4)]
+    dbf_path = write_dbf(tmp_path / "nulls.dbf", fields, [[None, None], ["", "1"]])
+    sql = convert(dbf_path, output_format="copy")
+    assert b"FROM stdin;\n\t\\N\n\t1\n\\.\n" in sql
+
+
+def test_empty_table(make_dbf: Callable[..., str], convert: Callable[..., bytes]) -> None:
+    sql = convert(make_dbf(0), output_format="copy")
+    assert sql.endswith(b" FROM stdin;\n\\.\n\n-- Conversion completed: 0 records processed\n")
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"reader": "dbfread"},
+        {"jobs": 3},
+        {"pipeline_workers": 2},
+        {"engine": "numpy"},
+        {"max_statement_bytes": 4096},
+        {"where": "QTY > 0", "jobs": 2},
+    ],
+    ids=lambda options: ",".join(options),
+)
+def test_copy_paths_agree(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    dbf_path = make_dbf(2000, deleted_every=6)
+    baseline = {"where": options["where"]} if "where" in options else {}
+    expected = convert(dbf_path, batch_size=100, output_format="copy", **baseline)
+    assert convert(dbf_path, batch_size=100, output_format="copy", **options) == expected
+
+
+def test_passthrough_paths_agree(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes]
+) -> None:
+    dbf_path = make_dbf(2000, deleted_every=6)
+    expected = convert(dbf_path, batch_size=100, output_format="copy", passthrough=True)
+    sql = convert(dbf_path, batch_size=100, output_format="copy", passthrough=True, jobs=2)
+    assert sql == expected
+    assert len(copy_rows(sql)) == 2000 - 2000 // 6
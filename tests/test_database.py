@@ -0,0 +1,98 @@
+"""
+Tests of loading DBF files into a database through DB-API connections.
+"""
+
+import functools
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+
+NO_MATCH = "CODE = 'no such value'"
+
+
+class CountingConnection(sqlite3.Connection):
+    """sqlite3 connection counting its commits."""
+
+    commits = 0
+
+    def commit(self) -> None:
+        CountingConnection.commits += 1
+        super().commit()
+
+
+def load(
+    dbf_path: str, database: Path, connections: int = 1, **options: Any
+) -> List[Tuple[Any, ...]]:
+    """Load a file and return its rows in a stable order."""
+    commit_interval = options.pop("commit_interval", 0)
+    converter = DBFToSQLConverter(batch_size=100, encoding="cp1252", **options)
+    connect = functools.partial(
+        sqlite3.connect, str(database), timeout=30, factory=CountingConnection
+    )
+    assert converter.convert_dbf_to_database(
+        dbf_path,
+        connect,
+        table_name="data",
+        commit_interval=commit_interval,
+        connections=connections,
+    )
+    with sqlite3.connect(str(database)) as connection:
+        return sorted(connection.execute("SELECT * FROM data"), key=repr)
+
+
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+def test_rows_match_the_sql_output(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path, reader: str
+) -> None:
+    dbf_path = make_dbf(1000, deleted_every=6)
+    loaded = load(dbf_path, tmp_path / "loaded.db", reader=reader)
+    assert len(loaded) == 1000 - 1000 // 6
+
+    sql = convert(dbf_path, dialect="sqlite").decode("utf-8")
+    with sqlite3.connect(":memory:") as connection:
+        connection.executescript(sql)
+        executed = sorted(connection.execute("SELECT * FROM data0"), key=repr)
+    assert loaded == executed
+
+
+@pytest.mark.parametrize(
+    "rows, deleted_every, where",
+    [(2500, 5, None), (0, 0, None), (300, 1, None), (2500, 0, NO_MATCH)],
+    ids=["plain", "empty", "all-deleted", "filtered-to-nothing"],
+)
+def test_parallel_connections_load_the_same_rows(
+    make_dbf: Callable[..., str],
+    tmp_path: Path,
+    rows: int,
+    deleted_every: int,
+    where: Optional[str],
+) -> None:
+    dbf_path = make_dbf(rows, deleted_every=deleted_every)
+    expected = load(dbf_path, tmp_path / "single.db", 1, where=where)
+    assert load(dbf_path, tmp_path / "parallel.db", 3, where=where) == expected
+
+
+@pytest.mark.parametrize("commit_interval, commits", [(0, 1), (250, 4), (1000, 1)])
+def test_commit_interval(
+    make_dbf: Callable[..., str], tmp_path: Path, commit_interval: int, commits: int
+) -> None:
+    CountingConnection.commits = 0
+    load(make_dbf(900), tmp_path / "data.db", commit_interval=commit_interval)
+    # One more commit for the table creation
+    assert CountingConnection.commits == commits + 1
+
+
+def test_reload_replaces_the_table(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(200)
+    first = load(dbf_path, tmp_path / "data.db")
+    assert load(dbf_path, tmp_path / "data.db") == first
+
+
+def test_missing_file(tmp_path: Path) -> None:
+    converter = DBFToSQLConverter()
+    connect = functools.partial(sqlite3.connect, str(tmp_path / "data.db"))
+    assert not converter.convert_dbf_to_database(str(tmp_path / "missing.dbf"), connect)
@@ -0,0 +1,126 @@
+"""
+Tests of the synthetic DBF generator used by the benchmarks.
+"""
+
+import datetime
+import struct
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from dbfread import DBF
+
+from benchmarks.dbfgen import (
+    DEFAULT_FIELDS,
+    MEMO_BLOCK_SIZE,
+    FieldSpec,
+    generate,
+    parse_fields,
+    write_dbf,
+)
+from dbf2sql.reader import DBFReader
+
+
+def test_parse_fields() -> None:
+    assert parse_fields("C:30, n:12.2,D,L,C:300") == [
+        FieldSpec("C01", "C", 30, 0),
+        FieldSpec("N02", "N", 12, 2),
+        FieldSpec("D03", "D", 8, 0),
+        FieldSpec("L04", "L", 1, 0),
+        FieldSpec("C05", "C", 300, 0),
+    ]
+    # Widths only apply to C, N and F fields
+    assert parse_fields("I:9,Y") == [FieldSpec("I01", "I", 4, 0), FieldSpec("Y02", "Y", 8, 4)]
+
+
+@pytest.mark.parametrize(
+    "spec, message",
+    [
+        ("C,X:3", "Unknown field type: 'X'"),
+        ("C:0", "Invalid length for field type C: 0"),
+        ("N:256", "Invalid length for field type N: 256"),
+        ("C:65536", "Invalid length for field type C: 65536"),
+        ("N:5.4", "Too many decimals for a N field of length 5"),
+    ],
+)
+def test_parse_fields_errors(spec: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_fields(spec)
+
+
+def test_same_arguments_give_same_bytes(tmp_path: Path) -> None:
+    first = generate(str(tmp_path / "a"), 2000, fields=DEFAULT_FIELDS + ",M", deleted=0.1)
+    second = generate(str(tmp_path / "b"), 2000, fields=DEFAULT_FIELDS + ",M", deleted=0.1)
+    other = generate(str(tmp_path / "c"), 2000, fields=DEFAULT_FIELDS + ",M", seed=1)
+
+    assert Path(first).name == "bench_2000.dbf"
+    assert Path(first).read_bytes() == Path(second).read_bytes()
+    assert Path(first).with_suffix(".fpt").read_bytes() == (
+        Path(second).with_suffix(".fpt").read_bytes()
+    )
+    assert Path(first).read_bytes() != Path(other).read_bytes()
+
+
+def test_dbase3_header(tmp_path: Path) -> None:
+    fields = parse_fields("C:300,N:10,N:12.2,F:16.4,D,L")
+    path = write_dbf(str(tmp_path / "plain.dbf"), 500, fields, codepage="cp850", deleted=0.2)
+
+    data = Path(path).read_bytes()
+    version, year, month, day, count, header_length, record_length = struct.unpack(
+        "<BBBBLHH", data[:12]
+    )
+    assert (version, year, month, day, count) == (0x03, 124, 1, 1, 500)
+    assert header_length == 32 + 32 * len(fields) + 1
+    assert record_length == 1 + 300 + 10 + 12 + 16 + 8 + 1
+    assert data[29] == 0x02  # language driver of cp850
+    assert data[header_length - 1 : header_length] == b"\r"
+    assert len(data) == header_length + 500 * record_length + 1 and data[-1:] == b"\x1a"
+    assert not (tmp_path / "plain.fpt").exists()
+
+    with DBFReader(path, encoding="cp850") as reader:
+        assert [(field.name, field.type, field.length) for field in reader.fields][:2] == [
+            ("C01", "C", 300),
+            ("N02", "N", 10),
+        ]
+        assert reader.date == datetime.date(2024, 1, 1)
+        assert 50 < len(reader) < 450
+        native = list(reader.iter_rows())
+    assert native == [tuple(record.values()) for record in DBF(path, encoding="cp850")]
+
+
+def test_visual_foxpro_header_and_memo_file(tmp_path: Path) -> None:
+    fields = parse_fields("C:10,I,T,Y,M")
+    path = write_dbf(str(tmp_path / "vfp.dbf"), 300, fields, seed=3)
+
+    data = Path(path).read_bytes()
+    version, _, _, _, _, header_length, record_length = struct.unpack("<BBBBLHH", data[:12])
+    assert version == 0x30
+    # The field terminator is followed by the 263-byte backlink area
+    assert header_length == 32 + 32 * len(fields) + 1 + 263
+    assert data[header_length - 264 : header_length] == b"\r" + bytes(263)
+    assert record_length == 1 + 10 + 4 + 8 + 8 + 4
+
+    memo = Path(path).with_suffix(".fpt").read_bytes()
+    next_block, block_size = struct.unpack(">L2xH", memo[:8])
+    assert block_size == MEMO_BLOCK_SIZE
+    assert len(memo) == next_block * MEMO_BLOCK_SIZE
+    assert memo[8:512] == bytes(504)
+
+    memo_offset = record_length - 4
+    pointers = {
+        struct.unpack("<L", data[offset : offset + 4])[0]
+        for offset in range(
+            header_length + memo_offset, header_length + 300 * record_length, record_length
+        )
+    }
+    assert 0 in pointers
+    for block in pointers - {0}:
+        assert 512 // MEMO_BLOCK_SIZE <= block < next_block
+        block_type, length = struct.unpack(">LL", memo[block * block_size : block * block_size + 8])
+        assert block_type == 1
+        assert block * block_size + 8 + length <= len(memo)
+
+    records = list(DBF(path, encoding="cp1252"))
+    assert len(records) == 300
+    assert any(isinstance(record["M05"], str) and record["M05"] for record in records)
+    assert all(isinstance(record["Y04"], Decimal) for record in records)
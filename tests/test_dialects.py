@@ -0,0 +1,151 @@
+"""
+Tests of the SQL dialects and their bulk-load output (--dialect, --format bulk).
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+
+from .dbfdata import write_dbf
+from .test_converter import FIELDS, RECORDS
+
+GOLDEN = Path(__file__).parent / "golden"
+
+DIALECTS = ["mysql", "postgresql", "sqlite", "sqlserver"]
+
+
+def run(dbf_path: str, sql_path: Path, **options: Any) -> str:
+    options.setdefault("encoding", "cp1252")
+    sql_path.parent.mkdir(exist_ok=True)
+    converter = DBFToSQLConverter(**options)
+    assert converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+    return sql_path.read_text(encoding="utf-8")
+
+
+def insert_row_counts(sql: str) -> List[int]:
+    """Number of tuples in each INSERT statement (the sample values hold no "),")."""
+    statements = sql.split("INSERT INTO ")[1:]
+    return [statement.split(";\n")[0].count("),\n    (") + 1 for statement in statements]
+
+
+@pytest.fixture
+def golden_dbf(tmp_path: Path) -> str:
+    return write_dbf(tmp_path / "golden.dbf", FIELDS, RECORDS, [b" ", b"*", b" ", b" "])
+
+
+@pytest.mark.parametrize("output_format", ["insert", "bulk"])
+@pytest.mark.parametrize("dialect", DIALECTS)
+def test_golden_output(golden_dbf: str, tmp_path: Path, dialect: str, output_format: str) -> None:
+    name = f"{dialect}-{output_format}"
+    sql = run(
+        golden_dbf,
+        tmp_path / f"{name}.sql",
+        batch_size=2,
+        dialect=dialect,
+        output_format=output_format,
+    )
+    expected = (GOLDEN / f"{name}.sql").read_text(encoding="utf-8")
+    assert sql == expected.replace("{dbf_path}", golden_dbf)
+
+
+def test_mysql_load_data_file(golden_dbf: str, tmp_path: Path) -> None:
+    sql = run(golden_dbf, tmp_path / "mysql-bulk.sql", dialect="mysql", output_format="bulk")
+    assert "LOAD DATA LOCAL INFILE 'mysql-bulk.tsv'" in sql
+    assert "INSERT INTO" not in sql
+    tsv = (tmp_path / "mysql-bulk.tsv").read_bytes()
+    assert tsv == (GOLDEN / "mysql-bulk.tsv").read_bytes()
+
+
+@pytest.mark.parametrize("output_format", ["insert", "bulk"])
+def test_sqlite_output_loads(
+    make_dbf: Callable[..., str], tmp_path: Path, output_format: str
+) -> None:
+    dbf_path = make_dbf(500, deleted_every=7)
+    sql = run(
+        dbf_path, tmp_path / "out.sql", batch_size=64, dialect="sqlite", output_format=output_format
+    )
+    with sqlite3.connect(":memory:") as connection:
+        connection.executescript(sql)
+        rows = connection.execute('SELECT "NAME", "QTY", "ACTIVE" FROM "data0"').fetchall()
+    assert len(rows) == 500 - 500 // 7
+    assert ("O'Brien" in {row[0] for row in rows}) and {row[2] for row in rows} <= {0, 1, None}
+
+
+def test_sqlserver_caps_rows_per_insert(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(2500)
+    sql = run(dbf_path, tmp_path / "out.sql", batch_size=5000, dialect="sqlserver")
+    assert insert_row_counts(sql) == [1000, 1000, 500]
+
+    budgeted = run(
+        dbf_path,
+        tmp_path / "budgeted.sql",
+        batch_size=5000,
+        dialect="sqlserver",
+        max_statement_bytes=50_000,
+    )
+    counts = insert_row_counts(budgeted)
+    assert sum(counts) == 2500 and max(counts) <= 1000 and len(counts) > 3
+
+
+@pytest.mark.parametrize(
+    "dialect, begin, commit",
+    [
+        ("sqlite", "BEGIN TRANSACTION;", "COMMIT;"),
+        ("sqlserver", "BEGIN TRANSACTION;", "COMMIT TRANSACTION;"),
+    ],
+)
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_bulk_wraps_one_transaction(
+    make_dbf: Callable[..., str], tmp_path: Path, dialect: str, begin: str, commit: str, jobs: int
+) -> None:
+    sql = run(
+        make_dbf(1000),
+        tmp_path / "out.sql",
+        batch_size=100,
+        dialect=dialect,
+        output_format="bulk",
+        jobs=jobs,
+    )
+    assert sql.count(begin) == 1 and sql.count(commit) == 1
+    assert sql.index("CREATE TABLE") < sql.index(begin) < sql.index("INSERT INTO")
+    assert sql.rindex("INSERT INTO") < sql.index(commit)
+    assert len(insert_row_counts(sql)) == 10
+
+
+@pytest.mark.parametrize("output_format", ["insert", "bulk"])
+@pytest.mark.parametrize("dialect", DIALECTS)
+@pytest.mark.parametrize(
+    "options",
+    [{"jobs": 3}, {"pipeline_workers": 2}, {"engine": "numpy"}, {"reader": "dbfread"}],
+    ids=lambda options: ",".join(options),
+)
+def test_dialect_paths_agree(
+    make_dbf: Callable[..., str],
+    tmp_path: Path,
+    dialect: str,
+    output_format: str,
+    options: Dict[str, Any],
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    dbf_path = make_dbf(1200, deleted_every=5)
+    settings = {"batch_size": 100, "dialect": dialect, "output_format": output_format}
+    expected = run(dbf_path, tmp_path / "expected" / "out.sql", **settings)
+    assert run(dbf_path, tmp_path / "actual" / "out.sql", **settings, **options) == expected
+    if dialect == "mysql" and output_format == "bulk":
+        data = (tmp_path / "actual" / "out.tsv").read_bytes()
+        assert data == (tmp_path / "expected" / "out.tsv").read_bytes()
+
+
+def test_copy_is_postgresql_bulk(golden_dbf: str, tmp_path: Path) -> None:
+    copy = run(golden_dbf, tmp_path / "copy.sql", output_format="copy")
+    bulk = run(golden_dbf, tmp_path / "bulk.sql", dialect="postgresql", output_format="bulk")
+    assert copy == bulk
+    with pytest.raises(ValueError):
+        DBFToSQLConverter(dialect="mysql", output_format="copy")
+    with pytest.raises(ValueError):
+        DBFToSQLConverter(dialect="oracle")
@@ -0,0 +1,40 @@
+"""
+Tests that the per-column value encoders match _escape_sql_value.
+"""
+
+import datetime
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.dialects import DIALECTS
+
+VALUES = {
+    "C": ["", "plain", "O'Brien", "two\nlines\r", "back\\slash", "Zoë"],
+    "N": [None, 0, -12, 10**20, 1.5, -0.1, float("nan"), float("inf"), float("-inf")],
+    "F": [None, 0.0, 2.5, -1e-7, float("nan"), float("inf")],
+    "I": [0, -7, 2**31 - 1],
+    "L": [True, False, None],
+    "D": [None, datetime.date(1999, 12, 31)],
+    "T": [None, datetime.datetime(2024, 1, 1, 12, 34, 56, 500000)],
+    "Y": [Decimal("12345.6789"), Decimal(0)],
+    # No specialized encoder: the generic escape is used
+    "M": [None, "memo 'text'\n\ttab\\"],
+    "G": [None, b"\x00binary"],
+}
+
+
+@pytest.mark.parametrize("field_type", sorted(VALUES))
+@pytest.mark.parametrize("output_format", ["insert", "bulk"])
+@pytest.mark.parametrize("dialect", DIALECTS)
+def test_encoders_match_escape_sql_value(dialect: str, output_format: str, field_type: str) -> None:
+    converter = DBFToSQLConverter(dialect=dialect, output_format=output_format)
+    if converter._delimited:
+        escape = converter._escape_delimited_value
+    else:
+        escape = converter._escape_sql_value
+    (encode,) = converter._build_value_encoders([field_type])
+    values: List[Any] = VALUES[field_type]
+    assert [encode(value) for value in values] == [escape(value) for value in values]
@@ -0,0 +1,64 @@
+"""
+Tests that the alternative conversion paths write the sequential output byte for byte.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+
+OPTIONS = [
+    {"pipeline_workers": 2},
+    {"pipeline_workers": 3, "queue_depth": 1},
+    {"jobs": 2},
+    {"workers": 2},
+    {"checkpoint_interval": 700},
+    {"max_statement_bytes": 1 << 20},
+    {"max_memory": 1 << 36},
+    {"reader": "dbfread"},
+]
+
+
+@pytest.fixture
+def dbf_path(make_dbf: Callable[..., str]) -> str:
+    return make_dbf(3000, deleted_every=10)
+
+
+@pytest.mark.parametrize("options", OPTIONS, ids=lambda options: ",".join(options))
+def test_output_matches_sequential(
+    dbf_path: str, convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    expected = convert(dbf_path, batch_size=100)
+    assert convert(dbf_path, batch_size=100, **options) == expected
+
+
+@pytest.mark.parametrize("pipeline_workers", [0, 2])
+def test_memory_budget_only_changes_batching(
+    dbf_path: str, convert: Callable[..., bytes], tmp_path: Path, pipeline_workers: int
+) -> None:
+    # COPY rows do not depend on the batch boundaries, so smaller batches give the same output
+    expected = convert(dbf_path, batch_size=100_000, output_format="copy")
+    converter = DBFToSQLConverter(
+        batch_size=100_000,
+        output_format="copy",
+        encoding="cp1252",
+        pipeline_workers=pipeline_workers,
+        max_memory=1 << 20,
+        progress="none",
+    )
+    sql_path = tmp_path / "budgeted.sql"
+    assert converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+    assert sql_path.read_bytes() == expected
+    assert converter.stats.batches > 1
+    assert converter.batch_size == 100_000
+
+
+@pytest.mark.parametrize("batch_size", [1, 5])
+@pytest.mark.parametrize("max_memory", [1, 1 << 20, 1 << 36])
+def test_memory_budget_never_grows_small_batches(
+    dbf_path: str, convert: Callable[..., bytes], batch_size: int, max_memory: int
+) -> None:
+    expected = convert(dbf_path, batch_size=batch_size)
+    assert convert(dbf_path, batch_size=batch_size, max_memory=max_memory) == expected
@@ -0,0 +1,174 @@
+"""
+Tests of --where row filtering.
+"""
+
+import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from dbfread import DBF
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.filters import WhereClause
+from dbf2sql.parallel import partition_records
+from dbf2sql.reader import DBFReader
+
+Row = Tuple[Any, ...]
+
+WHERE = "QTY > 100 AND ACTIVE = TRUE"
+NO_MATCH = "CODE = 'no such value'"
+
+# Expressions and the rows they select, columns NAME CODE QTY PRICE RATE BORN ACTIVE
+CASES: List[Tuple[str, Callable[[Row], Optional[bool]]]] = [
+    (WHERE, lambda row: row[2] is not None and row[2] > 100 and row[6] is True),
+    ("NAME = 'O''Brien'", lambda row: row[0] == "O'Brien"),
+    (
+        "name <> 'Smith' and Code in ('C001', 'C012', 'C100')",
+        lambda row: row[0] != "Smith" and row[1] in ("C001", "C012", "C100"),
+    ),
+    ("CODE NOT IN ('C001', 'C002')", lambda row: row[1] not in ("C001", "C002")),
+    (
+        "PRICE IS NULL OR RATE < -500.5",
+        lambda row: row[3] is None or (row[4] is not None and row[4] < -500.5),
+    ),
+    ("QTY IS NOT NULL AND NOT (QTY >= 0)", lambda row: row[2] is not None and row[2] < 0),
+    # NULL comparisons are unknown, and NOT unknown is still unknown
+    ("NOT (QTY > 0)", lambda row: row[2] is not None and not row[2] > 0),
+    (
+        "BORN >= 19900101 AND BORN < '2000-01-01'",
+        lambda row: row[5] is not None
+        and datetime.date(1990, 1, 1) <= row[5] < datetime.date(2000, 1, 1),
+    ),
+    ("ACTIVE IS NULL", lambda row: row[6] is None),
+    (NO_MATCH, lambda row: False),
+]
+
+
+def values_lines(sql: bytes) -> List[bytes]:
+    return [line for line in sql.splitlines() if line.startswith(b"    (")]
+
+
+@pytest.fixture
+def dbf_path(make_dbf: Callable[..., str]) -> str:
+    return make_dbf(3000, deleted_every=10)
+
+
+@pytest.mark.parametrize("where, select", CASES, ids=[where for where, _ in CASES])
+def test_filtered_rows(
+    dbf_path: str,
+    convert: Callable[..., bytes],
+    where: str,
+    select: Callable[[Row], Optional[bool]],
+) -> None:
+    rows = [tuple(record.values()) for record in DBF(dbf_path, encoding="cp1252")]
+    expected = [row for row in rows if select(row)]
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        reader.set_filter(WhereClause(where).compile_raw(reader))
+        assert list(reader) == expected
+
+    sql = convert(dbf_path, where=where)
+    assert len(values_lines(sql)) == len(expected)
+    # Both readers write the same output, header included
+    assert convert(dbf_path, where=where, reader="dbfread") == sql
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"jobs": 3}, {"pipeline_workers": 2}, {"engine": "numpy"}, {"passthrough": True}],
+    ids=lambda options: ",".join(options),
+)
+@pytest.mark.parametrize("where", [WHERE, NO_MATCH])
+def test_filtered_paths_agree(
+    dbf_path: str, convert: Callable[..., bytes], options: Dict[str, Any], where: str
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    baseline = {"passthrough": True} if options.get("passthrough") else {}
+    expected = convert(dbf_path, batch_size=100, where=where, **baseline)
+    assert convert(dbf_path, batch_size=100, where=where, **options) == expected
+
+
+def test_total_records_header_is_unfiltered(dbf_path: str, convert: Callable[..., bytes]) -> None:
+    sql = convert(dbf_path, where=NO_MATCH)
+    assert b"-- Total records: 2700\n" in sql
+    assert b"-- Conversion completed: 0 records processed\n" in sql
+
+
+@pytest.mark.parametrize(
+    "where, message",
+    [
+        ("QTY >", "unexpected end of expression"),
+        ("QTY > AND", "expected a literal"),
+        ("QTY = 1 AND", "unexpected end of expression"),
+        ("QTY = 1 AND 5 = QTY", "expected a column name"),
+        ("(QTY = 1", "expected ')'"),
+        ("QTY NOT = 1", "expected IN after NOT"),
+        ("QTY = 1 2", "unexpected '2'"),
+        ("QTY = 1 ; DROP", "unexpected character"),
+    ],
+)
+def test_parse_errors(where: str, message: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        WhereClause(where)
+    assert message in str(excinfo.value)
+
+
+@pytest.mark.parametrize(
+    "where", ["NOPE = 1", "QTY = 'text'", "BORN = 2024", "ACTIVE = 1", "NAME > 5"]
+)
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+def test_invalid_filters_fail_the_conversion(
+    make_dbf: Callable[..., str], tmp_path: Path, where: str, reader: str
+) -> None:
+    converter = DBFToSQLConverter(encoding="cp1252", reader=reader, where=where)
+    assert not converter.convert_dbf_to_sql(make_dbf(5), str(tmp_path / "out.sql"))
+
+
+def test_range_read_evaluates_filter_on_range_only(dbf_path: str) -> None:
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        predicate = WhereClause(WHERE).compile_raw(reader)
+        calls = []
+
+        def counting(record: bytes) -> bool:
+            calls.append(record)
+            return predicate(record)
+
+        reader.set_filter(counting)
+        first = list(reader.iter_records(0, 100))
+        block = bytes(reader.read_selected_block(0, 100))
+        # 90 active records in range, evaluated once by each read
+        assert len(calls) == 180
+        assert len(reader) == 2700
+        assert len(calls) == 180
+
+        # Once the whole selection is made, ranges reuse it
+        flags = reader.deletion_flags()
+        assert len(calls) == 180 + 2700
+        calls.clear()
+        assert list(reader.iter_records(0, 100)) == first
+        assert bytes(reader.read_selected_block(0, 100)) == block
+        assert not calls
+        assert flags.count(b" ") == sum(1 for _ in reader.iter_records())
+
+    # Rejected records are flagged as deleted in selected blocks
+    record_length = reader.record_length
+    block_flags = block[::record_length]
+    assert block_flags.count(b" ") == len(first)
+    assert set(block_flags) <= {ord(" "), ord("*")}
+
+
+def test_partition_records_filtered_to_nothing(dbf_path: str) -> None:
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        reader.set_filter(WhereClause(NO_MATCH).compile_raw(reader))
+        assert partition_records(reader, 4, 100) == [(0, 3000)]
+
+
+def test_dbfread_length_does_not_evaluate_filter(dbf_path: str) -> None:
+    converter = DBFToSQLConverter(encoding="cp1252", reader="dbfread", where=WHERE)
+    with converter._open_table(dbf_path) as table:
+        calls = []
+        row_filter = table._row_filter
+        table._row_filter = lambda row: calls.append(row) or row_filter(row)
+        assert len(table) == 2700
+        assert not calls
@@ -0,0 +1,58 @@
+"""
+Tests of intra-file parallel conversion (--jobs).
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from dbf2sql.parallel import partition_records
+from dbf2sql.reader import DBFReader
+
+from .dbfdata import SAMPLE_FIELDS, sample_records, write_dbf
+
+
+@pytest.mark.parametrize(
+    "rows, deleted_every",
+    [(2500, 0), (2500, 3), (0, 0), (300, 1)],
+    ids=["plain", "deleted", "empty", "all-deleted"],
+)
+@pytest.mark.parametrize("jobs", [2, 3])
+def test_jobs_output_matches_sequential(
+    make_dbf: Callable[..., str],
+    convert: Callable[..., bytes],
+    rows: int,
+    deleted_every: int,
+    jobs: int,
+) -> None:
+    dbf_path = make_dbf(rows, deleted_every=deleted_every)
+    expected = convert(dbf_path, batch_size=100)
+    assert convert(dbf_path, batch_size=100, jobs=jobs) == expected
+
+
+def test_jobs_skip_records_with_other_flags(tmp_path: Path, convert: Callable[..., bytes]) -> None:
+    flags = [b" X*"[index % 3 : index % 3 + 1] for index in range(1000)]
+    dbf_path = write_dbf(tmp_path / "flags.dbf", SAMPLE_FIELDS, sample_records(1000), flags)
+    expected = convert(dbf_path, batch_size=50)
+    assert convert(dbf_path, batch_size=50, jobs=3) == expected
+    assert b"-- Total records: 334\n" in expected
+
+
+@pytest.mark.parametrize("rows, deleted_every", [(0, 0), (300, 1)])
+def test_partition_records_without_active_records(
+    make_dbf: Callable[..., str], rows: int, deleted_every: int
+) -> None:
+    with DBFReader(make_dbf(rows, deleted_every=deleted_every), encoding="cp1252") as reader:
+        assert partition_records(reader, 4, 100) == [(0, rows)]
+
+
+def test_partition_records_aligns_to_batches(make_dbf: Callable[..., str]) -> None:
+    with DBFReader(make_dbf(2500, deleted_every=3), encoding="cp1252") as reader:
+        ranges = partition_records(reader, 3, 100)
+        flags = reader.deletion_flags()
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(flags) == 2500
+        for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+            assert stop == start
+        for start, stop in ranges[:-1]:
+            assert flags.count(b" ", start, stop) % 100 == 0
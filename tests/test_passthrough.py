@@ -0,0 +1,106 @@
+"""
+Tests of raw-bytes passthrough mode (--passthrough).
+"""
+
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from dbf2sql.reader import ascii_safe_encoding
+
+from .dbfdata import Field, Value, write_dbf
+
+FIELDS = [
+    Field("NAME", "C", 12),
+    Field("QTY", "N", 8, 2),
+    Field("RATE", "F", 10, 3),
+    Field("DAY", "D", 8),
+    Field("OK", "L", 1),
+]
+
+RECORDS: List[List[Value]] = [
+    ["O'Brien\n", "12.50", "-0.500", "20240229", "T"],
+    [None, None, "1e3", None, "?"],
+    ["Zoë", "1,5", "***", "19991231", "n"],
+    ["x", "007", "-.5", None, "F"],
+]
+
+
+@pytest.fixture
+def dbf_path(tmp_path: Path) -> str:
+    return write_dbf(tmp_path / "values.dbf", FIELDS, RECORDS)
+
+
+def values_lines(sql: bytes) -> List[str]:
+    return [line for line in sql.decode("utf-8").splitlines() if line.startswith("    (")]
+
+
+def test_plain_literals_are_copied(dbf_path: str, convert: Callable[..., bytes]) -> None:
+    assert values_lines(convert(dbf_path, passthrough=True)) == [
+        "    ('O''Brien\\n', 12.50, -0.500, '2024-02-29', TRUE),",
+        "    ('', NULL, 1000.0, NULL, NULL),",
+        "    ('Zoë', 1.5, NULL, '1999-12-31', FALSE),",
+        "    ('x', 007, -.5, NULL, FALSE);",
+    ]
+
+
+def test_values_are_numerically_identical(dbf_path: str, convert: Callable[..., bytes]) -> None:
+    def numbers(line: str) -> List[object]:
+        cells = line.strip(" (),;").split(", ")
+        return [Decimal(cell) if cell[0] in "-.0123456789" else cell for cell in cells]
+
+    default = values_lines(convert(dbf_path))
+    passthrough = values_lines(convert(dbf_path, passthrough=True))
+    assert default != passthrough
+    assert [numbers(line) for line in passthrough] == [numbers(line) for line in default]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"pipeline_workers": 2}, {"jobs": 2}, {"engine": "numpy"}],
+    ids=lambda options: ",".join(options),
+)
+def test_passthrough_paths_agree(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    dbf_path = make_dbf(2000, deleted_every=5)
+    expected = convert(dbf_path, batch_size=100, passthrough=True)
+    assert convert(dbf_path, batch_size=100, passthrough=True, **options) == expected
+
+
+def test_dbfread_ignores_passthrough(dbf_path: str, convert: Callable[..., bytes]) -> None:
+    assert convert(dbf_path, reader="dbfread", passthrough=True) == convert(dbf_path)
+
+
+@pytest.mark.parametrize("encoding", ["shift_jis", "cp1252"])
+def test_character_fields_match_default(
+    tmp_path: Path, convert: Callable[..., bytes], encoding: str
+) -> None:
+    fields = [Field("NAME", "C", 16)]
+    texts = ["ソフト'ウェア", "表\n示", "plain", ""] if encoding == "shift_jis" else ["Zoë's", ""]
+    dbf_path = write_dbf(
+        tmp_path / "text.dbf", fields, [[text] for text in texts], encoding=encoding
+    )
+    expected = convert(dbf_path, encoding=encoding)
+    assert convert(dbf_path, encoding=encoding, passthrough=True) == expected
+
+
+@pytest.mark.parametrize(
+    "encoding, expected",
+    [
+        ("utf-8", True),
+        ("ascii", True),
+        ("cp1252", True),
+        ("latin-1", True),
+        ("cp850", True),
+        ("shift_jis", False),
+        ("utf-16", False),
+        ("no-such-codec", False),
+    ],
+)
+def test_ascii_safe_encoding(encoding: str, expected: bool) -> None:
+    assert ascii_safe_encoding(encoding) is expected
@@ -0,0 +1,91 @@
+"""
+Tests of pipelined conversion (--pipeline).
+"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.parallel import iter_batch_ranges
+from dbf2sql.reader import DBFReader
+
+from .dbfdata import SAMPLE_FIELDS, sample_records, write_dbf
+
+
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+@pytest.mark.parametrize("pipeline_workers, queue_depth", [(1, 1), (2, 4), (3, 1)])
+def test_pipeline_output_matches_sequential(
+    make_dbf: Callable[..., str],
+    convert: Callable[..., bytes],
+    reader: str,
+    pipeline_workers: int,
+    queue_depth: int,
+) -> None:
+    dbf_path = make_dbf(1500, deleted_every=4)
+    expected = convert(dbf_path, batch_size=64)
+    sql = convert(
+        dbf_path,
+        batch_size=64,
+        reader=reader,
+        pipeline_workers=pipeline_workers,
+        queue_depth=queue_depth,
+    )
+    assert sql == expected
+
+
+def test_pipeline_with_numpy_engine(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes]
+) -> None:
+    pytest.importorskip("numpy")
+    dbf_path = make_dbf(1500, deleted_every=4)
+    expected = convert(dbf_path, batch_size=64)
+    assert convert(dbf_path, batch_size=64, engine="numpy", pipeline_workers=2) == expected
+
+
+@pytest.mark.parametrize("rows", [0, 1])
+def test_pipeline_small_tables(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], rows: int
+) -> None:
+    dbf_path = make_dbf(rows)
+    assert convert(dbf_path, pipeline_workers=2) == convert(dbf_path)
+
+
+def test_pipeline_stats(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    converter = DBFToSQLConverter(
+        batch_size=100, encoding="cp1252", pipeline_workers=2, queue_depth=3
+    )
+    assert converter.convert_dbf_to_sql(make_dbf(1000), str(tmp_path / "out.sql"))
+    stats = converter.pipeline_stats
+    assert stats is not None
+    summary = stats.as_dict()
+    assert summary["batches"] == 10
+    assert summary["formatter_workers"] == 2
+    assert summary["queue_depth"] == 3
+    assert 0 <= summary["max_read_queue"] <= 3
+    assert summary["wall_time"] > 0
+
+
+def test_iter_batch_ranges(tmp_path: Path) -> None:
+    flags = [b" X*"[index % 3 : index % 3 + 1] for index in range(100)]
+    dbf_path = write_dbf(tmp_path / "flags.dbf", SAMPLE_FIELDS, sample_records(100), flags)
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        ranges = list(iter_batch_ranges(reader, 10))
+        flags_read = reader.deletion_flags()
+    # 34 active records: three full batches and a last one with four
+    active: List[int] = [flags_read.count(b" ", start, stop) for start, stop in ranges]
+    assert active == [10, 10, 10, 4]
+    assert ranges[0][0] == 0 and ranges[-1][1] == 100
+    for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+        assert stop == start
+
+
+def test_pipeline_skips_records_with_other_flags(
+    tmp_path: Path, convert: Callable[..., bytes]
+) -> None:
+    flags = [b" X*"[index % 3 : index % 3 + 1] for index in range(300)]
+    dbf_path = write_dbf(tmp_path / "flags.dbf", SAMPLE_FIELDS, sample_records(300), flags)
+    expected = convert(dbf_path, batch_size=16)
+    assert convert(dbf_path, batch_size=16, pipeline_workers=2) == expected
+    assert b"-- Total records: 100\n" in expected
@@ -0,0 +1,188 @@
+"""
+Tests of progress reporting.
+"""
+
+import io
+import json
+import pickle
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.progress import Progress, ProgressUpdate, format_duration
+from dbf2sql.reader import estimate_data_size
+
+
+class Clock:
+    """Stand-in for time.perf_counter advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr("dbf2sql.progress.time.perf_counter", clock)
+    return clock
+
+
+def test_updates_are_throttled(clock: Clock) -> None:
+    updates: List[ProgressUpdate] = []
+    progress = Progress(updates.append, interval=2.0)
+
+    progress.start_file("a.dbf", 1000, 8000)
+    for records in range(100, 1000, 100):
+        clock.now += 0.5
+        progress.update(records)
+    assert [update.records for update in updates] == [400, 800]
+
+    clock.now += 0.5
+    progress.finish_file(1000)
+    assert [update.finished for update in updates] == [False, False, True]
+
+    first, _, last = updates
+    assert (first.file, first.total_records, first.total_files) == ("a.dbf", 1000, 0)
+    assert (first.bytes, first.total_bytes) == (3200, 8000)
+    assert first.elapsed == 2.0 and first.rows_per_second == 200.0
+    assert first.eta == 3.0 and first.fraction == first.file_fraction == 0.4
+    assert (last.records, last.bytes, last.eta, last.fraction) == (1000, 8000, 0.0, 1.0)
+
+
+def test_run_over_several_files(clock: Clock) -> None:
+    updates: List[ProgressUpdate] = []
+    progress = Progress(updates.append, interval=0.0)
+    progress.start_run(2, 4000)
+
+    progress.start_file("a.dbf", 100, 1000)
+    clock.now += 1.0
+    progress.finish_file(100)
+    progress.start_file("b.dbf", 300, 3000)
+    clock.now += 1.0
+    progress.update(150)
+    clock.now += 1.0
+    progress.finish_file(300)
+    progress.finish_run()
+
+    assert [(update.files_done, update.total_files) for update in updates] == [
+        (1, 2),
+        (1, 2),
+        (2, 2),
+    ]
+    assert [update.bytes for update in updates] == [1000, 2500, 4000]
+    assert [update.fraction for update in updates] == [0.25, 0.625, 1.0]
+    # Across files the ETA goes by the share of record data converted
+    assert updates[1].elapsed == 2.0 and updates[1].eta == pytest.approx(1.2)
+    assert updates[2].eta == 0.0
+
+
+def test_json_lines(clock: Clock) -> None:
+    stream = io.StringIO()
+    progress = Progress("json", interval=0.0, stream=stream)
+    progress.start_run(1, 800)
+    progress.start_file("a.dbf", 100, 800)
+    clock.now += 2.0
+    progress.update(50)
+    progress.finish_file(100)
+    progress.finish_run()
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["event"] for event in events] == ["progress", "file", "done"]
+    assert events[0] == {
+        "event": "progress",
+        "file": "a.dbf",
+        "records": 50,
+        "total_records": 100,
+        "bytes": 400,
+        "total_bytes": 800,
+        "files_done": 0,
+        "total_files": 1,
+        "percent": 50.0,
+        "elapsed": 2.0,
+        "rows_per_second": 25.0,
+        "eta": 2.0,
+    }
+    assert events[1]["percent"] == 100.0 and events[1]["files_done"] == 1
+    assert events[2] == {
+        "event": "done",
+        "files": 1,
+        "total_files": 1,
+        "bytes": 800,
+        "elapsed": 2.0,
+    }
+
+
+def test_bar(clock: Clock) -> None:
+    stream = io.StringIO()
+    progress = Progress("bar", interval=0.0, stream=stream)
+    progress.start_file("a.dbf", 2000)
+    clock.now += 1.0
+    progress.update(500)
+    progress.finish_file(2000)
+
+    first, last = stream.getvalue().split("\r")[1:]
+    assert first == f"[{'#' * 7}{'-' * 23}]  25.0% 500/2,000 rows 500 rows/s ETA 0:00:03\033[K"
+    assert last.startswith(f"[{'#' * 30}] 100.0% 2,000/2,000 rows")
+    assert last.endswith("ETA 0:00:00\033[K\n")
+
+
+def test_none_and_unknown_modes() -> None:
+    stream = io.StringIO()
+    progress = Progress("none", stream=stream)
+    progress.start_file("a.dbf", 10)
+    progress.update(5)
+    progress.finish_file(10)
+    assert stream.getvalue() == ""
+
+    with pytest.raises(ValueError, match="Unknown progress mode: 'fancy'"):
+        Progress("fancy")
+
+
+def test_worker_copies_report_nothing() -> None:
+    progress = pickle.loads(pickle.dumps(Progress("json", stream=None)))
+    assert progress.mode == "none" and progress.callback is None
+
+
+def test_format_duration() -> None:
+    assert format_duration(None) == "?"
+    assert format_duration(59.6) == "0:01:00"
+    assert format_duration(3 * 3600 + 62) == "3:01:02"
+
+
+def test_converter_reports_batches(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(1050)
+    updates: List[ProgressUpdate] = []
+    converter = DBFToSQLConverter(
+        encoding="cp1252", batch_size=100, progress=updates.append, progress_interval=0
+    )
+    assert converter.convert_dbf_to_sql(dbf_path, str(tmp_path / "out.sql"))
+
+    # One update per batch, the last of them partial, then the finished file
+    assert [update.records for update in updates] == list(range(100, 1100, 100)) + [1050, 1050]
+    assert [update.finished for update in updates].count(True) == 1
+    assert {(update.file, update.total_records) for update in updates} == {(dbf_path, 1050)}
+    assert updates[-1].bytes == updates[-1].total_bytes == estimate_data_size(dbf_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_converter_reports_files(
+    make_dbf: Callable[..., str], tmp_path: Path, workers: int
+) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (300, 700)]
+    updates: List[ProgressUpdate] = []
+    converter = DBFToSQLConverter(
+        encoding="cp1252", workers=workers, progress=updates.append, progress_interval=60
+    )
+    assert all(converter.convert_multiple_files(dbf_files, str(tmp_path / "out")).values())
+
+    finished = [update for update in updates if update.finished]
+    assert sorted(update.records for update in finished) == [300, 700]
+    assert [update.files_done for update in finished] == [1, 2]
+    assert {update.total_files for update in updates} == {2}
+    total = sum(estimate_data_size(dbf_file) for dbf_file in dbf_files)
+    assert finished[-1].bytes == finished[-1].total_bytes == total
@@ -0,0 +1,105 @@
+"""
+Tests of column projection (--columns/--exclude-columns).
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.reader import DBFReader, select_fields
+
+from .dbfdata import Field, write_dbf
+
+NAMES = ["NAME", "CODE", "QTY", "PRICE", "RATE", "BORN", "ACTIVE"]
+
+
+@pytest.mark.parametrize(
+    "columns, exclude_columns, expected",
+    [
+        (None, None, [0, 1, 2, 3, 4, 5, 6]),
+        # Requested order does not matter, fields keep their table order
+        (["rate", "Name", "QTY"], None, [0, 2, 4]),
+        (None, ["code", "BORN"], [0, 2, 3, 4, 6]),
+        # A column both included and excluded is left out
+        (["NAME", "QTY", "RATE"], ["qty"], [0, 4]),
+    ],
+)
+def test_select_fields(
+    columns: Optional[List[str]], exclude_columns: Optional[List[str]], expected: List[int]
+) -> None:
+    assert select_fields(NAMES, columns, exclude_columns) == expected
+
+
+@pytest.mark.parametrize(
+    "columns, exclude_columns, message",
+    [
+        (["NAME", "NOPE"], None, "Unknown column(s): NOPE"),
+        (None, ["MISSING", "QTY", "other"], "Unknown column(s): MISSING, other"),
+        (["QTY"], ["qty"], "No columns left"),
+        ([], None, "No columns left"),
+    ],
+)
+def test_select_fields_errors(
+    columns: Optional[List[str]], exclude_columns: Optional[List[str]], message: str
+) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        select_fields(NAMES, columns, exclude_columns)
+    assert str(excinfo.value).startswith(message)
+
+
+def test_projected_output(make_dbf: Callable[..., str], convert: Callable[..., bytes]) -> None:
+    dbf_path = make_dbf(50, deleted_every=4)
+    sql = convert(dbf_path, columns=["born", "NAME"], exclude_columns=["QTY"])
+    text = sql.decode("utf-8")
+    assert "INSERT INTO `data0` (`NAME`, `BORN`) VALUES" in text
+    assert "    `NAME` VARCHAR(24),\n    `BORN` DATE\n);" in text
+    assert "QTY" not in text
+
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        full = list(reader)
+    with DBFReader(dbf_path, encoding="cp1252", columns=["BORN", "NAME"]) as reader:
+        assert [field.name for field in reader.fields] == ["NAME", "BORN"]
+        assert list(reader) == [(row[0], row[5]) for row in full]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"reader": "dbfread"},
+        {"engine": "numpy"},
+        {"pipeline_workers": 2},
+        {"jobs": 2},
+    ],
+    ids=lambda options: ",".join(options),
+)
+def test_projection_paths_agree(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    dbf_path = make_dbf(1000, deleted_every=3)
+    projection = {"columns": ["RATE", "NAME", "ACTIVE", "CODE"], "exclude_columns": ["code"]}
+    expected = convert(dbf_path, batch_size=64, **projection)
+    assert convert(dbf_path, batch_size=64, **projection, **options) == expected
+
+
+@pytest.mark.parametrize("reader", ["native", "dbfread"])
+def test_unknown_column_fails_the_conversion(
+    make_dbf: Callable[..., str], tmp_path: Path, reader: str
+) -> None:
+    converter = DBFToSQLConverter(encoding="cp1252", reader=reader, columns=["NAME", "NOPE"])
+    assert not converter.convert_dbf_to_sql(make_dbf(5), str(tmp_path / "out.sql"))
+
+
+def test_excluding_memo_fields_keeps_the_native_reader(
+    tmp_path: Path, convert: Callable[..., bytes]
+) -> None:
+    fields = [Field("ID", "N", 4), Field("NOTES", "M", 10)]
+    dbf_path = write_dbf(tmp_path / "memo.dbf", fields, [["1", "memo"], ["2", "text"]])
+    with DBFReader(dbf_path, exclude_columns=["notes"]) as reader:
+        assert list(reader) == [(1,), (2,)]
+    sql = convert(dbf_path, reader="native", exclude_columns=["NOTES"])
+    assert sql == convert(dbf_path, reader="dbfread", exclude_columns=["NOTES"])
+    assert b"    (1),\n    (2);\n" in sql
@@ -0,0 +1,154 @@
+"""
+Tests for the native DBF reader.
+"""
+
+import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+import pytest
+from dbfread import DBF
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.reader import DBFReader, UnsupportedDBFError, header_date
+
+from .dbfdata import SAMPLE_FIELDS, Field, sample_records, write_dbf, write_sample
+
+
+def dbfread_rows(dbf_path: str, encoding: str = "cp1252") -> List[Tuple[Any, ...]]:
+    # Visual FoxPro B fields are doubles, but dbfread still looks for a memo file for them
+    table = DBF(
+        dbf_path, encoding=encoding, char_decode_errors="ignore", ignore_missing_memofile=True
+    )
+    return [tuple(record.values()) for record in table]
+
+
+def native_rows(dbf_path: str, encoding: str = "cp1252") -> List[Tuple[Any, ...]]:
+    with DBFReader(dbf_path, encoding=encoding, char_decode_errors="ignore") as reader:
+        return list(reader)
+
+
+def test_header(tmp_path: Path) -> None:
+    dbf_path = write_sample(tmp_path / "sample.dbf", 5)
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        assert reader.version == 0x03
+        assert reader.date == datetime.date(2024, 1, 1)
+        assert reader.header_record_count == 5
+        assert [(field.name, field.type, field.length) for field in reader.fields] == [
+            (field.name, field.type, field.length) for field in SAMPLE_FIELDS
+        ]
+        assert [field.offset for field in reader.fields] == [1, 25, 31, 39, 51, 67, 75]
+        assert reader.fields[3].decimal_count == 2
+
+
+@pytest.mark.parametrize(
+    "year, month, day, expected",
+    [
+        (124, 1, 1, datetime.date(2024, 1, 1)),
+        (99, 12, 31, datetime.date(1999, 12, 31)),
+        (5, 6, 7, datetime.date(2005, 6, 7)),
+        (124, 2, 30, None),
+        (0, 0, 0, None),
+    ],
+)
+def test_header_date(
+    tmp_path: Path, year: int, month: int, day: int, expected: Optional[datetime.date]
+) -> None:
+    assert header_date(year, month, day) == expected
+    dbf_path = write_sample(tmp_path / "dated.dbf", 1, date=(year, month, day))
+    with DBFReader(dbf_path) as reader:
+        assert reader.date == expected
+
+
+def test_values_match_dbfread(tmp_path: Path) -> None:
+    dbf_path = write_sample(tmp_path / "sample.dbf", 500, deleted_every=4)
+    rows = native_rows(dbf_path)
+    assert len(rows) == 375
+    assert rows == dbfread_rows(dbf_path)
+
+
+def test_long_character_field(tmp_path: Path) -> None:
+    # 300 bytes: the length byte holds 44 and the decimal count byte the high byte 1
+    fields = [Field("ID", "N", 4), Field("TEXT", "C", 300)]
+    text = "x" * 150 + "é" * 149 + "!"
+    dbf_path = write_dbf(tmp_path / "long.dbf", fields, [["1", text], ["2", "short"]])
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        assert reader.fields[1].length == 300
+        assert reader.fields[1].decimal_count == 0
+        assert reader.record_length == 305
+        assert list(reader) == [(1, text), (2, "short")]
+    assert dbfread_rows(dbf_path) == [(1, text), (2, "short")]
+
+
+def test_visual_foxpro_binary_fields(tmp_path: Path) -> None:
+    fields = [
+        Field("ID", "I", 4),
+        Field("AMOUNT", "Y", 8),
+        Field("RATIO", "B", 8, 4),
+        Field("STAMP", "T", 8),
+    ]
+    stamp = (2460311).to_bytes(4, "little") + (45_296_500).to_bytes(4, "little")
+    records: List[List[Any]] = [
+        [
+            (-7).to_bytes(4, "little", signed=True),
+            (123_456_789).to_bytes(8, "little", signed=True),
+            bytes.fromhex("0000000000000440"),
+            stamp,
+        ],
+        [bytes(4), bytes(8), bytes(8), None],
+    ]
+    dbf_path = write_dbf(tmp_path / "vfp.dbf", fields, records, version=0x30)
+    rows = native_rows(dbf_path)
+    assert rows == [
+        (-7, Decimal("12345.6789"), 2.5, datetime.datetime(2024, 1, 1, 12, 34, 56, 500000)),
+        (0, Decimal(0), 0.0, None),
+    ]
+    assert rows == dbfread_rows(dbf_path)
+
+
+@pytest.mark.parametrize(
+    "flags, options",
+    [
+        # Only the space flag marks an active record, whatever the other byte is
+        ([b" ", b"*", b"X", b"\0", b" "], {}),
+        # Records past a short header count are still read
+        ([b" "] * 5, {"header_count": 2}),
+        # A header count past the data is ignored
+        ([b" "] * 5, {"header_count": 50}),
+        # An end-of-file marker stops reading
+        ([b" ", b" ", b"\x1a", b" ", b" "], {}),
+        ([b" "] * 5, {"end_marker": False}),
+    ],
+)
+def test_record_selection_matches_dbfread(tmp_path: Path, flags: List[bytes], options: Any) -> None:
+    dbf_path = write_dbf(tmp_path / "flags.dbf", SAMPLE_FIELDS, sample_records(5), flags, **options)
+    rows = native_rows(dbf_path)
+    assert rows == dbfread_rows(dbf_path)
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        assert len(reader) == len(rows)
+    assert len(DBF(dbf_path, encoding="cp1252")) == len(rows)
+
+
+def test_iter_records_range(tmp_path: Path) -> None:
+    dbf_path = write_sample(tmp_path / "sample.dbf", 20, deleted_every=3)
+    with DBFReader(dbf_path, encoding="cp1252") as reader:
+        everything = list(reader)
+        records = [reader.decode_record(record) for record in reader.iter_records(6, 12)]
+    # Every third record is deleted: 0-5 hold four active records, 6-11 the next four
+    assert records == everything[4:8]
+
+
+def test_memo_fields_fall_back_to_dbfread(tmp_path: Path, convert: Callable[..., bytes]) -> None:
+    fields = [Field("ID", "N", 4), Field("NOTES", "M", 10)]
+    notes = "A memo longer than one block. " * 30
+    dbf_path = write_dbf(tmp_path / "memo.dbf", fields, [["1", notes], ["2", "short"]])
+    with pytest.raises(UnsupportedDBFError):
+        DBFReader(dbf_path)
+    assert dbfread_rows(dbf_path) == [(1, notes), (2, "short")]
+
+    sql = convert(dbf_path)
+    assert sql == convert(dbf_path, reader="dbfread")
+    assert notes.encode() in sql
+    converter = DBFToSQLConverter(reader="native")
+    assert not converter.convert_dbf_to_sql(dbf_path, str(tmp_path / "memo.sql"))
@@ -0,0 +1,148 @@
+"""
+Tests of sharded output (--max-output-size, --rows-per-file).
+"""
+
+import gzip
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.cli import parse_size
+
+INSERT = re.compile(r"^INSERT INTO .*?;$", re.MULTILINE | re.DOTALL)
+
+
+def convert_sharded(dbf_path: str, output_dir: Path, **options: Any) -> Dict[str, Any]:
+    """Convert into output_dir and return the manifest."""
+    options.setdefault("encoding", "cp1252")
+    converter = DBFToSQLConverter(**options)
+    assert converter.convert_dbf_to_sql(dbf_path, output_dir=str(output_dir))
+    stem = Path(dbf_path).stem
+    return json.loads((output_dir / f"{stem}.manifest.json").read_text(encoding="utf-8"))
+
+
+def statements(sql: str) -> List[str]:
+    return INSERT.findall(sql)
+
+
+def test_rows_per_file_manifest(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_path = make_dbf(2500, deleted_every=5)
+    manifest = convert_sharded(dbf_path, tmp_path / "out", batch_size=100, rows_per_file=450)
+
+    shards = manifest["shards"]
+    assert manifest["table"] == "data0"
+    assert manifest["total_rows"] == 2000
+    assert shards[0] == {
+        "file": "data0.0000.sql",
+        "rows": 0,
+        "bytes": (tmp_path / "out" / "data0.0000.sql").stat().st_size,
+    }
+    # 450 rows round down to whole batches of 100
+    assert [shard["rows"] for shard in shards[1:]] == [400] * 5
+
+    shard_sql = ""
+    for index, shard in enumerate(shards):
+        path = tmp_path / "out" / shard["file"]
+        assert shard["file"] == f"data0.{index:04d}.sql"
+        assert shard["bytes"] == path.stat().st_size
+        text = path.read_text(encoding="utf-8")
+        if index:
+            assert len(statements(text)) == 4
+            assert text.endswith(f"-- Shard completed: {shard['rows']} records\n")
+        else:
+            assert "CREATE TABLE" in text and "INSERT INTO" not in text
+        shard_sql += text
+
+    expected = convert(dbf_path, batch_size=100).decode("utf-8")
+    assert statements(shard_sql) == statements(expected)
+
+
+@pytest.mark.parametrize("pipeline_workers", [0, 2])
+def test_max_output_size_limits_shards(
+    make_dbf: Callable[..., str],
+    convert: Callable[..., bytes],
+    tmp_path: Path,
+    pipeline_workers: int,
+) -> None:
+    dbf_path = make_dbf(3000, deleted_every=7)
+    limit = 64 * 1024
+    manifest = convert_sharded(
+        dbf_path,
+        tmp_path / "out",
+        batch_size=50,
+        max_output_size=limit,
+        pipeline_workers=pipeline_workers,
+    )
+
+    data_shards = manifest["shards"][1:]
+    assert len(data_shards) > 3
+    assert all(shard["bytes"] <= limit for shard in data_shards)
+    assert sum(shard["rows"] for shard in data_shards) == manifest["total_rows"]
+
+    shard_sql = "".join(
+        (tmp_path / "out" / shard["file"]).read_text(encoding="utf-8")
+        for shard in manifest["shards"]
+    )
+    expected = convert(dbf_path, batch_size=50).decode("utf-8")
+    assert statements(shard_sql) == statements(expected)
+    assert manifest["total_rows"] == len(re.findall(r"^    \(", expected, re.MULTILINE))
+
+
+def test_oversized_batch_gets_own_shard(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    manifest = convert_sharded(make_dbf(300), tmp_path / "out", batch_size=100, max_output_size=1)
+    assert [shard["rows"] for shard in manifest["shards"]] == [0, 100, 100, 100]
+
+
+def test_postgresql_bulk_header_per_shard(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    manifest = convert_sharded(
+        make_dbf(1000),
+        tmp_path / "out",
+        batch_size=100,
+        rows_per_file=300,
+        dialect="postgresql",
+        output_format="bulk",
+        compress="gzip",
+    )
+
+    assert manifest["shards"][1]["file"] == "data0.0001.sql.gz"
+    assert [shard["rows"] for shard in manifest["shards"][1:]] == [300, 300, 300, 100]
+    for shard in manifest["shards"][1:]:
+        text = gzip.decompress((tmp_path / "out" / shard["file"]).read_bytes()).decode("utf-8")
+        assert text.count('COPY "data0" (') == 1
+        data = text.split("FROM stdin;\n", 1)[1].split("\\.\n", 1)[0]
+        assert data.count("\n") == shard["rows"]
+        assert text.endswith(f"\\.\n\n-- Shard completed: {shard['rows']} records\n")
+
+
+def test_mysql_bulk_writes_data_file_per_shard(
+    make_dbf: Callable[..., str], tmp_path: Path
+) -> None:
+    manifest = convert_sharded(
+        make_dbf(500),
+        tmp_path / "out",
+        batch_size=100,
+        rows_per_file=200,
+        dialect="mysql",
+        output_format="bulk",
+    )
+
+    for index, shard in enumerate(manifest["shards"][1:], start=1):
+        assert shard["data_file"] == f"data0.{index:04d}.tsv"
+        sql = (tmp_path / "out" / shard["file"]).read_text(encoding="utf-8")
+        assert f"LOAD DATA LOCAL INFILE '{shard['data_file']}'" in sql
+        rows = (tmp_path / "out" / shard["data_file"]).read_text(encoding="utf-8")
+        assert rows.count("\n") == shard["rows"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1048576", 1 << 20), ("500K", 500 * 1024), ("2G", 2 << 30), ("1.5mb", 3 << 19)],
+)
+def test_parse_size(value: str, expected: int) -> None:
+    assert parse_size(value) == expected
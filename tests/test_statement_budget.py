@@ -0,0 +1,89 @@
+"""
+Tests of byte-budgeted INSERT batching (--max-statement-bytes).
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from .dbfdata import Field, Value, write_dbf
+
+BUDGET = 2000
+
+FIELDS = [Field("ID", "N", 6), Field("NAME", "C", 120), Field("NOTE", "C", 2600)]
+
+STATEMENT = re.compile(r"INSERT INTO [^\n]*\n(?:    [^\n]*\n)+")
+
+
+@pytest.fixture
+def wide_dbf(tmp_path: Path) -> str:
+    records: List[List[Value]] = []
+    for index in range(200):
+        name = ("Zoë ソフト " * 8)[: 10 + index % 30]
+        note = "é" * (index % 40) + "'quoted'"
+        if index == 77:
+            # Encodes to 2400 bytes, more than the whole budget
+            note = "é" * 1200
+        records.append([str(index), name, note])
+    return write_dbf(tmp_path / "wide.dbf", FIELDS, records, encoding="utf-8")
+
+
+def statements(sql: bytes) -> List[str]:
+    return STATEMENT.findall(sql.decode("utf-8"))
+
+
+def tuples(statement: str) -> List[str]:
+    return [line[4:].rstrip(",;") for line in statement.splitlines()[1:]]
+
+
+@pytest.mark.parametrize("batch_size", [1000, 7])
+def test_statements_fit_the_budget(
+    wide_dbf: str, convert: Callable[..., bytes], batch_size: int
+) -> None:
+    unbudgeted = statements(convert(wide_dbf, encoding="utf-8", batch_size=batch_size))
+    budgeted = statements(
+        convert(wide_dbf, encoding="utf-8", batch_size=batch_size, max_statement_bytes=BUDGET)
+    )
+    assert len(budgeted) > len(unbudgeted)
+
+    oversized = []
+    for statement in budgeted:
+        rows = tuples(statement)
+        assert len(rows) <= batch_size
+        if len(statement.encode("utf-8")) > BUDGET:
+            oversized.append(rows)
+    # The one row larger than the budget is emitted on its own
+    assert oversized == [[row for row in tuples("".join(unbudgeted)) if "éééé" * 300 in row]]
+    assert len(oversized[0][0].encode("utf-8")) > BUDGET
+
+    # No rows are lost or reordered
+    expected_rows = [row for statement in unbudgeted for row in tuples(statement)]
+    assert [row for statement in budgeted for row in tuples(statement)] == expected_rows
+    assert len(expected_rows) == 200
+
+
+def test_statements_fill_the_budget(wide_dbf: str, convert: Callable[..., bytes]) -> None:
+    budgeted = statements(convert(wide_dbf, encoding="utf-8", max_statement_bytes=BUDGET))
+    sizes = [len(statement.encode("utf-8")) for statement in budgeted]
+    for statement, following in zip(budgeted, budgeted[1:]):
+        # Each statement was closed only because the next row did not fit
+        next_row = tuples(following)[0]
+        assert len(statement.encode("utf-8")) + len(next_row.encode("utf-8")) + 6 > BUDGET
+    assert max(sizes) > BUDGET // 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"pipeline_workers": 2}, {"jobs": 2}, {"engine": "numpy"}, {"reader": "dbfread"}],
+    ids=lambda options: ",".join(options),
+)
+def test_budget_paths_agree(
+    wide_dbf: str, convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    expected = convert(wide_dbf, encoding="utf-8", batch_size=50, max_statement_bytes=BUDGET)
+    sql = convert(wide_dbf, encoding="utf-8", batch_size=50, max_statement_bytes=BUDGET, **options)
+    assert sql == expected
@@ -0,0 +1,141 @@
+"""
+Tests of conversion statistics and --stats-json.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.cli import main
+from dbf2sql.stats import STAGES, ConversionStats
+
+STATS_KEYS = {
+    "records",
+    "batches",
+    "input_bytes",
+    "output_bytes",
+    "peak_batch_bytes",
+    "peak_memory_bytes",
+    "wall_time",
+    "stage_times",
+    "rows_per_second",
+}
+
+
+def test_counters_and_total() -> None:
+    first = ConversionStats("a.dbf", "a.sql")
+    first.add_batch("x" * 40, 10)
+    first.add_batch("x" * 25, 5)
+    with first.stage("write"):
+        pass
+    first.wall_time = 3.0
+    assert (first.records, first.batches, first.peak_batch_bytes) == (15, 2, 40)
+    assert first.times["write"] > 0 and first.rows_per_second == 5.0
+
+    second = ConversionStats("b.dbf")
+    second.add_batch("x" * 60, 7)
+    second.input_bytes, second.output_bytes = 100, 200
+
+    total = ConversionStats.total([first, second])
+    assert (total.files, total.records, total.batches) == (2, 22, 3)
+    assert (total.input_bytes, total.output_bytes, total.peak_batch_bytes) == (100, 200, 60)
+    assert total.wall_time == 3.0
+    assert total.source is None and total.output is None
+
+
+def test_dict_round_trip() -> None:
+    stats = ConversionStats("a.dbf", "a.sql")
+    stats.add_batch("x" * 40, 10)
+    stats.times["format"] = 0.5
+    stats.wall_time = 2.0
+
+    data = stats.as_dict()
+    assert set(data) == STATS_KEYS | {"source", "output"}
+    assert set(data["stage_times"]) == set(STAGES)
+    assert data["rows_per_second"] == 5.0
+    assert ConversionStats.from_dict(data).as_dict() == data
+    assert ConversionStats.from_dict(json.loads(json.dumps(data))).as_dict() == data
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"pipeline_workers": 2}, {"jobs": 2}, {"engine": "numpy"}],
+    ids=["default", "pipeline", "jobs", "numpy"],
+)
+def test_conversion_statistics(
+    make_dbf: Callable[..., str], tmp_path: Path, options: Dict[str, Any]
+) -> None:
+    if options.get("engine") == "numpy":
+        pytest.importorskip("numpy")
+    dbf_path = make_dbf(1050)
+    sql_path = tmp_path / "out.sql"
+    converter = DBFToSQLConverter(encoding="cp1252", batch_size=100, **options)
+    assert converter.convert_dbf_to_sql(dbf_path, str(sql_path))
+
+    stats = converter.stats
+    assert (stats.source, stats.output) == (dbf_path, str(sql_path))
+    assert (stats.records, stats.batches) == (1050, 11)
+    assert stats.input_bytes == Path(dbf_path).stat().st_size
+    assert stats.output_bytes == sql_path.stat().st_size
+    assert stats.wall_time > 0 and stats.times["open"] > 0
+    if "jobs" not in options:
+        assert 0 < stats.peak_batch_bytes < stats.output_bytes
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_file_statistics(make_dbf: Callable[..., str], tmp_path: Path, workers: int) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (300, 700)]
+    missing = str(tmp_path / "missing.dbf")
+    converter = DBFToSQLConverter(encoding="cp1252", workers=workers)
+
+    results = converter.convert_multiple_files(dbf_files + [missing], str(tmp_path / "out"))
+
+    assert list(results.values()) == [True, True, False]
+    assert list(converter.file_stats) == dbf_files
+    assert [stats.records for stats in converter.file_stats.values()] == [300, 700]
+    total = converter.total_stats()
+    assert (total.files, total.records) == (2, 1000)
+    assert total.output_bytes == sum(
+        path.stat().st_size for path in (tmp_path / "out").glob("*.sql")
+    )
+
+
+def run_main(monkeypatch: pytest.MonkeyPatch, *args: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["dbf2sql", *args])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    return int(exit_info.value.code or 0)
+
+
+def test_stats_json(
+    make_dbf: Callable[..., str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (300, 700)]
+    stats_path = tmp_path / "stats.json"
+
+    args = ["--encoding", "cp1252", "--output-dir", str(tmp_path / "out")]
+    assert run_main(monkeypatch, *args, "--stats-json", str(stats_path), *dbf_files) == 0
+
+    stats = json.loads(stats_path.read_text(encoding="utf-8"))
+    assert set(stats) == {"files", "total"}
+    assert list(stats["files"]) == dbf_files
+    for dbf_file, rows in zip(dbf_files, (300, 700)):
+        file_stats = stats["files"][dbf_file]
+        assert set(file_stats) == STATS_KEYS | {"source", "output"}
+        assert file_stats["source"] == dbf_file and file_stats["records"] == rows
+        assert Path(file_stats["output"]).stat().st_size == file_stats["output_bytes"]
+        assert set(file_stats["stage_times"]) == set(STAGES)
+    assert set(stats["total"]) == STATS_KEYS | {"files"}
+    assert (stats["total"]["files"], stats["total"]["records"]) == (2, 1000)
+
+
+def test_stats_json_rejects_database(
+    make_dbf: Callable[..., str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    args = ["--stats-json", str(tmp_path / "stats.json"), "--database", str(tmp_path / "db")]
+    assert run_main(monkeypatch, *args, make_dbf(10)) == 2
+    assert not (tmp_path / "stats.json").exists()
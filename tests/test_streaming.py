@@ -0,0 +1,97 @@
+"""
+Tests of the streaming API (iter_sql, write_sql) and of -o - on the command line.
+"""
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+import dbf2sql
+from dbf2sql import DBFToSQLConverter
+
+CASES: Dict[str, Dict[str, Any]] = {
+    "default": {},
+    "pipeline": {"pipeline_workers": 2},
+    "numpy": {"engine": "numpy"},
+    "postgresql-bulk": {"dialect": "postgresql", "output_format": "bulk"},
+    "sqlite-bulk": {"dialect": "sqlite", "output_format": "bulk"},
+}
+
+
+@pytest.mark.parametrize("options", list(CASES.values()), ids=list(CASES))
+def test_iter_sql_matches_file(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    dbf_path = make_dbf(1200, deleted_every=5)
+    expected = convert(dbf_path, batch_size=100, **options).decode("utf-8")
+
+    converter = DBFToSQLConverter(encoding="cp1252", batch_size=100, **options)
+    chunks = list(converter.iter_sql(dbf_path))
+    assert "".join(chunks) == expected
+    # Header and DDL, one chunk per batch, and the closing comment
+    assert len(chunks) == 12
+
+
+@pytest.mark.parametrize("options", list(CASES.values()), ids=list(CASES))
+def test_write_sql_matches_file(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], options: Dict[str, Any]
+) -> None:
+    dbf_path = make_dbf(1200, deleted_every=5)
+    expected = convert(dbf_path, batch_size=100, **options).decode("utf-8")
+
+    converter = DBFToSQLConverter(encoding="cp1252", batch_size=100, **options)
+    buffer = io.StringIO()
+    assert converter.write_sql(dbf_path, buffer) == 960
+    assert buffer.getvalue() == expected
+
+
+def test_iter_sql_table_name(make_dbf: Callable[..., str]) -> None:
+    converter = DBFToSQLConverter(encoding="cp1252")
+    sql = "".join(converter.iter_sql(make_dbf(10), table_name="items"))
+    assert "CREATE TABLE `items` (" in sql and "INSERT INTO `items` (" in sql
+
+
+def test_load_data_cannot_be_streamed(make_dbf: Callable[..., str]) -> None:
+    converter = DBFToSQLConverter(encoding="cp1252", dialect="mysql", output_format="bulk")
+    dbf_path = make_dbf(10)
+    with pytest.raises(ValueError, match="cannot be streamed"):
+        next(converter.iter_sql(dbf_path))
+    with pytest.raises(ValueError, match="cannot be streamed"):
+        converter.write_sql(dbf_path, io.StringIO())
+
+
+def run_cli(*args: str) -> "subprocess.CompletedProcess[bytes]":
+    source_dir = str(Path(dbf2sql.__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_dir, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, "-m", "dbf2sql.cli", *args], capture_output=True, env=env, timeout=60
+    )
+
+
+def test_cli_writes_sql_to_stdout(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes]
+) -> None:
+    first, second = make_dbf(300, deleted_every=4), make_dbf(50, seed=1)
+
+    result = run_cli("--encoding", "cp1252", "--batch-size", "100", "-o", "-", first, second)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == convert(first, batch_size=100) + convert(second, batch_size=100)
+    assert b"Successful: 2" in result.stderr
+    # Nothing is written next to the DBF files
+    assert not list(Path(first).parent.glob("data*.sql"))
+
+
+def test_cli_stdout_reports_failed_files(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(10)
+    result = run_cli("--encoding", "cp1252", "-o", "-", dbf_path, str(tmp_path / "missing.dbf"))
+
+    assert result.returncode == 1
+    assert result.stdout.startswith(b"-- Generated from")
+    assert b"Failed: 1" in result.stderr
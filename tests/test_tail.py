@@ -0,0 +1,128 @@
+"""
+Tests of tail mode (converting only appended records into delta files).
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.cache import CACHE_FILE
+
+from .dbfdata import write_sample
+
+ROW = re.compile(r"^    (\(.*\))[,;]$", re.MULTILINE)
+
+
+def rows(sql: bytes) -> List[str]:
+    return ROW.findall(sql.decode("utf-8"))
+
+
+def tail(dbf_path: str, output_dir: Path, **options: Any) -> bool:
+    options.setdefault("encoding", "cp1252")
+    converter = DBFToSQLConverter(batch_size=100, tail=True, **options)
+    return converter.convert_multiple_files([dbf_path], str(output_dir))[dbf_path]
+
+
+def test_appended_records_go_to_delta_files(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_path = make_dbf(300, deleted_every=4)
+    out = tmp_path / "out"
+
+    assert tail(dbf_path, out)
+    assert (out / "data0.sql").read_bytes() == convert(dbf_path, batch_size=100)
+    cache = json.loads((out / CACHE_FILE).read_text(encoding="utf-8"))
+    assert [state["records"] for state in cache["tails"].values()] == [300]
+
+    write_sample(dbf_path, 450, deleted_every=4)
+    assert tail(dbf_path, out)
+    write_sample(dbf_path, 500, deleted_every=4)
+    assert tail(dbf_path, out)
+
+    assert sorted(path.name for path in out.glob("data0.*")) == [
+        "data0.delta-300.sql",
+        "data0.delta-450.sql",
+        "data0.sql",
+    ]
+    delta = (out / "data0.delta-300.sql").read_text(encoding="utf-8")
+    assert delta.startswith(f"-- Generated from {dbf_path}\n-- Appended records: 300 to 449\n")
+    assert "CREATE TABLE" not in delta and "DROP TABLE" not in delta
+
+    converted = [(out / name).read_bytes() for name in ("data0.sql", "data0.delta-300.sql")]
+    converted.append((out / "data0.delta-450.sql").read_bytes())
+    assert [row for sql in converted for row in rows(sql)] == rows(
+        convert(dbf_path, batch_size=100)
+    )
+
+
+def test_rerun_without_new_records(
+    make_dbf: Callable[..., str], tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    dbf_path = make_dbf(200)
+    out = tmp_path / "out"
+    assert tail(dbf_path, out)
+    before = (out / CACHE_FILE).read_bytes()
+
+    caplog.set_level("INFO", logger="dbf2sql")
+    assert tail(dbf_path, out)
+    assert f"No new records in {dbf_path}" in caplog.messages
+    assert sorted(path.name for path in out.iterdir()) == [CACHE_FILE, "data0.sql"]
+    assert (out / CACHE_FILE).read_bytes() == before
+
+
+@pytest.mark.parametrize("change", ["edited", "shrunk", "settings"])
+def test_rewritten_file_is_converted_again(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path, change: str
+) -> None:
+    dbf_path = make_dbf(300)
+    out = tmp_path / "out"
+    assert tail(dbf_path, out)
+    write_sample(dbf_path, 400)
+    assert tail(dbf_path, out)
+    assert (out / "data0.delta-300.sql").exists()
+
+    options = {}
+    if change == "edited":
+        write_sample(dbf_path, 450, seed=1)
+    elif change == "shrunk":
+        write_sample(dbf_path, 350)
+    else:
+        options = {"encoding": "latin-1"}
+    assert tail(dbf_path, out, **options)
+
+    assert sorted(path.name for path in out.glob("data0.*")) == ["data0.sql"]
+    expected = convert(dbf_path, batch_size=100, **options)
+    assert (out / "data0.sql").read_bytes() == expected
+
+
+def test_where_filter_on_appended_records(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], tmp_path: Path
+) -> None:
+    dbf_path = make_dbf(300)
+    out = tmp_path / "out"
+    where = "QTY > 0"
+    assert tail(dbf_path, out, where=where)
+    write_sample(dbf_path, 700)
+    assert tail(dbf_path, out, where=where)
+
+    converted = rows((out / "data0.sql").read_bytes())
+    converted += rows((out / "data0.delta-300.sql").read_bytes())
+    assert converted == rows(convert(dbf_path, batch_size=100, where=where))
+
+
+def test_tail_needs_a_cache_location(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_path = make_dbf(10)
+    converter = DBFToSQLConverter(encoding="cp1252", tail=True)
+    assert converter.convert_multiple_files([dbf_path]) == {dbf_path: False}
+    assert not (tmp_path / "data0.sql").exists()
+
+    converter = DBFToSQLConverter(
+        encoding="cp1252", tail=True, cache_file=str(tmp_path / "cache.json")
+    )
+    assert converter.convert_multiple_files([dbf_path]) == {dbf_path: True}
+    assert (tmp_path / "data0.sql").exists()
+    assert not (tmp_path / CACHE_FILE).exists()
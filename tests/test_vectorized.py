@@ -0,0 +1,56 @@
+"""
+Tests for the NumPy rendering engine.
+"""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from .dbfdata import SAMPLE_FIELDS, Field, Value, sample_records, write_dbf
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 100, 5000])
+def test_matches_python_engine(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes], batch_size: int
+) -> None:
+    dbf_path = make_dbf(3000, deleted_every=10)
+    expected = convert(dbf_path, batch_size=batch_size)
+    assert convert(dbf_path, batch_size=batch_size, engine="numpy") == expected
+
+
+def test_unusual_values_match_python_engine(tmp_path: Path, convert: Callable[..., bytes]) -> None:
+    fields = [Field("NUM", "N", 22, 2), Field("FLT", "F", 10), Field("DAY", "D", 8)]
+    records: List[List[Value]] = [
+        ["1,50", "1e3", "00000000"],
+        ["***", "-.5", "20240229"],
+        ["12345678901234567890", "  1 ", None],
+        ["-0", "inf", "19000101"],
+        ["  -12.5", "**", "00000000"],
+    ]
+    dbf_path = write_dbf(tmp_path / "odd.dbf", fields, records)
+    expected = convert(dbf_path)
+    assert convert(dbf_path, engine="numpy") == expected
+    assert b"(1.5, 1000.0, NULL)" in expected
+
+
+def test_record_selection_matches_python_engine(
+    tmp_path: Path, convert: Callable[..., bytes]
+) -> None:
+    flags = [b" ", b"*", b"X", b" ", b"\x1a", b" "]
+    dbf_path = write_dbf(
+        tmp_path / "flags.dbf", SAMPLE_FIELDS, sample_records(6), flags, header_count=2
+    )
+    expected = convert(dbf_path, batch_size=1)
+    assert convert(dbf_path, batch_size=1, engine="numpy") == expected
+    assert expected.count(b"INSERT INTO") == 2
+
+
+def test_numpy_engine_falls_back_without_native_reader(
+    make_dbf: Callable[..., str], convert: Callable[..., bytes]
+) -> None:
+    dbf_path = make_dbf(50)
+    expected = convert(dbf_path)
+    assert convert(dbf_path, engine="numpy", reader="dbfread") == expected
@@ -0,0 +1,42 @@
+"""
+Tests of multi-file conversion in a process pool (--workers).
+"""
+
+from pathlib import Path
+from typing import Callable
+
+from dbf2sql import DBFToSQLConverter
+from dbf2sql.reader import estimate_data_size
+
+from .dbfdata import SAMPLE_FIELDS, sample_records, write_dbf
+
+
+def test_workers_output_matches_sequential(make_dbf: Callable[..., str], tmp_path: Path) -> None:
+    dbf_files = [make_dbf(rows, seed=rows) for rows in (10, 2000, 0, 500)]
+    missing = str(tmp_path / "missing.dbf")
+    dbf_files.insert(2, missing)
+
+    outputs = {}
+    for workers in (1, 3):
+        output_dir = tmp_path / f"workers{workers}"
+        converter = DBFToSQLConverter(encoding="cp1252", workers=workers)
+        results = converter.convert_multiple_files(dbf_files, str(output_dir))
+        assert list(results) == dbf_files
+        assert [results[dbf_file] for dbf_file in dbf_files] == [True, True, False, True, True]
+        outputs[workers] = {path.name: path.read_bytes() for path in output_dir.glob("*.sql")}
+
+    assert len(outputs[1]) == 4
+    assert outputs[3] == outputs[1]
+
+
+def test_estimate_data_size(tmp_path: Path) -> None:
+    dbf_path = write_dbf(
+        tmp_path / "sample.dbf", SAMPLE_FIELDS, sample_records(10), header_count=40
+    )
+    assert estimate_data_size(dbf_path) == 40 * 76
+
+    short = tmp_path / "short.dbf"
+    short.write_bytes(b"\x03\x7c\x01")
+    assert estimate_data_size(str(short)) == 3
+
+    assert estimate_data_size(str(tmp_path / "missing.dbf")) == 0